@@ -0,0 +1,94 @@
+# benchmarks/bench_fast_forward.py
+"""
+Бенчмарк перемотки времени Body.fast_forward.
+
+Тела по умолчанию (женское и мужское) перематываются на --duration
+единиц времени с шагом dt из --dt (по умолчанию 1.0 и 0.1: при мелком
+шаге цикл длиннее в шагах и повторяется лишь с точностью до ulp).
+Пищеварительная группа такого тела не успокаивается: рот
+вырабатывает и глотает слюну, желудок возвращает излишек рефлюксом -
+она выходит на предельный цикл. Скрипт проверяет, что шагов сделано
+намного меньше, чем перемотано (stepped * --ratio <= steps), и что
+итоговое состояние группы совпадает с пошаговым прогоном (дискретные
+поля - точно, числа - с допуском --rel-tol). Если нет - код выхода 1,
+так что скрипт годится как проверка от регрессий в CI.
+
+Запуск: python -m benchmarks.bench_fast_forward [--duration T] [--dt DT ...] [--ratio R]
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from body_sim.body.factory import BodyFactory
+from body_sim.systems.fast_forward import keys_close
+
+FACTORIES = {
+    "female": BodyFactory.create_female,
+    "male": BodyFactory.create_male,
+}
+
+
+def _digestive_key(body: Any) -> tuple:
+    return tuple(organ.cycle_key() for organ in body._tick_groups()[-1])
+
+
+def run(kind: str, duration: float = 36000, dt: float = 1.0, seed: int = 0,
+        rel_tol: float = 1e-9) -> Dict[str, Any]:
+    """fast_forward(duration) против пошаговых тиков пищеварительной группы."""
+    random.seed(seed)
+    body = FACTORIES[kind]()
+    random.seed(seed)
+    reference = FACTORIES[kind]()
+
+    start = time.perf_counter()
+    result = body.fast_forward(duration, dt)
+    fast = time.perf_counter() - start
+
+    group = reference._tick_groups()[-1]
+    start = time.perf_counter()
+    for _ in range(result["steps"]):
+        for organ in group:
+            reference._tick_organ_stepped(organ, dt)
+    stepped = time.perf_counter() - start
+
+    return {
+        "kind": kind,
+        "dt": dt,
+        "result": result,
+        "seconds": fast,
+        "stepped_seconds": stepped,
+        "matches": keys_close(_digestive_key(body), _digestive_key(reference), rel_tol),
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Body.fast_forward on default bodies")
+    parser.add_argument("--duration", type=float, default=36000)
+    parser.add_argument("--dt", type=float, nargs="+", default=[1.0, 0.1])
+    parser.add_argument("--ratio", type=float, default=10.0,
+                        help="fail unless steps >= stepped * ratio")
+    parser.add_argument("--rel-tol", type=float, default=1e-9,
+                        help="tolerance for floats when comparing with stepping")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'body':<8} {'dt':>5} {'steps':>7} {'stepped':>8} {'fast s':>8} {'step s':>8}  state")
+    for dt in args.dt:
+        for kind in FACTORIES:
+            row = run(kind, args.duration, dt, rel_tol=args.rel_tol)
+            result = row["result"]
+            print(f"{kind:<8} {dt:>5} {result['steps']:>7} {result['stepped']:>8} "
+                  f"{row['seconds']:>8.2f} {row['stepped_seconds']:>8.2f}  "
+                  f"{'ok' if row['matches'] else 'MISMATCH'}")
+            if result["stepped"] * args.ratio > result["steps"]:
+                print(f"    stepped {result['stepped']} of {result['steps']}: ratio below {args.ratio}")
+                failed = True
+            failed = failed or not row["matches"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# benchmarks/bench_import.py
+"""
+Бенчмарк времени импорта ядра симуляции.
+
+Каждый модуль импортируется в отдельном процессе под python -X importtime:
+меряется накопленное время импорта и проверяется, что ядро (core, anatomy,
+body, systems, world, reactions) не тянет rich и UI - пакетные воркеры
+не должны платить за рендер. Если тянет, печатается цепочка
+"кто импортировал" и код выхода 1, так что скрипт годится как проверка
+от регрессий в CI.
+
+Запуск: python -m benchmarks.bench_import [--repeat N] [--budget MS]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+HEADLESS = (
+    "body_sim",
+    "body_sim.core",
+    "body_sim.anatomy",
+    "body_sim.body",
+    "body_sim.systems",
+    "body_sim.world",
+    "body_sim.reactions",
+)
+
+# Пакеты рендера, которых не должно быть в sys.modules после импорта ядра
+FORBIDDEN = ("rich", "body_sim.ui")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _is_forbidden(name: str) -> bool:
+    return any(name == p or name.startswith(p + ".") for p in FORBIDDEN)
+
+
+def import_profile(module: str) -> Dict[str, object]:
+    """Один холодный импорт модуля: время (мс) и запрещённые импорты с импортёрами."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    rows: List[Tuple[int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+
+    cumulative = 0
+    own = 0
+    offenders: List[Tuple[str, str, int]] = []
+    # importtime печатает модуль после всех его зависимостей: импортёр -
+    # ближайшая следующая строка с меньшим отступом
+    for i, (cum, indent, name) in enumerate(rows):
+        if indent == 1:
+            # Верхний уровень: сам модуль и родительские пакеты
+            cumulative += cum
+        if name.startswith("body_sim"):
+            own += 1
+        if not _is_forbidden(name):
+            continue
+        for _, parent_indent, parent in rows[i + 1:]:
+            if parent_indent < indent:
+                if not _is_forbidden(parent):
+                    offenders.append((name, parent, cum))
+                break
+
+    return {"module": module, "ms": cumulative / 1000.0, "body_sim_modules": own,
+            "offenders": offenders}
+
+
+def run(modules=HEADLESS, repeat: int = 3) -> List[Dict[str, object]]:
+    """Лучшее из repeat холодных импортов для каждого модуля."""
+    results = []
+    for module in modules:
+        runs = [import_profile(module) for _ in range(repeat)]
+        best = min(runs, key=lambda r: r["ms"])
+        results.append(best)
+    return results
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import time of the headless core")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=None,
+                        help="fail if 'import body_sim' takes longer (ms)")
+    args = parser.parse_args(argv)
+
+    results = run(repeat=args.repeat)
+    failed = False
+    print(f"{'module':<22} {'ms':>8} {'modules':>8}  render deps")
+    for result in results:
+        offenders = result["offenders"]
+        print(f"{result['module']:<22} {result['ms']:>8.1f} {result['body_sim_modules']:>8}  "
+              f"{'-' if not offenders else len(offenders)}")
+        for name, parent, cum in offenders:
+            print(f"    {name} <- {parent} ({cum / 1000.0:.1f} ms)")
+        failed = failed or bool(offenders)
+
+    top = results[0]
+    if args.budget is not None and top["ms"] > args.budget:
+        print(f"import {top['module']}: {top['ms']:.1f} ms > budget {args.budget:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# benchmarks/bench_rheology.py
+"""
+Бенчмарк кеша реологии FluidMixture.
+
+Гоняет 10k тиков тела с лактацией и заполненной маткой и считает, сколько
+запросов viscosity()/density() было обслужено из кеша вместо пересчёта.
+Перед замером проверяет dict-совместимость FluidMixture.components там,
+где она расходится со словарём (обнулённый слот - отсутствующий ключ);
+при ошибке код выхода 1.
+
+Запуск: python -m benchmarks.bench_rheology [ticks]
+"""
+
+import sys
+import time
+
+from body_sim.body.body import FemaleBody
+from body_sim.core.enums import FluidType
+from body_sim.core.fluids import FluidMixture
+from body_sim.systems.fluid_container import FluidContainer
+
+
+def check_components() -> list:
+    """Сценарии, ломавшиеся на представлении components; список ошибок."""
+    errors = []
+    container = FluidContainer()
+    container.add_fluid(FluidType.MILK, 10.0)
+    try:
+        removed = container.remove_fluid(10.0, FluidType.MILK)
+    except KeyError as e:
+        errors.append(f"remove_fluid(all milk) raised KeyError({e})")
+    else:
+        if removed != 10.0 or container.filled != 0.0:
+            errors.append(f"remove_fluid(all milk) removed {removed}, left {container.filled}")
+    return errors
+
+
+def run(ticks: int = 10_000, dt: float = 0.1) -> dict:
+    counters = {"reads": 0, "recomputes": 0}
+
+    original_blend = FluidMixture._blend
+    original_compute = FluidMixture._compute_rheology
+
+    def counting_blend(self, defs):
+        counters["reads"] += 1
+        return original_blend(self, defs)
+
+    def counting_compute(self, defs):
+        counters["recomputes"] += 1
+        return original_compute(self, defs)
+
+    body = FemaleBody(name="bench")
+    for breast in body.breast_grid.all():
+        breast.lactation.start()
+    body.breast_grid.add_to_all(FluidType.MILK, 300.0)
+    if body.uterus_system and body.uterus_system.primary:
+        body.uterus_system.primary.add_fluid(FluidType.CUM, 200.0)
+
+    FluidMixture._blend = counting_blend
+    FluidMixture._compute_rheology = counting_compute
+    try:
+        start = time.perf_counter()
+        for _ in range(ticks):
+            body.tick(dt)
+        elapsed = time.perf_counter() - start
+    finally:
+        FluidMixture._blend = original_blend
+        FluidMixture._compute_rheology = original_compute
+
+    avoided = counters["reads"] - counters["recomputes"]
+    return {
+        "ticks": ticks,
+        "reads": counters["reads"],
+        "recomputes": counters["recomputes"],
+        "avoided": avoided,
+        "hit_rate": avoided / counters["reads"] if counters["reads"] else 0.0,
+        "seconds": elapsed,
+    }
+
+
+def main() -> int:
+    errors = check_components()
+    for error in errors:
+        print(f"check failed: {error}")
+    if errors:
+        return 1
+
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    result = run(ticks)
+    print(f"ticks:       {result['ticks']}")
+    print(f"reads:       {result['reads']}")
+    print(f"recomputes:  {result['recomputes']}")
+    print(f"avoided:     {result['avoided']} ({result['hit_rate']:.1%})")
+    print(f"wall time:   {result['seconds']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,12 +28,20 @@ body_sim/
 │   ├── grid.py              # BreastGrid
 │   ├── events.py            # EventBus
 │   └── pressure.py          # Работа с давлением
+├── world/                   # Headless-мир
+│   ├── __init__.py
+│   ├── world.py             # World: фиксированный шаг, тайминги фаз
+│   └── parallel.py          # ShardedWorld: шарды тел по процессам
 └── ui/                      # Интерфейс пользователя
     ├── __init__.py
     ├── console.py           # Главная консоль
     ├── commands.py          # Регистрация команд
     ├── render.py            # Базовый рендер
     └── rich_render.py       # Rich-рендеринг
+
+Зависимости (pip install ...):
+    rich                     # ui/ и консоль python -m body_sim; ядро без неё
+    numpy                    # необязательная: SoA-движок BreastGrid (systems/grid_soa.py)
 """
 
 """
@@ -70,6 +78,8 @@ from body_sim.body.factory import BodyFactory
 from body_sim.systems.grid import BreastGrid
 from body_sim.systems.events import EventBus, EventType, Event
 
+from body_sim.world import World
+
 __all__ = [
     # Версия
     "__version__",
@@ -95,4 +105,7 @@ __all__ = [
     
     # Systems
     "BreastGrid", "EventBus", "EventType", "Event",
+
+    # World
+    "World",
 ]
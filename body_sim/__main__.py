@@ -4,7 +4,7 @@
 """
 
 import sys
-from body_sim.ui.console import run_console
+from body_sim.ui.console import run_console, run_live_console
 from body_sim.body.factory import BodyFactory
 from body_sim.systems.events import EventfulBody
 from body_sim.characters.roxy_migurdia import RoxyMigurdia
@@ -58,6 +58,12 @@ def main():
     parser = argparse.ArgumentParser(description="Breast & Body Simulation")
     parser.add_argument("--demo", "-d", action="store_true", help="Run demo")
     parser.add_argument("--create", "-c", choices=['male', 'female', 'futa'])
+    parser.add_argument("--journal", "-j", metavar="FILE",
+                        help="Write events to a binary journal (replay: python -m body_sim.systems.journal FILE)")
+    parser.add_argument("--live", "-l", action="store_true",
+                        help="Live mode: simulation runs in background, screen refreshes at capped FPS")
+    parser.add_argument("--fps", type=float, default=10.0, help="Live mode frame rate cap")
+    parser.add_argument("--tps", type=float, default=10.0, help="Live mode ticks per second (0 - unlimited)")
     
     args = parser.parse_args()
     
@@ -68,11 +74,26 @@ def main():
     
     print(f"Created {len(bodies)} bodies")
     
-    if args.demo:
-        from body_sim.ui.demo import run_demo
-        run_demo(bodies)
+    journal = None
+    if args.journal:
+        from body_sim.systems.journal import EventJournal
+        journal = EventJournal(args.journal)
+        for body in bodies:
+            if isinstance(body, EventfulBody):
+                journal.attach(body.event_bus)
     
-    run_console(bodies)
+    try:
+        if args.demo:
+            from body_sim.ui.demo import run_demo
+            run_demo(bodies)
+        
+        if args.live:
+            run_live_console(bodies, max_fps=args.fps, ticks_per_second=args.tps)
+        else:
+            run_console(bodies)
+    finally:
+        if journal is not None:
+            journal.close()
 
 if __name__ == "__main__":
     main()
@@ -9,6 +9,8 @@ from enum import Enum, auto
 
 from body_sim.core.enums import AnusType, FluidType, AnalSphincterState
 from body_sim.core.fluids import FluidMixture
+from body_sim.systems.dormancy import Dormant, wake_on
+from body_sim.systems.signals import Emitter
 
 
 
@@ -33,8 +35,10 @@ class AnalCanal:
         return True
 
 
+@wake_on("relax", "contract", "stretch", "close", "prolapse", "reposition",
+         "insert_object", "advance_object", "retract_object", "remove_object", "add_fluid")
 @dataclass
-class Anus:
+class Anus(Emitter, Dormant):
     """
     Анус с полной системой пенетрации.
     Является входом в rectum который соединяется с желудком.
@@ -67,20 +71,10 @@ class Anus:
     fluid_content: float = 0.0
     mixture: FluidMixture = field(default_factory=FluidMixture)
     
-    # События
-    _listeners: Dict[str, List[Callable]] = field(default_factory=dict)
-    
     # Физиология
     pain_tolerance: float = 0.6      # Болевой порог
     pleasure_sensitivity: float = 0.8
     
-    def on(self, event: str, callback: Callable):
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data):
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-    
     @property
     def current_diameter(self) -> float:
         """Эффективный диаметр отверстия."""
@@ -324,8 +318,8 @@ class Anus:
     
     # ============ TICK ============
     
-    def tick(self, dt: float = 1.0) -> None:
-        """Обновление физиологии."""
+    def tick(self, dt: float = 1.0, slow: bool = True) -> None:
+        """Обновление физиологии (slow передаётся в rectum.tick)."""
         # Постепенное восстановление тонуса
         if not self.get_current_object() and not self.is_gaping:
             self.sphincter_tone = min(0.7, self.sphincter_tone + 0.01 * dt)
@@ -339,7 +333,21 @@ class Anus:
         
         # Обновление rectum
         if self.rectum_connection:
-            self.rectum_connection.tick(dt)
+            self.rectum_connection.tick(dt, slow)
+
+    def can_fast_forward(self) -> bool:
+        rectum = self.rectum_connection
+        return self.is_dormant and (rectum is None or rectum.can_fast_forward())
+
+    def fast_forward(self, duration: float, dt: float = 1.0) -> None:
+        """Анус в покое не меняется; прямая кишка перематывается, как её тикает tick."""
+        if self.rectum_connection:
+            self.rectum_connection.fast_forward(duration, dt)
+
+    def rest_key(self) -> Optional[tuple]:
+        rectum_key = self.rectum_connection.rest_key() if self.rectum_connection else None
+        return (self.sphincter_tone, self.sphincter_state, self.canal.stretch_ratio,
+                self.is_gaping, self.get_current_object() is None, rectum_key)
     
     def get_status(self) -> Dict[str, Any]:
         """Статус для UI."""
@@ -8,20 +8,24 @@ from typing import Dict, List, Callable, Any, Optional, TYPE_CHECKING
 import math
 
 from body_sim.anatomy.base import Genital
-from body_sim.core.enums import CupSize, BreastState, FluidType
+from body_sim.core.enums import CupSize, BreastState, FluidType, LactationState
 from body_sim.core.fluids import FluidMixture, BreastFluid, FLUID_DEFS
 from body_sim.core.constants import PRESSURE_LEAK_MIN, MAX_SAG
 from body_sim.anatomy.nipple import Areola
 from body_sim.systems.lactation import LactationSystem
 from body_sim.systems.inflation import InflationSystem
 from body_sim.systems.insertion import InsertionManager
-from body_sim.systems.pressure import PressureSystem, get_pressure_tier, apply_pressure_to_nipple
+from body_sim.systems.pressure import PressureSystem, get_pressure_tier, apply_pressure_to_nipple, close_nipple_steps
 from body_sim.systems.physics import calc_pressure, calc_sag_target
+from body_sim.systems.dormancy import wake_on
+from body_sim.systems.fast_forward import split_steps
+from body_sim.systems.integrator import Integrator, integrate_outflow
 
 if TYPE_CHECKING:
     pass
 
 
+@wake_on("add_fluid", "remove_fluid", "stimulate")
 @dataclass(kw_only=True)
 class Breast(Genital):
     cup: CupSize
@@ -46,6 +50,7 @@ class Breast(Genital):
     inflate_ratio_per_100ml: float = 0.05
     arousal: float = field(default=0.0, repr=False)
     sensitivity: float = field(default=1.0, repr=False)
+    leak_integrator: Integrator = field(default=Integrator.EXPLICIT, repr=False)
 
     def __post_init__(self):
         Genital.__init__(self)
@@ -57,13 +62,6 @@ class Breast(Genital):
         # sensitivity по умолчанию из Genital = 1.0, можно переопределить:
         self.sensitivity = 1.2  # Грудь чуть более чувствительна
 
-    def on(self, event: str, callback: Callable[..., Any]) -> None:
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data: Any) -> None:
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-
     @property
     def state(self) -> BreastState:
         return self._state
@@ -108,9 +106,11 @@ class Breast(Genital):
         return self.inflation.stretch_ratio < self.inflation.max_stretch
 
     def pressure(self, defs: Dict[FluidType, BreastFluid] = FLUID_DEFS) -> float:
-        viscosity = self.mixture.viscosity(defs)
+        return self._pressure_at(self.filled, self.mixture.viscosity(defs))
+    
+    def _pressure_at(self, filled: float, viscosity: float) -> float:
         return calc_pressure(
-            filled=self.filled,
+            filled=filled,
             volume=self._base_volume,
             viscosity=viscosity,
             elasticity=self._elasticity,
@@ -279,6 +279,46 @@ class Breast(Genital):
         avail = self._max_volume - self.filled
         return max(0.0, avail)
 
+    def rest_key(self) -> Optional[tuple]:
+        inflation, lactation = self.inflation, self.lactation
+        return (self.mixture.total(), self._sag, self._elasticity, self._base_volume, self._max_volume,
+                self._state, self._last_dynamic_cup, self._pressure_system._last_tier,
+                inflation.stretch_ratio, inflation.peak_stretch, inflation.is_permanently_stretched,
+                self.areola._current_diameter, len(self.insertion_manager.inserted_objects),
+                lactation.state, lactation.hormone_level, lactation.base_rate_per_100ml,
+                lactation.consecutive_stimulation, lactation._stimulated,
+                tuple((n.gape_diameter, n.current_width) for n in self.areola.nipples))
+
+    def _is_empty_at_rest(self) -> bool:
+        """
+        Пустая грудь без лактации и предметов: тик сводится к спаду
+        провисания, закрытию сосков и восстановлению растяжения.
+        """
+        return (self.filled <= 0 and self._state == BreastState.EMPTY
+                and self.lactation.state == LactationState.OFF
+                and not self.insertion_manager.inserted_objects
+                and self._pressure_system._last_tier == self._pressure_system.get_tier_name(0.0)
+                and self._last_dynamic_cup == self.dynamic_cup)
+
+    def can_fast_forward(self) -> bool:
+        return self.is_dormant or self._is_empty_at_rest()
+
+    def fast_forward(self, duration: float, dt: float = 1.0,
+                     defs: Dict[FluidType, BreastFluid] = FLUID_DEFS) -> None:
+        """tick(defs, dt) за duration в закрытой форме (только при can_fast_forward)."""
+        if self.is_dormant:
+            return
+        if not self._is_empty_at_rest():
+            raise ValueError("fast_forward needs an empty breast without lactation or objects")
+        steps, rest = split_steps(duration, dt)
+        self._sag = max(0.0, self._sag - 0.1 * dt * steps)
+        for nipple in self.areola.nipples:
+            close_nipple_steps(nipple, steps, dt)
+        # Эластичность и диаметр ареолы задаёт растяжение (_update_breast_dimensions)
+        self.inflation.fast_forward(self, steps * dt, dt)
+        if rest:
+            self.tick(defs, rest)
+
     def tick(self, defs: Dict[FluidType, BreastFluid] = FLUID_DEFS, dt: float = 1.0) -> Dict[str, Any]:
         if dt <= 0:
             raise ValueError(f"dt must be positive, got {dt}")
@@ -324,14 +364,15 @@ class Breast(Genital):
         leaked = 0.0
         if self._state == BreastState.LEAKING and self.filled > 0:
             viscosity = self.mixture.viscosity(defs)
-            leak_rate = self._calc_leak_rate(pressure, viscosity)
+            modifier = self.insertion_manager.pressure_modifier
             
-            # ОГРАНИЧЕНИЕ: максимум 50% объема за тик (вне зависимости от dt)
-            max_possible_leak = self.filled * 0.5 * dt
-            desired_leak = self.filled * leak_rate * dt
+            def flow(volume: float) -> float:
+                rate = self._calc_leak_rate(self._pressure_at(volume, viscosity) + modifier,
+                                            viscosity, volume)
+                # ОГРАНИЧЕНИЕ: максимум 50% объема в единицу времени
+                return min(volume * rate, volume * 0.5)
             
-            leaked = min(desired_leak, max_possible_leak, self.filled)
-            leaked = max(0.0, leaked)  # Точно не отрицательное
+            leaked = integrate_outflow(self.filled, flow, dt, self.leak_integrator)
             
             if leaked > 0.0001:
                 self.mixture.remove(leaked)
@@ -352,7 +393,7 @@ class Breast(Genital):
         # Защита от ухода в минус после всех операций
         if self.filled < 0:
             # Это не должно произойти, но если произошло - сбрасываем
-            self.mixture._contents.clear()  # Очищаем смесь
+            self.mixture.drain()  # Очищаем смесь
             self._state = BreastState.EMPTY
 
         return {
@@ -365,9 +406,12 @@ class Breast(Genital):
             "elasticity": round(self._elasticity, 2),
         }
     
-    def _calc_leak_rate(self, pressure: float, viscosity: float) -> float:
+    def _calc_leak_rate(self, pressure: float, viscosity: float,
+                        filled: Optional[float] = None) -> float:
         """Расчет скорости утечки с защитой от слишком большого потока."""
-        if not self.has_leak_outlet() or self.filled <= 0:
+        if filled is None:
+            filled = self.filled
+        if not self.has_leak_outlet() or filled <= 0:
             return 0.0
         
         leakage_reduction = self.insertion_manager.total_leakage_reduction
@@ -403,7 +447,7 @@ class Breast(Genital):
             flow_rate = 0.8 * area * pressure_diff * flow_efficiency / max(viscosity, 0.1)
             
             # ОГРАНИЧЕНИЕ: не более 10% объема груди за тик через один сосок
-            max_flow_per_tick = self.filled * 0.1
+            max_flow_per_tick = filled * 0.1
             flow_rate = min(flow_rate, max_flow_per_tick)
             
             total_flow += max(0.0, flow_rate)
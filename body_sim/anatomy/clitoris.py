@@ -6,11 +6,13 @@ from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
 from body_sim.anatomy.base import Genital
+from body_sim.systems.dormancy import wake_on
 
 if TYPE_CHECKING:
     from .penis import Penis
 
 
+@wake_on("stimulate", "transform_to_penis", "revert_to_clitoris")
 @dataclass
 class Clitoris(Genital):
     base_length: float = 1.5
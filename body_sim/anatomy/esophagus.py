@@ -3,9 +3,10 @@ from typing import Optional, List, Dict, Any
 
 from body_sim.core.enums import FluidType
 from body_sim.core.fluids import FluidMixture
+from body_sim.systems.dormancy import Dormant, wake_on
 
 @dataclass
-class Esophagus:
+class Esophagus(Dormant):
     """Пищевод как соединительная труба между ртом и желудком."""
     length: float = 25.0         # см
     diameter: float = 2.5        # см
@@ -32,6 +33,12 @@ class Esophagus:
         if self.mouth_connection:
             self.mouth_connection.add_fluid(fluid_type, amount)
     
+    def rest_key(self) -> Optional[tuple]:
+        return (self.contents.total(),)
+
+    def cycle_key(self) -> Optional[tuple]:
+        return (tuple(self.contents._slots),)
+
     def tick(self, dt: float = 1.0):
         # Автоматическая передача в желудок
         if self.contents.total() > 0 and self.stomach_connection:
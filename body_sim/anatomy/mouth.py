@@ -17,6 +17,8 @@ import math
 from body_sim.core.enums import FluidType, LipState, MouthState, ThroatState
 from body_sim.core.fluids import FluidMixture, BreastFluid
 from body_sim.core.constants import PRESSURE_LEAK_MIN
+from body_sim.systems.dormancy import Dormant, DormancyStats, tick_organ, wake_on
+from body_sim.systems.signals import Emitter
 
 
 
@@ -153,8 +155,10 @@ class Throat:
             self.state = ThroatState.CLOSED
 
 
+@wake_on("add_fluid", "remove_fluid", "swallow", "insert_object", "advance_object",
+         "retract_object", "remove_object", "stretch_cheeks")
 @dataclass
-class Mouth:
+class Mouth(Emitter, Dormant):
     """
     Полость рта с системой пенетрации и жидкостей.
     """
@@ -188,21 +192,9 @@ class Mouth:
     gag_triggered: bool = False
     choking: bool = False
     
-    # События
-    _listeners: Dict[str, List[Callable]] = field(default_factory=dict)
-    
     def __post_init__(self):
         self.current_volume = self.base_volume
     
-    # ============ EVENTS ============
-    
-    def on(self, event: str, callback: Callable):
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data):
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-    
     # ============ PROPERTIES ============
     
     @property
@@ -431,6 +423,15 @@ class Mouth:
     
     # ============ TICK ============
     
+    def rest_key(self) -> Optional[tuple]:
+        lips, throat = self.lips, self.throat
+        return (self.mixture.total(), self.state, self.current_volume, self.inserted_object is None,
+                lips.stretch_ratio, lips.fatigue, lips.numbness, lips.state,
+                throat.constriction, throat.state)
+
+    def cycle_key(self) -> Optional[tuple]:
+        return (self.rest_key(), self.saliva_production, tuple(self.mixture._slots))
+    
     def tick(self, dt: float = 1.0) -> Dict[str, Any]:
         """Обновление."""
         # Слюноотделение
@@ -521,6 +522,6 @@ class MouthSystem:
     def primary(self) -> Optional[Mouth]:
         return self.mouths[0] if self.mouths else None
     
-    def tick(self, dt: float = 1.0):
+    def tick(self, dt: float = 1.0, stats: Optional[DormancyStats] = None):
         for mouth in self.mouths:
-            mouth.tick(dt)
+            tick_organ(mouth, dt, mouth.tick, dt, stats=stats)
@@ -7,6 +7,7 @@ from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 import math
 
 from .base import Genital
+from body_sim.systems.dormancy import wake_on
 from body_sim.core.enums import PenisType, PenisState, FluidType
 from body_sim.systems.penetration import InsertableObject
 
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
     from .scrotum import Scrotum
 
 
+@wake_on("stimulate", "erect", "flaccid", "update_arousal", "ejaculate",
+         "produce_cum_for_encounter", "transform_type")
 @dataclass
 class Penis(Genital):
     base_length: float = 15.0
@@ -17,6 +17,8 @@ import math
 
 from body_sim.core.enums import FluidType, RectumState, PenetrationDepthZone
 from body_sim.core.fluids import FluidMixture
+from body_sim.systems.dormancy import Dormant, DormancyStats, tick_organ, wake_on
+from body_sim.systems.signals import Emitter
 
 
 @dataclass
@@ -39,14 +41,23 @@ class RectalWall:
         self.fatigue = min(1.0, self.fatigue + (ratio - 1.0) * 0.05)
         return True
     
+    # Медленная подсистема: период обновления в шагах (systems.scheduler)
+    TICK_PERIOD = 4
+
     def recover(self, dt: float):
         self.fatigue = max(0.0, self.fatigue - 0.02 * dt)
         if self.stretch_ratio > 1.0 and not self.is_permanently_stretched:
             self.stretch_ratio = max(1.0, self.stretch_ratio - 0.005 * dt)
 
+    def fast_forward(self, duration: float, dt: float = 1.0):
+        """Спад линейный до порога - один recover(duration) точен."""
+        self.recover(duration)
+
 
+@wake_on("insert_object", "advance_object", "retract_object", "remove_object",
+         "receive_from_stomach", "add_fluid", "transfer_to_stomach")
 @dataclass
-class Rectum:
+class Rectum(Emitter, Dormant):
     """
     Прямая кишка соединяющая анус с желудком/кишечником.
     Аналогична FallopianTube но для нижнего отдела ЖКТ.
@@ -84,20 +95,10 @@ class Rectum:
     inserted_object: Optional[Any] = field(default=None, repr=False)
     penetration_depth: float = 0.0   # Глубина от ануса
     
-    # События
-    _listeners: Dict[str, List[Callable]] = field(default_factory=dict)
-    
     def __post_init__(self):
         self.current_length = self.base_length
         self.current_diameter = self.base_diameter
     
-    def on(self, event: str, callback: Callable):
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data):
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-    
     @property
     def total_length(self) -> float:
         """Общая длина с учетом растяжения."""
@@ -264,9 +265,25 @@ class Rectum:
         else:
             self.state = RectumState.NORMAL
     
-    def tick(self, dt: float = 1.0) -> Dict[str, Any]:
-        """Обновление."""
-        self.wall.recover(dt)
+    def rest_key(self) -> Optional[tuple]:
+        wall = self.wall
+        return (self.mixture.total(), self.state, self.inserted_object is None,
+                wall.fatigue, wall.stretch_ratio)
+
+    def cycle_key(self) -> Optional[tuple]:
+        return (self.rest_key(), tuple(self.mixture._slots))
+
+    def can_fast_forward(self) -> bool:
+        """Спит и пуста: передачи в желудок нет при любом растяжении стенки."""
+        return self.is_dormant and self.mixture.total() <= 0 and self.inserted_object is None
+
+    def fast_forward(self, duration: float, dt: float = 1.0) -> None:
+        self.wall.fast_forward(duration, dt)
+
+    def tick(self, dt: float = 1.0, slow: bool = True) -> Dict[str, Any]:
+        """Обновление (slow=False - без восстановления стенки)."""
+        if slow:
+            self.wall.recover(dt)
         
         # Автоматическая передача в желудок при заполнении
         if self.fill_ratio > 0.8 and self.stomach_connection:
@@ -343,6 +360,6 @@ class RectumSystem:
     def primary(self) -> Optional[Rectum]:
         return self.rectums[0] if self.rectums else None
     
-    def tick(self, dt: float = 1.0):
+    def tick(self, dt: float = 1.0, stats: Optional[DormancyStats] = None, slow: bool = True):
         for rectum in self.rectums:
-            rectum.tick(dt)
+            tick_organ(rectum, (dt, slow), rectum.tick, dt, slow, stats=stats)
@@ -5,10 +5,13 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from body_sim.core.enums import ScrotumType, TesticleSize, FluidType
 from .testicle import Testicle
+from body_sim.systems.dormancy import Dormant, wake_on
 
 
+@wake_on("drain_fluid", "add_testicle_fluid_production", "overheat_testicle",
+         "damage_testicle", "heal_testicle")
 @dataclass
-class Scrotum:
+class Scrotum(Dormant):
     scrotum_type: ScrotumType = field(default=ScrotumType.STANDARD)
     has_testicles: bool = True
     testicle_size: TesticleSize = TesticleSize.AVERAGE
@@ -107,10 +110,28 @@ class Scrotum:
         if testicle:
             testicle.heal(amount)
 
-    def tick(self, dt: float, arousal: float = 0.0) -> None:
+    def tick(self, dt: float, arousal: float = 0.0, slow: bool = True) -> None:
+        """slow=False - яички не обновляются (их ведёт MultiRateScheduler тела)."""
+        if slow:
+            self.tick_testicles(dt, arousal)
+        self.is_retracted = arousal > 0.95
+
+    def tick_testicles(self, dt: float, arousal: float = 0.0) -> None:
         for testicle in self.testicles:
             testicle.tick(dt, arousal)
+
+    def fast_forward(self, duration: float, dt: float = 1.0, arousal: float = 0.0) -> None:
+        """tick(dt, arousal) за duration (яички - в закрытой форме)."""
+        for testicle in self.testicles:
+            testicle.fast_forward(duration, dt, arousal)
         self.is_retracted = arousal > 0.95
+
+    def rest_key(self) -> Optional[tuple]:
+        return (self.is_retracted,) + tuple(
+            (t.temperature, t.pressure, t.pressure_tier, t.damage_level, t.storage_capacity,
+             tuple(t.stored_fluids.values()), tuple(t.fluid_production_rates.values()))
+            for t in self.testicles
+        )
         
     @property
     def total_pressure(self) -> float:
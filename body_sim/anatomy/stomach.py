@@ -19,6 +19,10 @@ import math
 from body_sim.core.enums import FluidType, StomachState, CardiaState, DigestionState
 from body_sim.core.fluids import FluidMixture, BreastFluid
 from body_sim.core.constants import UTERUS_MAX_STRETCH, PRESSURE_LEAK_MIN
+from body_sim.systems.dormancy import Dormant, DormancyStats, tick_organ, wake_on
+from body_sim.systems.signals import Emitter
+from body_sim.systems.fast_forward import split_steps, elastic_recovery
+from body_sim.systems.integrator import Integrator, integrate_outflow
 
 
 @dataclass
@@ -63,6 +67,9 @@ class StomachWall:
         
         return True
     
+    # Медленная подсистема: период обновления в шагах (systems.scheduler)
+    TICK_PERIOD = 4
+
     def recover(self, dt: float):
         """Восстановление с учётом пластичности."""
         self.fatigue = max(0.0, self.fatigue - 0.005 * dt)
@@ -76,6 +83,16 @@ class StomachWall:
             
             self.stretch_ratio = 1.0 + plastic_part + new_elastic
     
+    def fast_forward(self, duration: float, dt: float = 1.0):
+        """recover(dt) за duration в закрытой форме (O(1))."""
+        steps, rest = split_steps(duration, dt)
+        self.fatigue = max(0.0, self.fatigue - 0.005 * dt * steps)
+        if self.stretch_ratio > 1.0:
+            self.stretch_ratio = 1.0 + elastic_recovery(
+                self.stretch_ratio - 1.0, self.plasticity, 0.0005 * self.elasticity * dt, steps)
+        if rest:
+            self.recover(rest)
+    
     def get_skin_tension(self) -> float:
         """Натяжение стенки (0-1)."""
         if self.stretch_ratio <= 1.0:
@@ -152,8 +169,11 @@ class Cardia:
         return stomach_pressure > self.reflux_threshold / self.competence
 
 
+@wake_on("inflate", "add_fluid", "remove_fluid", "drain_all", "add_solid",
+         "receive_from_esophagus", "advance_object", "remove_object",
+         "receive_from_rectum", "advance_object_reverse")
 @dataclass
-class Stomach:
+class Stomach(Emitter, Dormant):
     """
     Желудок с системой инфляции и пенетрации.
     
@@ -191,26 +211,15 @@ class Stomach:
     inserted_object: Optional[Any] = field(default=None, repr=False)
     penetration_depth: float = 0.0   # Глубина от кардии
     
-    # События
-    _listeners: Dict[str, List[Callable]] = field(default_factory=dict)
-    
     # Физиология
     peristalsis_strength: float = 0.6
     digestion_rate: float = 1.0      # Скорость переваривания
     emptying_rate: float = 0.5       # Скорость опорожнения в кишечник
+    leak_integrator: Integrator = Integrator.EXPLICIT  # Схема опорожнения и рефлюкса
     
     def __post_init__(self):
         self.cardia.stomach_connection = self
     
-    # ============ EVENTS ============
-    
-    def on(self, event: str, callback: Callable):
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data):
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-    
     # ============ PROPERTIES ============
     
     @property
@@ -424,13 +433,34 @@ class Stomach:
     
     # ============ DIGESTION ============
     
-    def tick(self, dt: float = 1.0) -> Dict[str, Any]:
-        """Обновление состояния."""
+    def rest_key(self) -> Optional[tuple]:
+        walls, cardia = self.walls, self.cardia
+        return (self.mixture.total(), self.solid_content, self.state, self.inflation_ratio,
+                self.inserted_object is None, walls.fatigue, walls.stretch_ratio, walls.integrity,
+                cardia.current_dilation, cardia.state)
+
+    def cycle_key(self) -> Optional[tuple]:
+        return (self.rest_key(), tuple(self.mixture._slots))
+    
+    def can_fast_forward(self) -> bool:
+        """Спит и пуст: давление и заполнение 0 при любом растяжении стенок."""
+        return self.is_dormant and (self.filled <= 0 or self.is_ruptured)
+
+    def fast_forward(self, duration: float, dt: float = 1.0) -> None:
+        """Стенки за duration в закрытой форме, состояние - по итоговому растяжению."""
+        if self.is_ruptured:
+            return
+        self.walls.fast_forward(duration, dt)
+        self._update_state()
+    
+    def tick(self, dt: float = 1.0, slow: bool = True) -> Dict[str, Any]:
+        """Обновление состояния (slow=False - без восстановления стенок)."""
         if self.is_ruptured:
             return {"state": "RUPTURED", "integrity": self.walls.integrity}
         
         # 1. Восстановление стенок
-        self.walls.recover(dt)
+        if slow:
+            self.walls.recover(dt)
         
         # 2. Пищеварение
         if self.solid_content > 0:
@@ -442,7 +472,9 @@ class Stomach:
         
         # 3. Перистальтика и опорожнение
         if self.fill_ratio > 0.1 and self.pylorus:
-            empty_amount = self.mixture.total() * self.emptying_rate * 0.05 * dt
+            emptying = self.emptying_rate * 0.05
+            empty_amount = integrate_outflow(self.mixture.total(), lambda volume: volume * emptying,
+                                             dt, self.leak_integrator)
             if empty_amount > 0:
                 # В кишечник
                 emptied = self.pylorus.receive_fluid(
@@ -453,7 +485,14 @@ class Stomach:
         # 4. Проверка рефлюкса
         pressure = self.pressure()
         if self.cardia.check_reflux(pressure):
-            reflux_amount = (pressure - self.cardia.reflux_threshold) * 2.0 * dt
+            cardia = self.cardia
+            other = self.filled - self.mixture.total()
+            
+            def reflux_flow(volume: float) -> float:
+                p = self._pressure_at(volume + other)
+                return (p - cardia.reflux_threshold) * 2.0 if cardia.check_reflux(p) else 0.0
+            
+            reflux_amount = integrate_outflow(self.mixture.total(), reflux_flow, dt, self.leak_integrator)
             if reflux_amount > 0:
                 fluids = dict(self.mixture.components)
                 for ftype, famount in fluids.items():
@@ -485,10 +524,14 @@ class Stomach:
     
     def pressure(self) -> float:
         """Давление в желудке."""
-        if self.filled <= 0:
+        return self._pressure_at(self.filled)
+    
+    def _pressure_at(self, filled: float) -> float:
+        if filled <= 0:
             return 0.0
         
-        fill_ratio = self.fill_ratio
+        current_volume = self.current_volume
+        fill_ratio = filled / current_volume if current_volume > 0 else 0
         pressure = fill_ratio * 1.5  # Меньше чем в матке
         
         # Кислота увеличивает давление
@@ -644,6 +687,6 @@ class StomachSystem:
     def primary(self) -> Optional[Stomach]:
         return self.stomachs[0] if self.stomachs else None
     
-    def tick(self, dt: float = 1.0):
+    def tick(self, dt: float = 1.0, stats: Optional[DormancyStats] = None, slow: bool = True):
         for stomach in self.stomachs:
-            stomach.tick(dt)
+            tick_organ(stomach, (dt, slow), stomach.tick, dt, slow, stats=stats)
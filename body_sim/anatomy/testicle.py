@@ -3,7 +3,9 @@
 """
 from dataclasses import dataclass, field
 from typing import Dict
+import math
 from body_sim.core.enums import FluidType, TesticleSize
+from body_sim.systems.fast_forward import split_steps, steps_until_below
 
 
 @dataclass
@@ -109,11 +111,65 @@ class Testicle:
         self.damage_level = max(0.0, self.damage_level - amount)
         self.is_damaged = self.damage_level > 0.1
 
+    # Медленная подсистема: период обновления в шагах (systems.scheduler)
+    TICK_PERIOD = 4
+
     def tick(self, dt: float, arousal: float = 0.0) -> None:
         if self.temperature > 34.5:
             self.temperature -= 0.05 * dt
         self.produce(dt, arousal)
         self.update_pressure()
+
+    def fast_forward(self, duration: float, dt: float = 1.0, arousal: float = 0.0) -> None:
+        """
+        tick(dt, arousal) за duration.
+
+        Остывание и выработка вдали от ёмкости - в закрытой форме; у
+        ёмкости каждый шаг заполняет 0.9 свободного места, поэтому хвост
+        шагается до неподвижной точки (десятки шагов, а не тысячи).
+        """
+        steps, rest = split_steps(duration, dt)
+        # Переполнение: давление повреждает яичко, выработка отрицательна
+        while steps and self.total_stored >= self.storage_capacity:
+            self.tick(dt, arousal)
+            steps -= 1
+
+        if steps:
+            cooling = min(steps, steps_until_below(self.temperature, 0.05 * dt, 34.5))
+            self.temperature -= 0.05 * dt * cooling
+            self._produce_steps(steps, dt, arousal)
+            self.update_pressure()
+        if rest:
+            self.tick(rest, arousal)
+
+    def _produce_steps(self, steps: int, dt: float, arousal: float) -> None:
+        """produce(dt, arousal) steps раз."""
+        if not self.can_produce:
+            return
+        arousal_boost = 1.0 + (arousal * 2.0)
+        damage_penalty = 1.0 - (self.damage_level * 0.5)
+        amounts = [(fluid_type, base_rate * arousal_boost * damage_penalty * dt)
+                   for fluid_type, base_rate in self.fluid_production_rates.items()]
+
+        # Шаг линейный, пока каждая порция меньше 0.9 оставшегося места
+        per_step = sum(amount for _, amount in amounts)
+        needed = 0.0
+        before = 0.0
+        for _, amount in amounts:
+            needed = max(needed, amount / 0.9 + before)
+            before += amount
+        free = self.storage_capacity - self.total_stored
+        linear = 0
+        if per_step > 0 and free >= needed:
+            linear = min(steps, math.floor((free - needed) / per_step) + 1)
+            for fluid_type, amount in amounts:
+                self.stored_fluids[fluid_type] = self.stored_fluids.get(fluid_type, 0) + amount * linear
+
+        for _ in range(steps - linear):
+            stored = tuple(self.stored_fluids.values())
+            self.produce(dt, arousal)
+            if tuple(self.stored_fluids.values()) == stored:
+                break
         
     def update_pressure(self) -> None:
         """Обновить давление на основе заполненности."""
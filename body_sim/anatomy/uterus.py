@@ -26,6 +26,10 @@ from body_sim.core.enums import (
 
 from body_sim.core.fluids import FluidMixture, BreastFluid, FLUID_DEFS
 from body_sim.core.constants import UTERUS_MAX_STRETCH, PRESSURE_LEAK_MIN
+from body_sim.systems.dormancy import Dormant, DormancyStats, tick_organ, wake_on
+from body_sim.systems.signals import Emitter
+from body_sim.systems.fast_forward import split_steps, elastic_recovery
+from body_sim.systems.integrator import Integrator, integrate_outflow
 
 
 @dataclass
@@ -77,6 +81,9 @@ class UterineWall:
 
         return True
 
+    # Медленная подсистема: период обновления в шагах (systems.scheduler)
+    TICK_PERIOD = 4
+
     def recover(self, dt: float):
         """Восстановление с учётом пластичности."""
         self.fatigue = max(0.0, self.fatigue - 0.01 * dt)
@@ -91,6 +98,16 @@ class UterineWall:
 
             self.stretch_ratio = 1.0 + plastic_part + new_elastic
 
+    def fast_forward(self, duration: float, dt: float = 1.0):
+        """recover(dt) за duration в закрытой форме (O(1))."""
+        steps, rest = split_steps(duration, dt)
+        self.fatigue = max(0.0, self.fatigue - 0.01 * dt * steps)
+        if self.stretch_ratio > 1.0:
+            self.stretch_ratio = 1.0 + elastic_recovery(
+                self.stretch_ratio - 1.0, self.plasticity, 0.001 * self.elasticity * dt, steps)
+        if rest:
+            self.recover(rest)
+
     def get_skin_tension(self) -> float:
         """Натяжение кожи (0-1)."""
         if self.stretch_ratio <= 1.0:
@@ -237,6 +254,9 @@ class Ovary:
     attached_tube: Optional['FallopianTube'] = field(default=None, repr=False)
     ruptured_follicles: int = 0
 
+    # Медленная подсистема (Uterus.tick_ovaries): период в шагах
+    TICK_PERIOD = 10
+
     def __post_init__(self):
         self.base_volume = self.calculate_volume()
         self.max_volume = self.base_volume * 2.0
@@ -907,8 +927,11 @@ class FallopianTube:
         return " | ".join(desc)
 
 
+@wake_on("inflate", "add_fluid", "remove_fluid", "drain_all", "apply_strain",
+         "reduce_prolapse", "insert_object", "remove_object", "stretch_tube",
+         "inflate_tube", "evert_ovary", "ovulate")
 @dataclass 
-class Uterus:
+class Uterus(Emitter, Dormant):
     """
     Матка с системой инфляции и распределением жидкости.
 
@@ -946,6 +969,7 @@ class Uterus:
     # СИСТЕМА ЖИДКОСТИ
     mixture: FluidMixture = field(default_factory=FluidMixture)
     leak_factor: float = 15.0
+    leak_integrator: Integrator = Integrator.EXPLICIT  # Схема утечки (systems.integrator)
 
     # СИСТЕМА ИНФЛЯЦИИ
     inflation_ratio: float = 1.0           # Коэффициент инфляции матки
@@ -965,9 +989,6 @@ class Uterus:
     # Дополнительный объём при выворачивании
     everted_volume: float = field(init=False)
 
-    # События
-    _listeners: Dict[str, List[Callable]] = field(default_factory=dict)
-
     def __post_init__(self):
         self.everted_volume = self.cavity_volume * 1.5
 
@@ -984,15 +1005,6 @@ class Uterus:
             self.right_tube.ovary = self.right_ovary
             self.right_ovary.attached_tube = self.right_tube
 
-    # ============ EVENTS ============
-
-    def on(self, event: str, callback: Callable):
-        self._listeners.setdefault(event, []).append(callback)
-
-    def _emit(self, event: str, **data):
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-
     # ============ PROPERTIES ============
 
     @property
@@ -1301,9 +1313,13 @@ class Uterus:
         """Расчёт давления с учётом инфляции."""
         if self.uterus_filled <= 0:
             return 0.0
+        return self._pressure_at(self.uterus_filled, self.mixture.viscosity(defs))
 
-        viscosity = self.mixture.viscosity(defs)
-        fill_ratio = self.uterus_filled / self.current_volume if self.current_volume > 0 else 0
+    def _pressure_at(self, filled: float, viscosity: float) -> float:
+        if filled <= 0:
+            return 0.0
+
+        fill_ratio = filled / self.current_volume if self.current_volume > 0 else 0
 
         # Базовое давление
         pressure = fill_ratio * 2.0
@@ -1538,13 +1554,29 @@ class Uterus:
 
     # ============ TICK & UPDATE ============
 
-    def tick(self, defs: Dict[FluidType, BreastFluid] = FLUID_DEFS, dt: float = 1.0) -> Dict[str, Any]:
-        """Обновление состояния."""
+    def rest_key(self) -> Optional[tuple]:
+        walls, cervix = self.walls, self.cervix
+        return (self.mixture.total(), self.tubes_filled, self.ovaries_filled,
+                self.state, self.inflation_status, self.inflation_ratio,
+                walls.fatigue, walls.stretch_ratio, walls.integrity,
+                cervix.state, cervix.current_dilation, cervix.gape_diameter,
+                self.prolapse_stage, self.descent_position,
+                tuple((o.hormone_production, o.blood_supply, o.state) for o in self.ovaries))
+
+    def tick(self, defs: Dict[FluidType, BreastFluid] = FLUID_DEFS, dt: float = 1.0,
+             slow: bool = True) -> Dict[str, Any]:
+        """
+        Обновление состояния.
+
+        slow=False - стенки и яичники не обновляются (их ведёт
+        MultiRateScheduler тела, см. systems.scheduler).
+        """
         if dt <= 0:
             raise ValueError(f"dt must be positive, got {dt}")
 
         # 1. Восстановление стенок
-        self.walls.recover(dt)
+        if slow:
+            self.walls.recover(dt)
 
         # 2. Обратный поток
         backflow = self._handle_backflow()
@@ -1575,9 +1607,11 @@ class Uterus:
         leaked = 0.0
         if self.state == UterusState.LEAKING:
             viscosity = self.mixture.viscosity(defs)
-            leak_rate = self._calc_leak_rate(pressure, viscosity)
-            max_leak = self.uterus_filled * leak_rate * dt
-            leaked = min(max_leak, self.uterus_filled)
+
+            def flow(volume: float) -> float:
+                return volume * self._calc_leak_rate(self._pressure_at(volume, viscosity), viscosity)
+
+            leaked = integrate_outflow(self.uterus_filled, flow, dt, self.leak_integrator)
 
             if leaked > 0:
                 self.mixture.remove(leaked)
@@ -1587,13 +1621,8 @@ class Uterus:
         self._update_inflation_status()
 
         # 9. Обновление яичников
-        for ovary in self.ovaries:
-            if ovary:
-                ovary.hormone_production = max(0.0, ovary.hormone_production - 0.001 * dt)
-                if ovary.is_everted:
-                    ovary.blood_supply = max(0.3, ovary.blood_supply - 0.01 * dt)
-                    if ovary.blood_supply < 0.5:
-                        ovary.state = OvaryState.TORSION
+        if slow:
+            self.tick_ovaries(dt)
 
         # 10. Сокращение шейки
         if self.cervix.state not in (CervixState.EVERTED, CervixState.FULLY_OPEN):
@@ -1620,6 +1649,26 @@ class Uterus:
         }
 
 
+    def can_fast_forward(self) -> bool:
+        """Спит и полость пуста: давление 0 и не зависит от стенок."""
+        return self.is_dormant and self.uterus_filled <= 0
+
+    def fast_forward(self, duration: float, dt: float = 1.0) -> None:
+        """Стенки и яичники за duration в закрытой форме, статус - по итоговому растяжению."""
+        self.walls.fast_forward(duration, dt)
+        self.tick_ovaries(duration)
+        self._update_inflation_status()
+
+    def tick_ovaries(self, dt: float) -> None:
+        """Спад гормонов и кровоснабжения вывернутых яичников."""
+        for ovary in self.ovaries:
+            if ovary:
+                ovary.hormone_production = max(0.0, ovary.hormone_production - 0.001 * dt)
+                if ovary.is_everted:
+                    ovary.blood_supply = max(0.3, ovary.blood_supply - 0.01 * dt)
+                    if ovary.blood_supply < 0.5:
+                        ovary.state = OvaryState.TORSION
+
     def _update_cervix(self, pressure: float, dt: float):
         """Обновление шейки под давлением."""
         if pressure > 0.8:
@@ -1914,9 +1963,9 @@ class UterusSystem:
         self.uteri.append(uterus)
         return len(self.uteri) - 1
 
-    def tick(self, dt: float = 1.0):
+    def tick(self, dt: float = 1.0, stats: Optional[DormancyStats] = None, slow: bool = True):
         for uterus in self.uteri:
-            uterus.tick(dt=dt)
+            tick_organ(uterus, (dt, slow), uterus.tick, FLUID_DEFS, dt, slow, stats=stats)
 
     def __iter__(self):
         return iter(self.uteri)
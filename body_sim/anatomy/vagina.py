@@ -9,11 +9,15 @@ import math
 from body_sim.anatomy.base import Genital
 from body_sim.core.enums import VaginaType, VaginaState
 from body_sim.systems.penetration import PenetrableWithFluid
+from body_sim.systems.dormancy import wake_on
 
 if TYPE_CHECKING:
     from .penis import Penis
 
 
+@wake_on("stimulate", "penetrate", "withdraw", "contract", "relax", "update_arousal",
+         "stretch", "recover", "insert_object", "advance_object", "withdraw_object",
+         "add_fluid", "remove_fluid", "drain_all", "inflate", "deflate")
 @dataclass
 class Vagina(Genital, PenetrableWithFluid):
     vagina_type: VaginaType = field(default=VaginaType.HUMAN)
@@ -138,6 +142,10 @@ class Vagina(Genital, PenetrableWithFluid):
             self.current_stretch = max(1.0, self.current_stretch * 0.95)
         self.lubrication = max(0.0, self.lubrication - 0.1 * dt)
 
+    def rest_key(self) -> Optional[tuple]:
+        return (self.arousal, self.pleasure, self.is_aroused, self.current_stretch,
+                self.lubrication, self.current_penetration is None)
+
     def get_insertable_object(self) -> Any:
         from body_sim.systems.penetration import InsertableObject
         return InsertableObject(
@@ -13,10 +13,11 @@ from body_sim.appearance.features import (
     Eye, Ear, Hair, Horn, Tail, Wings, FacialStructure, Skin
 )
 from body_sim.core.enums import Color as BodyColor
+from body_sim.systems.signals import Emitter
 
 
 @dataclass
-class Appearance:
+class Appearance(Emitter):
     """Полная внешность существа."""
     race: Race = Race.HUMAN
     
@@ -47,9 +48,6 @@ class Appearance:
     height: float = 170.0  # см
     build: str = "average"  # petite, slender, average, athletic, muscular, heavy
     
-    # События
-    _listeners: Dict[str, List[Callable]] = field(default_factory=dict, repr=False)
-    
     def __post_init__(self):
         """Применить расовые шаблоны если не заданы явно."""
         if not self._is_customized():
@@ -59,15 +57,6 @@ class Appearance:
         """Проверяет, были ли параметры изменены от дефолтных."""
         return len(self.eyes) > 1 or len(self.horns) > 0 or self.tail.tail_type != TailType.NONE
     
-    def on(self, event: str, callback: Callable[..., Any]) -> None:
-        """Подписаться на событие изменения внешности."""
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data: Any) -> None:
-        """Вызвать событие."""
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-    
     def apply_race_template(self) -> None:
         """Применить шаблон внешности для текущей расы."""
         templates = {
@@ -234,6 +234,9 @@ class ExtendedAppearanceMixin:
     _preset: Dict[str, Any] = field(default_factory=dict, repr=False)
     _appearance_listeners: Dict[str, List[Callable]] = field(default_factory=dict, repr=False)
     
+    # Обновление внешности из анатомии - медленная подсистема (шагов)
+    APPEARANCE_TICK_PERIOD = 10
+    
     def __post_init__(self):
         """Инициализация пресета расы и настройка частей."""
         self._preset = self._get_preset()
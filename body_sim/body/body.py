@@ -4,20 +4,27 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 import random
 
 from body_sim.core.enums import Sex, BodyType, TesticleSize, CupSize, Color, FluidType, PenisType, VaginaType, ScrotumType, GenitalVisibility
 from body_sim.body.stats import BodyStats
 from body_sim.anatomy import *
+from body_sim.anatomy.stomach import Stomach, StomachWall
+from body_sim.anatomy.rectum import Rectum, RectalWall
 from body_sim.systems.grid import BreastGrid
 from body_sim.systems.penetration import CrossBodyPenetration
+from body_sim.systems.dormancy import DormancyStats, tick_organ
+from body_sim.systems.scheduler import MultiRateScheduler
+from body_sim.systems.fast_forward import CycleDetector, split_steps
+from body_sim.systems.integrator import Integrator
+from body_sim.systems.signals import Emitter, SignalBatch, SignalCoalescer, SignalHub
 from body_sim.magic import MagicMixin
 from body_sim.appearance import ExtendedAppearanceMixin, Race, EyeAppearance, EarAppearance, EyeType, EarType, RACE_ANATOMY_PRESETS, get_race_preset, get_random_race_size
 
 
 @dataclass
-class Body(MagicMixin, ExtendedAppearanceMixin):
+class Body(Emitter, MagicMixin, ExtendedAppearanceMixin):
     name: str = "Unnamed"
     sex: Sex = Sex.NONE
     body_type: BodyType = BodyType.AVERAGE
@@ -60,9 +67,22 @@ class Body(MagicMixin, ExtendedAppearanceMixin):
     esophagus: Optional['Esophagus'] = field(default=None)
 
     active_sex: Optional[CrossBodyPenetration] = field(default=None, init=False)
-    
-    _listeners: Dict[str, List] = field(default_factory=dict, repr=False)
 
+    # Счётчики спящих органов (см. systems.dormancy)
+    dormancy: DormancyStats = field(default_factory=DormancyStats, repr=False)
+
+    # Медленные подсистемы с собственным периодом (см. systems.scheduler)
+    tick_scheduler: MultiRateScheduler = field(default_factory=MultiRateScheduler, repr=False)
+    _testicle_arousal_dt: float = field(default=0.0, init=False, repr=False)
+
+    # Подписка на сигналы всех органов тела (см. systems.signals)
+    signals: SignalHub = field(default_factory=SignalHub, init=False, repr=False)
+    signal_coalescer: Optional[SignalCoalescer] = field(default=None, init=False, repr=False)
+
+    # Версия тела (см. version): база, последнее значение, состав органов и статы
+    _version_base: int = field(default=0, init=False, repr=False)
+    _version_last: int = field(default=0, init=False, repr=False)
+    _version_shape: Optional[tuple] = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
         # Применяем пресет расы
@@ -102,6 +122,9 @@ class Body(MagicMixin, ExtendedAppearanceMixin):
             if stomach:
                 rectum.stomach_connection = stomach
         
+        self._setup_tick_scheduler()
+        self.attach_signals()
+        
         # Инициализация магии
         self.init_magic()
 
@@ -183,6 +206,7 @@ class Body(MagicMixin, ExtendedAppearanceMixin):
             
             if self.sex in (Sex.FEMALE, Sex.FUTANARI) and not self.uterus_system:
                 self._setup_uterus()
+            self.attach_signals()
         
         self._emit("race_changed", old=old_race, new=new_race)
     
@@ -202,16 +226,10 @@ class Body(MagicMixin, ExtendedAppearanceMixin):
         self._setup_genitals()
         self._setup_uterus()
         self._setup_breasts()
+        self.attach_signals()
         
         self._emit("sex_changed", new_sex=new_sex)
     
-    def on(self, event: str, callback) -> None:
-        self._listeners.setdefault(event, []).append(callback)
-    
-    def _emit(self, event: str, **data) -> None:
-        for cb in self._listeners.get(event, []):
-            cb(self, **data)
-
     def start_sex_with(self, target: 'Body', target_organ: str = "vagina", 
                        source_organ: str = "penis") -> CrossBodyPenetration:
         """Начать половой акт с другим телом"""
@@ -463,43 +481,328 @@ class Body(MagicMixin, ExtendedAppearanceMixin):
     
     def tick(self, dt: float = 1.0) -> None:
         """Обновление состояния тела."""
-        self.stats.tick(dt)
+        self.tick_organs(dt)
+        self.magic_tick()
+
+    def _setup_tick_scheduler(self) -> None:
+        """Зарегистрировать медленные подсистемы с их периодами."""
+        scheduler = self.tick_scheduler
+        scheduler.register("appearance", self._tick_appearance, self.APPEARANCE_TICK_PERIOD)
+        scheduler.register("uterine_walls", self._tick_uterine_walls, UterineWall.TICK_PERIOD)
+        scheduler.register("stomach_walls", self._tick_stomach_walls, StomachWall.TICK_PERIOD)
+        scheduler.register("rectal_walls", self._tick_rectal_walls, RectalWall.TICK_PERIOD)
+        scheduler.register("ovaries", self._tick_ovaries, Ovary.TICK_PERIOD, stage="post")
+        scheduler.register("testicles", self._tick_testicles, Testicle.TICK_PERIOD, stage="post")
+
+    def _tick_appearance(self, dt: float) -> None:
         ExtendedAppearanceMixin.__post_init__(self)
         self.update_appearance_from_anatomy(self)
+
+    def _tick_uterine_walls(self, dt: float) -> None:
+        if self.uterus_system:
+            for uterus in self.uterus_system.uteri:
+                uterus.walls.recover(dt)
+
+    def _tick_ovaries(self, dt: float) -> None:
+        if self.uterus_system:
+            for uterus in self.uterus_system.uteri:
+                uterus.tick_ovaries(dt)
+
+    def _tick_stomach_walls(self, dt: float) -> None:
+        for stomach in self.stomach_system.stomachs:
+            if not stomach.is_ruptured:
+                stomach.walls.recover(dt)
+
+    def _tick_rectal_walls(self, dt: float) -> None:
+        # Прямая кишка тикает через каждый связанный анус и через rectum_system
+        rectums = [a.rectum_connection for a in self.anuses if a.rectum_connection]
+        for rectum in rectums + self.rectum_system.rectums:
+            rectum.wall.recover(dt)
+
+    def _tick_testicles(self, dt: float) -> None:
+        # Возбуждение усредняется по накопленному времени
+        arousal = self._testicle_arousal_dt / dt
+        self._testicle_arousal_dt = 0.0
+        for scrotum in self.scrotums:
+            scrotum.tick_testicles(dt, arousal)
+
+    def flush_slow_ticks(self) -> None:
+        """Догнать медленные подсистемы (перед чтением их точного состояния)."""
+        self.tick_scheduler.flush()
+
+    def tick_organs(self, dt: float = 1.0) -> None:
+        """Обновление статов, внешности и органов (без магии)."""
+        self.stats.tick(dt)
+        arousal = self.stats.arousal
+        self._testicle_arousal_dt += arousal * dt
+        
+        # Внешность, стенки и яички обновляются раз в свой период
+        scheduler = self.tick_scheduler
+        scheduler.advance(dt)
+        scheduler.run_due("pre")
+        
+        # Органы в покое спят и пропускаются (см. systems.dormancy)
+        dormancy = self.dormancy
         
         # Обновление гениталий
         for penis in self.penises:
-            penis.tick(dt)
+            tick_organ(penis, dt, penis.tick, dt, stats=dormancy)
         
         for clit in self.clitorises:
-            clit.tick(dt)
+            tick_organ(clit, dt, clit.tick, dt, stats=dormancy)
         
         for vagina in self.vaginas:
-            vagina.tick(dt)
+            tick_organ(vagina, dt, vagina.tick, dt, stats=dormancy)
         
         # Производство спермы в яичках (хранится там же, переноса в пенис НЕТ)
         for scrotum in self.scrotums:
-            scrotum.tick(dt, self.stats.arousal)
+            tick_organ(scrotum, (dt, arousal, False), scrotum.tick, dt, arousal, False, stats=dormancy)
             # УДАЛЕНО: Перенос спермы в пенис — она забирается только при эякуляции
         
         for anus in self.anuses:
-            anus.tick(dt)
+            tick_organ(anus, (dt, False), anus.tick, dt, False, stats=dormancy)
         
         if self.uterus_system:
-            self.uterus_system.tick(dt)
+            self.uterus_system.tick(dt, stats=dormancy, slow=False)
         
         if self.breast_grid:
             from body_sim.core.fluids import FLUID_DEFS
-            self.breast_grid.tick_all(FLUID_DEFS, dt)
+            self.breast_grid.tick_all(FLUID_DEFS, dt, dormancy)
             
         # Новые системы
-        self.mouth_system.tick(dt)
-        self.stomach_system.tick(dt)
-        self.rectum_system.tick(dt)
+        self.mouth_system.tick(dt, stats=dormancy)
+        self.stomach_system.tick(dt, stats=dormancy, slow=False)
+        self.rectum_system.tick(dt, stats=dormancy, slow=False)
         if self.esophagus:
-            self.esophagus.tick(dt)
+            tick_organ(self.esophagus, dt, self.esophagus.tick, dt, stats=dormancy)
+        
+        scheduler.run_due("post")
+        if self.signal_coalescer is not None:
+            self.signal_coalescer.flush()
 
-        self.magic_tick()
+    def _organs(self) -> List[Any]:
+        """Все органы в порядке tick_organs."""
+        organs = [*self.penises, *self.clitorises, *self.vaginas, *self.scrotums, *self.anuses]
+        if self.uterus_system:
+            organs.extend(self.uterus_system.uteri)
+        if self.breast_grid:
+            organs.extend(self.breast_grid.all())
+        organs.extend([*self.mouth_system.mouths, *self.stomach_system.stomachs, *self.rectum_system.rectums])
+        if self.esophagus:
+            organs.append(self.esophagus)
+        return organs
+
+    def attach_signals(self) -> None:
+        """
+        Подключить тело и органы к self.signals.
+
+        Вызывается при создании и пересоздании анатомии; органы,
+        добавленные в списки напрямую, подключаются повторным вызовом.
+        """
+        hub = self.signals
+        self._hub = hub
+        for organ in self._organs():
+            if isinstance(organ, Emitter):
+                organ._hub = hub
+        if self.breast_grid:
+            self.breast_grid.attach_signals(parent=hub)
+
+    def coalesce_signals(self, callback: Optional[Callable[[SignalBatch], None]] = None) -> SignalCoalescer:
+        """
+        Включить слияние сигналов органов: callback получает один
+        SignalBatch за tick_organs (см. systems.signals).
+        """
+        if self.signal_coalescer is None:
+            self.signal_coalescer = SignalCoalescer(self.signals, owner=self)
+        if callback is not None:
+            self.signal_coalescer.on_batch(callback)
+        return self.signal_coalescer
+
+    def stop_coalescing(self) -> None:
+        if self.signal_coalescer is not None:
+            self.signal_coalescer.close()
+            self.signal_coalescer = None
+
+    @property
+    def version(self) -> int:
+        """
+        Версия тела: растёт, если изменился любой орган (Dormant.version),
+        состав органов или статы. Не изменилась - можно брать из кеша
+        всё, что построено по телу.
+        """
+        organs = self._organs()
+        total = 0
+        for organ in organs:
+            total += organ.version
+        stats = self.stats
+        shape = (tuple(map(id, organs)), stats.arousal, stats.pleasure, stats.pain,
+                 stats.fatigue, stats.height, stats.weight, self.race, self.sex)
+        if shape != self._version_shape:
+            self._version_shape = shape
+            self._version_base = self._version_last + 1 - total
+        version = self._version_base + total
+        self._version_last = version
+        return version
+
+    def wake_organs(self) -> None:
+        """Разбудить все органы (после прямой записи в поля в обход методов)."""
+        for organ in self._organs():
+            organ.wake()
+
+    def set_leak_integrator(self, method: Integrator) -> int:
+        """Схема утечки для всех органов с leak_integrator (см. systems.integrator)."""
+        count = 0
+        for organ in self._organs():
+            for target in (organ, getattr(organ, "fluid_system", None)):
+                if hasattr(target, "leak_integrator"):
+                    target.leak_integrator = method
+                    count += 1
+        return count
+
+    # ============ ПЕРЕМОТКА ============
+
+    def fast_forward(self, duration: float, dt: float = 1.0) -> Dict[str, Any]:
+        """
+        Продвинуть органы на duration (как tick_organs(dt) duration / dt раз, без магии).
+
+        Органы, влияющие друг на друга в тике, образуют группу
+        (пищеварительный тракт - одна группа, остальные органы по одному).
+        Группа в покое - быстрая часть тика её органов в неподвижной точке
+        (спящие органы, пустая грудь без лактации) - перематывается за O(1):
+        стенки, яичники, яички, растяжение груди в закрытой форме (см.
+        systems.fast_forward). Активные группы (утечки, лактация, события)
+        шагают обычными тиками, пока не успокоятся.
+
+        Группа, которая не успокаивается, а выходит на предельный цикл
+        (рот вырабатывает слюну и глотает её, желудок без привратника
+        возвращает излишек рефлюксом в рот), шагает, пока CycleDetector
+        не найдёт период по cycle_key() органов (окно - 64 единицы времени,
+        то есть 64 / dt шагов; числа сравниваются с допуском на ulp-дрейф
+        бегущих сумм); потом - только остаток (steps - шаг) % период. Так
+        перематываются лишь группы, у которых нет слушателей: события
+        внутри пропущенных периодов не генерируются.
+        """
+        steps, rest = split_steps(duration, dt)
+        self.tick_scheduler.flush()
+        self._testicle_arousal_dt = 0.0
+        
+        groups = self._tick_groups()
+        rest_from: List[Optional[int]] = [None] * len(groups)
+        # (шаг, период) для групп на предельном цикле
+        cycle_from: List[Optional[Tuple[int, int]]] = [None] * len(groups)
+        detectors: Dict[int, CycleDetector] = {}
+        step = 0
+        while step < steps:
+            active = set()
+            for i, group in enumerate(groups):
+                if rest_from[i] is not None or cycle_from[i] is not None:
+                    continue
+                if self._group_at_rest(group):
+                    rest_from[i] = step
+                    continue
+                if self._group_can_cycle(group):
+                    detector = detectors.get(i)
+                    if detector is None:
+                        detector = detectors[i] = CycleDetector.for_dt(dt)
+                    period = detector.push(tuple(organ.cycle_key() for organ in group))
+                    if period:
+                        cycle_from[i] = (step, period)
+                        continue
+                active.update(id(organ) for organ in group)
+            if not active:
+                break
+            self.stats.tick(dt)
+            for organ in self._organs():
+                if id(organ) in active:
+                    self._tick_organ_stepped(organ, dt)
+            step += 1
+        
+        if steps > step:
+            self.stats.tick((steps - step) * dt)
+        for group, since in zip(groups, rest_from):
+            if since is not None and steps > since:
+                for organ in group:
+                    organ.fast_forward((steps - since) * dt, dt)
+                    organ.touch()
+        for group, cycle in zip(groups, cycle_from):
+            if cycle is not None:
+                since, period = cycle
+                for _ in range((steps - since) % period):
+                    for organ in group:
+                        self._tick_organ_stepped(organ, dt)
+                for organ in group:
+                    organ.touch()
+        if steps:
+            self._tick_appearance(steps * dt)
+        
+        if rest:
+            self.tick_organs(rest)
+        elif self.signal_coalescer is not None:
+            self.signal_coalescer.flush()
+        return {
+            "steps": steps,
+            "stepped": step,
+            "organs_fast_forwarded": sum(len(g) for g, since in zip(groups, rest_from) if since is not None),
+            "organs_cycled": sum(len(g) for g, cycle in zip(groups, cycle_from) if cycle is not None),
+            "organs_stepped": sum(len(g) for g, since, cycle in zip(groups, rest_from, cycle_from)
+                                  if since is None and cycle is None),
+        }
+
+    def _tick_groups(self) -> List[List[Any]]:
+        """Группы органов, связанных в тике (анус -> прямая кишка -> желудок <- пищевод <- рот)."""
+        digestive = {id(organ) for organ in (*self.anuses, *self.mouth_system.mouths,
+                                              *self.stomach_system.stomachs, *self.rectum_system.rectums)}
+        if self.esophagus:
+            digestive.add(id(self.esophagus))
+        organs = self._organs()
+        groups = [[organ] for organ in organs if id(organ) not in digestive]
+        groups.append([organ for organ in organs if id(organ) in digestive])
+        return groups
+
+    def _group_at_rest(self, group: List[Any]) -> bool:
+        for organ in group:
+            if not organ.can_fast_forward():
+                return False
+            # Выработка в яичках зависит от возбуждения тела
+            if isinstance(organ, Scrotum) and self.stats.arousal > 0:
+                return False
+        return True
+
+    def _group_can_cycle(self, group: List[Any]) -> bool:
+        """Можно ли искать у группы предельный цикл: входы тика постоянны, событий никто не ждёт."""
+        for organ in group:
+            # Вход тика яичек - возбуждение тела, оно меняется со временем
+            if isinstance(organ, Scrotum) or getattr(organ, "observed", False):
+                return False
+            # Без rest_key состояние органа не видно
+            if organ.rest_key() is None:
+                return False
+        return True
+
+    def _tick_organ_stepped(self, organ: Any, dt: float) -> None:
+        """Тик органа как в tick_organs с периодом 1 у медленных подсистем."""
+        from body_sim.core.fluids import FLUID_DEFS
+        dormancy = self.dormancy
+        if isinstance(organ, Scrotum):
+            arousal = self.stats.arousal
+            tick_organ(organ, (dt, arousal, False), organ.tick, dt, arousal, False, stats=dormancy)
+            organ.tick_testicles(dt, arousal)
+        elif isinstance(organ, Uterus):
+            organ.walls.recover(dt)
+            tick_organ(organ, (dt, False), organ.tick, FLUID_DEFS, dt, False, stats=dormancy)
+            organ.tick_ovaries(dt)
+        elif isinstance(organ, (Anus, Stomach, Rectum)):
+            if isinstance(organ, Anus) and organ.rectum_connection:
+                organ.rectum_connection.wall.recover(dt)
+            elif isinstance(organ, Stomach) and not organ.is_ruptured:
+                organ.walls.recover(dt)
+            elif isinstance(organ, Rectum):
+                organ.wall.recover(dt)
+            tick_organ(organ, (dt, False), organ.tick, dt, False, stats=dormancy)
+        elif isinstance(organ, Breast):
+            tick_organ(organ, (dt, id(FLUID_DEFS)), organ.tick, FLUID_DEFS, dt, stats=dormancy)
+        else:
+            tick_organ(organ, dt, organ.tick, dt, stats=dormancy)
 
     def _get_random_size(self, param: str) -> float:
         """Получить случайный размер из диапазона пресета."""
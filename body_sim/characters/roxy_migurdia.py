@@ -166,9 +166,9 @@ class RoxyMigurdia(FemaleBody):
             if pain_amount > 0.1:
                 self.flatten_ears()
     
-    def tick(self, dt: float = 1.0) -> None:
+    def tick_organs(self, dt: float = 1.0) -> None:
         """Обновление с расовыми особенностями."""
-        super().tick(dt)
+        super().tick_organs(dt)
         
         # Мигурдийцы быстрее восстанавливаются от усталости (молодой организм)
         if self.stats.fatigue > 0:
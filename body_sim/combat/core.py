@@ -1,10 +1,9 @@
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import List, Dict, Optional, TYPE_CHECKING
-from rich.panel import Panel
-from rich.text import Text
 
 if TYPE_CHECKING:
+    from rich.panel import Panel
     from body_sim.systems.events import EventfulBody
 
 class DamageType(Enum):
@@ -156,7 +155,10 @@ class Combatant:
     def can_act(self) -> bool:
         return self.is_alive() and not any(isinstance(e, Stunned) for e in self.status_effects)
     
-    def get_status_panel(self) -> Panel:
+    def get_status_panel(self) -> 'Panel':
+        from rich.panel import Panel
+        from rich.text import Text
+
         hp_pct = self.stats.hp / self.stats.max_hp
         hp_color = "red" if hp_pct < 0.3 else "yellow" if hp_pct < 0.6 else "green"
         hp_bar = "█" * int(hp_pct * 10) + "░" * (10 - int(hp_pct * 10))
@@ -1,14 +1,13 @@
 #body_sim/core/description.py
 
-from typing import List, Dict, Optional, Callable, Union, Any, Tuple
+from typing import List, Dict, Optional, Callable, Union, Any, Tuple, Iterable
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import random
 import re
-from rich.console import Console
-from rich.text import Text
-from rich.panel import Panel
-from rich import box
+import weakref
 
 from body_sim.core.enums import (
     CupSize, BreastState, VaginaState, UterusState, 
@@ -26,12 +25,126 @@ class DescriptionStyle(Enum):
     EROTIC = "erotic"         # Фокус на ощущениях от наполнения
 
 
+# ============ КОМПИЛЯЦИЯ ШАБЛОНОВ ============
+
+@dataclass(frozen=True)
+class TagNode:
+    """[tag.attr] - значение тега."""
+    name: str
+
+
+@dataclass(frozen=True)
+class IfNode:
+    """[if:условие:текст] - текст (может содержать теги), если условие истинно."""
+    condition: str
+    body: Tuple[Any, ...]
+
+
+_IF_OPEN = re.compile(r'\[if:(\w+):')
+_TAG = re.compile(r'\[([\w.]+)\]')
+
+
+def _parse_nodes(source: str, pos: int, nested: bool) -> Tuple[Optional[Tuple[Any, ...]], int]:
+    """Узлы от pos до конца (или до ']' условия). (None, pos) - условие не закрыто."""
+    nodes: List[Any] = []
+    start = pos
+    end = len(source)
+    while pos < end:
+        ch = source[pos]
+        if ch == ']' and nested:
+            if start < pos:
+                nodes.append(source[start:pos])
+            return tuple(nodes), pos + 1
+        if ch != '[':
+            pos += 1
+            continue
+        m = _IF_OPEN.match(source, pos)
+        if m:
+            body, after = _parse_nodes(source, m.end(), True)
+            if body:
+                if start < pos:
+                    nodes.append(source[start:pos])
+                nodes.append(IfNode(m.group(1), body))
+                pos = start = after
+                continue
+        m = _TAG.match(source, pos)
+        if m:
+            if start < pos:
+                nodes.append(source[start:pos])
+            nodes.append(TagNode(m.group(1)))
+            pos = start = m.end()
+            continue
+        pos += 1
+    if nested:
+        return None, pos
+    if start < pos:
+        nodes.append(source[start:pos])
+    return tuple(nodes), pos
+
+
+@dataclass(frozen=True)
+class Template:
+    """
+    Скомпилированный шаблон описания.
+
+    Не привязан к телу: один Template рендерится парсером любого тела,
+    каждый тег и условие вычисляются не больше раза за рендер.
+    Неизвестные парсеру теги и условия остаются в тексте как есть.
+    """
+    source: str
+    nodes: Tuple[Any, ...]
+
+    def render(self, parser: 'DescriptionParser') -> str:
+        out: List[str] = []
+        self._render(self.nodes, parser, {}, out)
+        return "".join(out)
+
+    def _render(self, nodes: Tuple[Any, ...], parser: 'DescriptionParser',
+                values: Dict[Any, Any], out: List[str]) -> None:
+        for node in nodes:
+            if type(node) is str:
+                out.append(node)
+            elif type(node) is TagNode:
+                value = values.get(node)
+                if value is None:
+                    func = parser.tags.get(node.name)
+                    value = values[node] = func() if func is not None else f"[{node.name}]"
+                out.append(value)
+            else:
+                check = parser.conditions.get(node.condition)
+                if check is None:
+                    out.append(f"[if:{node.condition}:")
+                    self._render(node.body, parser, values, out)
+                    out.append("]")
+                    continue
+                key = ("if", node.condition)
+                passed = values.get(key)
+                if passed is None:
+                    passed = values[key] = bool(check())
+                if passed:
+                    self._render(node.body, parser, values, out)
+
+
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> Template:
+    """Разобрать шаблон в дерево узлов (результат кешируется по тексту)."""
+    nodes, _ = _parse_nodes(source, 0, False)
+    return Template(source, nodes)
+
+
+def render_many(template: str, bodies: Iterable[Body]) -> List[str]:
+    """Один шаблон для многих тел: компиляция один раз, дальше - линейный проход."""
+    compiled = compile_template(template)
+    return [compiled.render(DescriptionParser(body)) for body in bodies]
+
+
 class DescriptionParser:
     """Парсер шаблонов [tag.attr] с поддержкой содержимого органов"""
     
     def __init__(self, body: Body):
         self.body = body
         self.tags = self._build_tag_registry()
+        self.conditions = self._build_condition_registry()
     
     def _build_tag_registry(self) -> Dict[str, Callable]:
         return {
@@ -75,29 +188,18 @@ class DescriptionParser:
             'mouth.contents': self._get_mouth_contents,
         }
     
+    def _build_condition_registry(self) -> Dict[str, Callable[[], bool]]:
+        return {
+            'pregnant': self._check_pregnant,
+            'lactating': self._check_lactating_any,
+            'erect': self._check_erect,
+            'womb_full': self._check_womb_full,
+            'breasts_full': self._check_breasts_full,
+            'stuffed': self._check_any_organ_full,
+        }
+    
     def parse(self, template: str) -> str:
-        result = template
-        
-        # Простые замены
-        for tag, func in self.tags.items():
-            pattern = f'\\[{tag}\\]'
-            result = re.sub(pattern, lambda m: func(), result)
-        
-        # Условия
-        result = re.sub(r'\[if:pregnant:([^\]]+)\]', 
-                       lambda m: m.group(1) if self._check_pregnant() else '', result)
-        result = re.sub(r'\[if:lactating:([^\]]+)\]', 
-                       lambda m: m.group(1) if self._check_lactating_any() else '', result)
-        result = re.sub(r'\[if:erect:([^\]]+)\]', 
-                       lambda m: m.group(1) if self._check_erect() else '', result)
-        result = re.sub(r'\[if:womb_full:([^\]]+)\]',
-                       lambda m: m.group(1) if self._check_womb_full() else '', result)
-        result = re.sub(r'\[if:breasts_full:([^\]]+)\]',
-                       lambda m: m.group(1) if self._check_breasts_full() else '', result)
-        result = re.sub(r'\[if:stuffed:([^\]]+)\]',
-                       lambda m: m.group(1) if self._check_any_organ_full() else '', result)
-        
-        return result
+        return compile_template(template).render(self)
     
     def _get_race_name(self) -> str:
         race = getattr(self.body, 'race', 'человек')
@@ -113,7 +215,7 @@ class DescriptionParser:
         breasts = list(self.body.breast_grid.all())
         if not breasts:
             return "плоская грудь"
-        max_cup = max(b.cup for b in breasts)
+        max_cup = max((b.cup for b in breasts), key=lambda cup: cup.value)
         return f"{max_cup.name}-cup грудь"
     
     def _get_breast_cup(self) -> str:
@@ -122,7 +224,7 @@ class DescriptionParser:
         breasts = list(self.body.breast_grid.all())
         if not breasts:
             return "AA"
-        return max(b.cup for b in breasts).name
+        return max((b.cup for b in breasts), key=lambda cup: cup.value).name
     
     def _get_breast_state(self) -> str:
         if not self.body.breast_grid:
@@ -370,14 +472,100 @@ class DescriptionParser:
         return self._check_womb_full() or self._check_breasts_full()
 
 
+# ============ КЕШ ОПИСАНИЙ ============
+
+def description_fingerprint(body: Body) -> tuple:
+    """Отпечаток состояния тела для описаний: версия органов и статов плюс внешность."""
+    return (body.version, body.name, getattr(body, 'height', None), body.body_type,
+            body.skin_color, body.skin_texture, body.genital_visibility)
+
+
+class DescriptionCache:
+    """
+    LRU описаний: (тело, стиль) -> (отпечаток, текст).
+
+    Запись с другим отпечатком устарела и пересобирается (считается
+    промахом), поэтому изменения органов сбрасывают кеш сами.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple[int, DescriptionStyle], Tuple[Any, Any, str]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, body: Body, style: DescriptionStyle, fingerprint: Any) -> Optional[str]:
+        key = (id(body), style)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is body and entry[1] == fingerprint:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+
+    def put(self, body: Body, style: DescriptionStyle, fingerprint: Any, text: str) -> None:
+        key = (id(body), style)
+        self._entries[key] = (weakref.ref(body), fingerprint, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, body: Body) -> None:
+        """Убрать все описания тела."""
+        for style in DescriptionStyle:
+            self._entries.pop((id(body), style), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+# Общий кеш движков описаний
+description_cache = DescriptionCache()
+
+
 class AppearanceDescriptionEngine:
     """Генератор текстовых описаний с учетом наполнения органов"""
     
-    def __init__(self, body: Body):
+    def __init__(self, body: Body, cache: Optional[DescriptionCache] = description_cache):
         self.body = body
         self.parser = DescriptionParser(body)
+        # None - без кеша (каждый вызов собирает описание заново)
+        self.cache = cache
         
     def generate(self, style: DescriptionStyle = DescriptionStyle.STANDARD) -> str:
+        cache = self.cache
+        if cache is None:
+            return self._generate(style)
+        fingerprint = description_fingerprint(self.body)
+        text = cache.get(self.body, style, fingerprint)
+        if text is None:
+            text = self._generate(style)
+            cache.put(self.body, style, fingerprint, text)
+        return text
+    
+    def _generate(self, style: DescriptionStyle) -> str:
         if style == DescriptionStyle.BRIEF:
             return self._generate_brief()
         elif style == DescriptionStyle.CLINICAL:
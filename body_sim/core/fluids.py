@@ -3,8 +3,10 @@
 Система жидкостей.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, TYPE_CHECKING
+from array import array
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from body_sim.core.enums import FluidType
@@ -19,12 +21,105 @@ class BreastFluid:
     density: float
 
 
-@dataclass
+# Фиксированный индекс: один слот на каждый член FluidType
+FLUID_ORDER = tuple(FluidType)
+FLUID_INDEX: Dict[FluidType, int] = {ft: i for i, ft in enumerate(FLUID_ORDER)}
+_EMPTY_SLOTS = array('d', bytes(8 * len(FLUID_ORDER)))
+
+
+class FluidComponents(MutableMapping):
+    """
+    Dict-совместимое представление слотов FluidMixture.
+    Пустые (нулевые) слоты считаются отсутствующими ключами.
+    Запись идёт напрямую в массив смеси с поддержкой running total.
+    """
+
+    __slots__ = ("_mixture",)
+
+    def __init__(self, mixture: 'FluidMixture'):
+        self._mixture = mixture
+
+    def __getitem__(self, fluid_type: FluidType) -> float:
+        value = self._mixture._slots[FLUID_INDEX[fluid_type]]
+        if value == 0.0:
+            raise KeyError(fluid_type)
+        return value
+
+    def __setitem__(self, fluid_type: FluidType, value: float) -> None:
+        self._mixture._set(FLUID_INDEX[fluid_type], value)
+
+    def __delitem__(self, fluid_type: FluidType) -> None:
+        idx = FLUID_INDEX[fluid_type]
+        if self._mixture._slots[idx] == 0.0:
+            raise KeyError(fluid_type)
+        self._mixture._set(idx, 0.0)
+
+    def __iter__(self) -> Iterator[FluidType]:
+        slots = self._mixture._slots
+        return (FLUID_ORDER[i] for i in range(len(slots)) if slots[i] != 0.0)
+
+    def __len__(self) -> int:
+        return len(FLUID_ORDER) - self._mixture._slots.count(0.0)
+
+    def __contains__(self, fluid_type: object) -> bool:
+        idx = FLUID_INDEX.get(fluid_type)
+        return idx is not None and self._mixture._slots[idx] != 0.0
+
+    def clear(self) -> None:
+        self._mixture._reset()
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class FluidMixture:
-    components: Dict[FluidType, float] = field(default_factory=dict)
+    """
+    Смесь жидкостей в плоском array('d') с фиксированным индексом FluidType.
+    Хранит running total, поэтому total() - O(1), а пропорциональный
+    remove() - одно масштабирование вектора.
+
+    Каждая мутация увеличивает version; смешанные вязкость и плотность
+    кешируются на таблицу defs и пересчитываются только после изменения
+    состава. Таблицы defs считаются неизменяемыми.
+    """
+
+    __slots__ = ("_slots", "_total", "version", "_rheology")
+
+    def __init__(self, components: Optional[Dict[FluidType, float]] = None):
+        self._slots = array('d', _EMPTY_SLOTS)
+        self._total = 0.0
+        self.version = 0
+        # id(defs) -> (defs, version, viscosity, density)
+        self._rheology: Optional[Dict[int, tuple]] = None
+        if components:
+            for fluid_type, amount in components.items():
+                self._set(FLUID_INDEX[fluid_type], amount)
+
+    @property
+    def components(self) -> FluidComponents:
+        """Dict-совместимый доступ к составу (запись проходит в массив)."""
+        return FluidComponents(self)
+
+    def _set(self, idx: int, value: float) -> None:
+        self._total += value - self._slots[idx]
+        self._slots[idx] = value
+        self.version += 1
+
+    def _reset(self) -> None:
+        self._slots = array('d', _EMPTY_SLOTS)
+        self._total = 0.0
+        self.version += 1
+
+    def _assign(self, raw: bytes, total: float) -> None:
+        """Массовая запись слотов (сырые байты double) - для векторных движков."""
+        slots = array('d')
+        slots.frombytes(raw)
+        self._slots = slots
+        self._total = total
+        self.version += 1
 
     def total(self) -> float:
-        return sum(self.components.values())
+        return self._total
 
     def add(self, fluid: 'FluidType | BreastFluid', amount: float) -> None:
         """Добавить жидкость - принимает enum или объект."""
@@ -32,39 +127,81 @@ class FluidMixture:
             fluid_type = fluid.fluid_type
         else:
             fluid_type = fluid
-        
-        self.components[fluid_type] = self.components.get(fluid_type, 0.0) + amount
 
-    def remove(self, amount: float) -> None:
-        total = self.total()
+        self._slots[FLUID_INDEX[fluid_type]] += amount
+        self._total += amount
+        self.version += 1
+
+    def remove(self, amount: float) -> float:
+        total = self._total
         if total <= 0:
-            return
+            return 0.0
         ratio = amount / total
         actual = min(amount, total)
-        for ft in list(self.components):
-            self.components[ft] -= self.components[ft] * ratio
-            if self.components[ft] <= 0:
-                del self.components[ft]
+        if ratio >= 1.0:
+            self._reset()
+            return actual
+        keep = 1.0 - ratio
+        self._slots = array('d', [v * keep for v in self._slots])
+        self._total = total * keep
+        self.version += 1
         return actual
-    
 
-    def viscosity(self, defs: Dict[FluidType, 'BreastFluid']) -> float:
-        total = self.total()
+    def drain(self) -> Dict[FluidType, float]:
+        """Полностью опустошить смесь. Возвращает удалённый состав."""
+        removed = dict(self.components)
+        self._reset()
+        return removed
+
+    def _blend(self, defs: Dict[FluidType, 'BreastFluid']) -> tuple:
+        """Смешанные (вязкость, плотность) для defs, из кеша если состав не менялся."""
+        cache = self._rheology
+        if cache is None:
+            cache = self._rheology = {}
+        key = id(defs)
+        entry = cache.get(key)
+        if entry is not None and entry[1] == self.version:
+            return entry[2], entry[3]
+
+        viscosity, density = self._compute_rheology(defs)
+        cache[key] = (defs, self.version, viscosity, density)
+        return viscosity, density
+
+    def _compute_rheology(self, defs: Dict[FluidType, 'BreastFluid']) -> tuple:
+        total = self._total
         if total == 0:
-            return 0.0
-        return sum(
-            (v / total) * defs[k].viscosity
-            for k, v in self.components.items()
-        )
-    
+            return 0.0, 1.0
+        slots = self._slots
+        viscosity = 0.0
+        density = 0.0
+        for i in range(len(slots)):
+            amount = slots[i]
+            if amount != 0.0:
+                fluid = defs[FLUID_ORDER[i]]
+                viscosity += amount * fluid.viscosity
+                density += amount * fluid.density
+        return viscosity / total, density / total
+
+    def viscosity(self, defs: Dict[FluidType, 'BreastFluid']) -> float:
+        return self._blend(defs)[0]
+
     def density(self, defs: Dict[FluidType, 'BreastFluid']) -> float:
-        total = self.total()
-        if total == 0:
-            return 1.0
-        return sum(
-            (v / total) * defs[k].density
-            for k, v in self.components.items()
-        )
+        return self._blend(defs)[1]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FluidMixture):
+            return NotImplemented
+        return self._slots == other._slots
+
+    def __repr__(self) -> str:
+        return f"FluidMixture(components={dict(self.components)!r})"
+
+    def __getstate__(self):
+        return (self._slots, self._total, self.version)
+
+    def __setstate__(self, state) -> None:
+        self._slots, self._total, self.version = state
+        self._rheology = None
 
 
 # Дефолтные определения жидкостей
@@ -1,11 +1,11 @@
 from functools import wraps
-from typing import Dict, Any, Optional, Callable, Union
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
-from rich.console import Console
+from typing import Dict, Any, Optional, Callable, Union, TYPE_CHECKING
 import time
 
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.tree import Tree
+
 
 class SexStats:
     """
@@ -242,7 +242,7 @@ class SexStats:
             'history_count': len(self._history)
         }
     
-    def render(self, detailed: bool = False) -> Panel:
+    def render(self, detailed: bool = False) -> 'Panel':
         """
         Рендерит статистику через Rich.
         
@@ -252,6 +252,9 @@ class SexStats:
         Returns:
             Panel с таблицей статистики
         """
+        from rich.panel import Panel
+        from rich.table import Table
+
         table = Table(
             title="[bold magenta]Sex Statistics[/bold magenta]",
             border_style="magenta",
@@ -323,8 +326,10 @@ class SexStats:
             subtitle=f"[dim]Total actions: {summary['total_actions']}[/dim]"
         )
     
-    def render_history(self, limit: int = 10) -> Tree:
+    def render_history(self, limit: int = 10) -> 'Tree':
         """Рендерит последние события как дерево"""
+        from rich.tree import Tree
+
         tree = Tree("[bold cyan]Recent Activity[/bold cyan]")
         
         for event in self._history[-limit:]:
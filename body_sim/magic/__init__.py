@@ -37,14 +37,20 @@ from .skills.hybrid_skills import (
     ProlapseExploit, get_futanari_skills
 )
 
-# UI
-from .ui.magic_render import MagicRenderer, render_magic_comparison
-
 # Интеграция
 from .magic_integration import (
     MagicMixin, register_magic_to_body, MagicalBody
 )
 
+
+def __getattr__(name):
+    # UI на rich - по первому обращению, чтобы тело импортировалось без rich
+    if name in ('MagicRenderer', 'render_magic_comparison'):
+        from .ui import magic_render
+        return getattr(magic_render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # База
     'BaseSkill', 'SkillBook', 'ManaCost', 'SkillEffect',
@@ -2,16 +2,16 @@
 Интеграция магической системы в body_sim.
 Этот файл должен быть импортирован в основной проект.
 """
-from typing import Dict, List, Optional
-from rich.panel import Panel
-from rich.text import Text
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 # Импорты из модуля magic
 from body_sim.magic.fluid_magic import SkillBook
 from body_sim.magic.skills.milk_skills import get_female_skills
 from body_sim.magic.skills.cum_skills import get_male_skills
 from body_sim.magic.skills.hybrid_skills import get_futanari_skills
-from body_sim.magic.ui.magic_render import MagicRenderer
+
+if TYPE_CHECKING:
+    from body_sim.magic.ui.magic_render import MagicRenderer
 
 class MagicMixin:
     """Миксин для добавления магии в класс Body"""
@@ -160,8 +160,9 @@ class MagicMixin:
         
         return result
     
-    def get_magic_renderer(self) -> MagicRenderer:
-        """Получение рендерера"""
+    def get_magic_renderer(self) -> 'MagicRenderer':
+        """Получение рендерера (rich загружается здесь, а не при импорте тела)"""
+        from body_sim.magic.ui.magic_render import MagicRenderer
         return MagicRenderer(self)
 
 
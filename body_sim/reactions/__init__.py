@@ -2,5 +2,8 @@
 
 from .uterus_reactions import get_uterus_reaction_system, register_uterus_reaction_commands
 from .breast_reactions import get_breast_reaction_system, register_breast_reaction_commands
+from .pipeline import ReactionPipeline, PipelineStats, profile_for_body
 
-__all__ = ["get_uterus_reaction_system", "register_uterus_reaction_commands" "get_breast_reaction_system", "register_breast_reaction_commands"]
\ No newline at end of file
+__all__ = ["get_uterus_reaction_system", "register_uterus_reaction_commands",
+           "get_breast_reaction_system", "register_breast_reaction_commands",
+           "ReactionPipeline", "PipelineStats", "profile_for_body"]
@@ -4,12 +4,12 @@
 Поддерживает разные типы персонажей (Roxy, Misaka, и т.д.)
 """
 
-from typing import Dict, List, Callable, Optional, TYPE_CHECKING
+from typing import Dict, List, Callable, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import random
 
-from body_sim.core.enums import BreastEventType
+from body_sim.core.enums import BreastEventType, BreastState, CupSize, LactationState
 
 if TYPE_CHECKING:
     from body_sim.anatomy.breast import Breast
@@ -292,12 +292,26 @@ class MisakaBreastProfile(CharacterReactionProfile):
 
 # ============ СИСТЕМА РЕАКЦИЙ ============
 
+class _BreastRecord:
+    """Состояние груди на прошлом проходе detect_events."""
+    __slots__ = ("version", "state", "cup", "sag", "lactation")
+
+    def __init__(self, version: int, state: BreastState, cup: CupSize,
+                 sag: float, lactation: Optional[LactationState]):
+        self.version = version
+        self.state = state
+        self.cup = cup
+        self.sag = sag
+        self.lactation = lactation
+
+
 class BreastReactionSystem:
     """Система отслеживания и реакции на события груди."""
 
     def __init__(self):
         self.profiles: Dict[str, CharacterReactionProfile] = {}
-        self._last_states: Dict[str, Dict] = {}  # Для отслеживания изменений
+        # (id тела, id груди) -> состояние на прошлом проходе
+        self._last_states: Dict[Tuple[int, str], _BreastRecord] = {}
         self._setup_default_profiles()
 
     def _setup_default_profiles(self):
@@ -315,96 +329,57 @@ class BreastReactionSystem:
         return self.profiles.get(name.lower(), self.profiles["default"])
 
     def detect_events(self, breast: 'Breast', body_id: int, breast_id: str) -> List[BreastEventType]:
-        """Определить произошедшие события."""
-        events = []
-
-        # Безопасно получаем текущее состояние
-        try:
-            current_state = breast.state.name if hasattr(breast, 'state') and breast.state else 'UNKNOWN'
-        except:
-            current_state = 'UNKNOWN'
-
-        try:
-            current_cup = breast.dynamic_cup.name if hasattr(breast, 'dynamic_cup') and breast.dynamic_cup else 'UNKNOWN'
-        except:
-            current_cup = 'UNKNOWN'
+        """
+        Определить произошедшие события.
+
+        Грудь с тем же version, что и на прошлом проходе, не менялась -
+        событий нет, состояние не перечитывается.
+        """
+        key = (body_id, breast_id)
+        last = self._last_states.get(key)
+        version = breast.version
+        if last is not None and last.version == version:
+            return []
 
-        try:
-            current_filled = float(breast.filled) if hasattr(breast, 'filled') else 0.0
-        except:
-            current_filled = 0.0
+        lactation = breast.lactation.state if breast.lactation else None
+        current = _BreastRecord(version, breast.state, breast.dynamic_cup, breast.sag, lactation)
+        self._last_states[key] = current
 
-        try:
-            current_sag = float(breast.sag) if hasattr(breast, 'sag') else 0.0
-        except:
-            current_sag = 0.0
-
-        # Давление - безопасно
-        current_pressure = 0.0
-        if hasattr(breast, 'pressure'):
-            try:
-                from body_sim.core.fluids import FLUID_DEFS
-                current_pressure = breast.pressure(FLUID_DEFS)
-            except:
-                current_pressure = 0.0
-
-        state_data = {
-            'state': current_state,
-            'cup': current_cup,
-            'filled': current_filled,
-            'sag': current_sag,
-            'pressure': current_pressure,
-        }
-
-        key = f"{body_id}_{breast_id}"
-        last = self._last_states.get(key, {})
+        events = []
+        state = current.state
+        last_state = last.state if last is not None else None
 
         # Утечка
-        if current_state == 'LEAKING' and last.get('state') != 'LEAKING':
+        if state == BreastState.LEAKING and last_state != BreastState.LEAKING:
             events.append(BreastEventType.START_LEAKING)
-        elif current_state != 'LEAKING' and last.get('state') == 'LEAKING':
+        elif state != BreastState.LEAKING and last_state == BreastState.LEAKING:
             events.append(BreastEventType.STOP_LEAKING)
 
         # Переполнение
-        if current_state == 'OVERPRESSURED' and last.get('state') != 'OVERPRESSURED':
+        if state == BreastState.OVERPRESSURED and last_state != BreastState.OVERPRESSURED:
             events.append(BreastEventType.OVERPRESSURED)
 
+        if last is None:
+            if current.sag > 0.7:
+                events.append(BreastEventType.HIGH_SAG)
+            if lactation == LactationState.ACTIVE:
+                events.append(BreastEventType.LACTATION_START)
+            return events
+
         # Изменение размера
-        last_cup = last.get('cup')
-        if last_cup and last_cup != 'UNKNOWN' and current_cup != 'UNKNOWN' and last_cup != current_cup:
-            try:
-                from body_sim.core.enums import CupSize
-                old_val = getattr(CupSize, last_cup, CupSize.AA).value
-                new_val = getattr(CupSize, current_cup, CupSize.AA).value
-                if new_val > old_val:
-                    events.append(BreastEventType.CUP_INCREASE)
-                else:
-                    events.append(BreastEventType.CUP_DECREASE)
-            except Exception:
-                pass  # Игнорируем ошибки сравнения
+        if last.cup != current.cup:
+            if current.cup.value > last.cup.value:
+                events.append(BreastEventType.CUP_INCREASE)
+            else:
+                events.append(BreastEventType.CUP_DECREASE)
 
         # Провисание
-        if current_sag > 0.7 and last.get('sag', 0) <= 0.7:
+        if current.sag > 0.7 and last.sag <= 0.7:
             events.append(BreastEventType.HIGH_SAG)
 
         # Лактация
-        if hasattr(breast, 'lactation') and breast.lactation:
-            try:
-                lact_state = breast.lactation.state.name if hasattr(breast.lactation.state, 'name') else str(breast.lactation.state)
-                if lact_state == 'ACTIVE' and last.get('lactation') != 'ACTIVE':
-                    events.append(BreastEventType.LACTATION_START)
-            except:
-                pass
-
-        # Сохраняем состояние
-        state_data['lactation'] = None
-        if hasattr(breast, 'lactation') and breast.lactation:
-            try:
-                state_data['lactation'] = breast.lactation.state.name if hasattr(breast.lactation.state, 'name') else str(breast.lactation.state)
-            except:
-                pass
-
-        self._last_states[key] = state_data
+        if lactation == LactationState.ACTIVE and last.lactation != LactationState.ACTIVE:
+            events.append(BreastEventType.LACTATION_START)
 
         return events
 
@@ -450,7 +425,7 @@ class BreastReactionSystem:
         if body_id is None:
             self._last_states.clear()
         else:
-            keys_to_remove = [k for k in self._last_states.keys() if k.startswith(f"{body_id}_")]
+            keys_to_remove = [k for k in self._last_states if k[0] == body_id]
             for key in keys_to_remove:
                 del self._last_states[key]
 
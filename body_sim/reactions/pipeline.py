@@ -0,0 +1,106 @@
+# body_sim/reactions/pipeline.py
+"""
+Конвейер автоматических реакций: один проход по всем телам за тик.
+
+Системы реакций груди и матки разрешаются один раз при создании,
+профиль тела вычисляется при первой встрече и кешируется (можно
+назначить явно). Проход возвращает список (тело, источник, реакция);
+вывод - забота вызывающего (консоль печатает его одной записью).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import time
+
+from body_sim.reactions.breast_reactions import BreastReactionSystem, get_breast_reaction_system
+from body_sim.reactions.uterus_reactions import UterusReactionSystem, get_uterus_reaction_system
+
+Reaction = Tuple[Any, str, Any]
+
+
+def profile_for_body(body: Any) -> str:
+    """Имя профиля реакций по типу тела (обёртки вроде EventfulBody раскрываются)."""
+    inner = getattr(body, "body", body)
+    body_type = type(inner).__name__.lower()
+    if "roxy" in body_type or "migurdia" in body_type:
+        return "roxy"
+    if "misaka" in body_type:
+        return "misaka"
+    return "default"
+
+
+@dataclass
+class PipelineStats:
+    """Стоимость проходов конвейера."""
+    passes: int = 0
+    bodies: int = 0
+    reactions: int = 0
+    seconds: float = 0.0
+    last_seconds: float = 0.0
+
+    def reset(self) -> None:
+        self.passes = self.bodies = self.reactions = 0
+        self.seconds = self.last_seconds = 0.0
+
+    def report(self) -> Dict[str, Any]:
+        per_pass = 1e6 / self.passes if self.passes else 0.0
+        return {
+            "passes": self.passes,
+            "bodies": self.bodies,
+            "reactions": self.reactions,
+            "total_s": round(self.seconds, 4),
+            "us_per_pass": round(self.seconds * per_pass, 2),
+            "last_us": round(self.last_seconds * 1e6, 2),
+        }
+
+
+class ReactionPipeline:
+    """Реакции груди и матки для набора тел."""
+
+    def __init__(self, breast_system: Optional[BreastReactionSystem] = None,
+                 uterus_system: Optional[UterusReactionSystem] = None):
+        self.breast_system = breast_system or get_breast_reaction_system()
+        self.uterus_system = uterus_system or get_uterus_reaction_system()
+        self.stats = PipelineStats()
+        self._profiles: Dict[int, str] = {}
+
+    def profile(self, body: Any) -> str:
+        key = id(body)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = profile_for_body(body)
+        return profile
+
+    def assign_profile(self, body: Any, profile: str) -> None:
+        self._profiles[id(body)] = profile.lower()
+
+    def forget(self, body: Any) -> None:
+        """Убрать тело: кеш профиля и сохранённые состояния органов."""
+        self._profiles.pop(id(body), None)
+        self.breast_system.clear_state(id(body))
+        self.uterus_system.clear_state(id(body))
+
+    def run(self, bodies: List[Any]) -> List[Reaction]:
+        """Один проход по всем телам."""
+        started = time.perf_counter()
+        collected: List[Reaction] = []
+        breast_system = self.breast_system
+        uterus_system = self.uterus_system
+        profiles = self._profiles
+        for body in bodies:
+            profile = profiles.get(id(body)) or self.profile(body)
+            if getattr(body, "breast_grid", None) is not None:
+                for reaction in breast_system.process_reactions(body, profile):
+                    collected.append((body, "Breast", reaction))
+            if getattr(body, "uterus_system", None):
+                for reaction in uterus_system.process_reactions(body, profile):
+                    collected.append((body, "Uterus", reaction))
+
+        elapsed = time.perf_counter() - started
+        stats = self.stats
+        stats.passes += 1
+        stats.bodies += len(bodies)
+        stats.reactions += len(collected)
+        stats.seconds += elapsed
+        stats.last_seconds = elapsed
+        return collected
@@ -4,13 +4,15 @@
 Поддерживает разные типы персонажей (Roxy, Misaka, и т.д.)
 """
 
-from typing import Dict, List, Callable, Optional, TYPE_CHECKING
+from typing import Dict, List, Callable, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from bisect import bisect_right
+import math
 import random
 
 
-from body_sim.core.enums import UterusEventType
+from body_sim.core.enums import OvaryState, UterusEventType, UterusState
 if TYPE_CHECKING:
     from body_sim.anatomy.uterus import Uterus, Ovary, FallopianTube
     from body_sim.body.body import Body
@@ -294,12 +296,86 @@ class RoxyUterusProfile(CharacterUterusProfile):
 
 # ============ СИСТЕМА РЕАКЦИЙ ============
 
+# Пороги растяжения (по возрастанию) и события уровней; INFLATION_START -
+# строго больше 1.2, поэтому порог - следующее за 1.2 число
+_INFLATION_THRESHOLDS = (math.nextafter(1.2, math.inf), 1.5, 2.0, 2.5, 3.5,
+                         10.0, 50.0, 100.0, 250.0, 500.0)
+_INFLATION_TIERS = (
+    None,
+    UterusEventType.INFLATION_START,
+    UterusEventType.INFLATION_STRETCHED,
+    UterusEventType.INFLATION_DISTENDED,
+    UterusEventType.INFLATION_HYPER,
+    UterusEventType.INFLATION_RISK,
+    UterusEventType.INFLATION_ULTRA,
+    UterusEventType.INFLATION_MEGA,
+    UterusEventType.INFLATION_GIGA,
+    UterusEventType.INFLATION_TERA,
+    UterusEventType.INFLATION_MAX,
+)
+
+# Пороги опущения; выворот - отдельный верхний уровень
+_PROLAPSE_THRESHOLDS = (0.1, 0.3, 0.7)
+_PROLAPSE_TIERS = (
+    None,
+    UterusEventType.PROLAPSE_DESCENDED,
+    UterusEventType.PROLAPSE_PARTIAL,
+    UterusEventType.PROLAPSE_COMPLETE,
+    UterusEventType.PROLAPSE_EVERSIO,
+)
+_PROLAPSE_EVERTED = len(_PROLAPSE_TIERS) - 1
+
+_STATE_EVENTS = {
+    UterusState.EMPTY: UterusEventType.UTERUS_EMPTY,
+    UterusState.NORMAL: UterusEventType.UTERUS_NORMAL,
+    UterusState.TENSE: UterusEventType.UTERUS_TENSE,
+    UterusState.OVERPRESSURED: UterusEventType.UTERUS_OVERPRESSURED,
+    UterusState.LEAKING: UterusEventType.UTERUS_LEAKING,
+}
+
+_OVARY_EVENTS = {
+    OvaryState.EVERTED: UterusEventType.OVARY_EVERTED,
+    OvaryState.PROLAPSED: UterusEventType.OVARY_PROLAPSED,
+    OvaryState.TORSION: UterusEventType.OVARY_TORSION,
+}
+
+
+def inflation_tier(stretch: float) -> int:
+    """Уровень инфляции (индекс в _INFLATION_TIERS)."""
+    return bisect_right(_INFLATION_THRESHOLDS, stretch)
+
+
+def prolapse_tier(descent: float, is_everted: bool) -> int:
+    """Уровень пролапса (индекс в _PROLAPSE_TIERS)."""
+    if is_everted:
+        return _PROLAPSE_EVERTED
+    return bisect_right(_PROLAPSE_THRESHOLDS, descent)
+
+
+class _UterusRecord:
+    """Состояние матки на прошлом проходе detect_events."""
+    __slots__ = ("state", "stretch", "inflation", "prolapse", "ovaries", "tubes")
+
+    def __init__(self, state: Optional[UterusState], stretch: float, inflation: int, prolapse: int,
+                 ovaries: Dict[int, OvaryState], tubes: Dict[int, Tuple[float, bool]]):
+        self.state = state
+        self.stretch = stretch
+        self.inflation = inflation
+        self.prolapse = prolapse
+        self.ovaries = ovaries
+        self.tubes = tubes
+
+
+_NO_RECORD = _UterusRecord(None, 1.0, 0, 0, {}, {})
+
+
 class UterusReactionSystem:
     """Система отслеживания и реакции на события матки."""
 
     def __init__(self):
         self.profiles: Dict[str, CharacterUterusProfile] = {}
-        self._last_states: Dict[str, Dict] = {}
+        # (id тела, id матки) -> состояние на прошлом проходе
+        self._last_states: Dict[Tuple[int, str], _UterusRecord] = {}
         self._setup_default_profiles()
 
     def _setup_default_profiles(self):
@@ -317,166 +393,57 @@ class UterusReactionSystem:
 
     def _get_inflation_event(self, stretch: float) -> Optional[UterusEventType]:
         """Определить событие инфляции по растяжению."""
-        if stretch >= 500.0:
-            return UterusEventType.INFLATION_MAX
-        elif stretch >= 250.0:
-            return UterusEventType.INFLATION_TERA
-        elif stretch >= 100.0:
-            return UterusEventType.INFLATION_GIGA
-        elif stretch >= 50.0:
-            return UterusEventType.INFLATION_MEGA
-        elif stretch >= 10.0:
-            return UterusEventType.INFLATION_ULTRA
-        elif stretch >= 3.5:
-            return UterusEventType.INFLATION_RISK
-        elif stretch >= 2.5:
-            return UterusEventType.INFLATION_HYPER
-        elif stretch >= 2.0:
-            return UterusEventType.INFLATION_DISTENDED
-        elif stretch >= 1.5:
-            return UterusEventType.INFLATION_STRETCHED
-        elif stretch > 1.2:
-            return UterusEventType.INFLATION_START
-        return None
+        return _INFLATION_TIERS[inflation_tier(stretch)]
 
     def _get_prolapse_event(self, descent: float, is_everted: bool) -> Optional[UterusEventType]:
         """Определить событие пролапса."""
-        if is_everted:
-            return UterusEventType.PROLAPSE_EVERSIO
-        elif descent >= 0.7:
-            return UterusEventType.PROLAPSE_COMPLETE
-        elif descent >= 0.3:
-            return UterusEventType.PROLAPSE_PARTIAL
-        elif descent >= 0.1:
-            return UterusEventType.PROLAPSE_DESCENDED
-        return None
+        return _PROLAPSE_TIERS[prolapse_tier(descent, is_everted)]
 
     def detect_events(self, uterus: 'Uterus', body_id: int, uterus_id: str = "0") -> List[UterusEventType]:
-        """Определить произошедшие события."""
-        events = []
-
-        # Безопасно получаем состояние
-        try:
-            current_state = uterus.state.name if hasattr(uterus, 'state') and uterus.state else 'NORMAL'
-        except:
-            current_state = 'NORMAL'
-
-        try:
-            inflation_status = uterus.inflation_status.value if hasattr(uterus, 'inflation_status') else 'normal'
-        except:
-            inflation_status = 'normal'
-
-        # Растяжение
-        total_stretch = 1.0
-        try:
-            wall_stretch = getattr(uterus.walls, 'stretch_ratio', 1.0) if hasattr(uterus, 'walls') else 1.0
-            inflation_ratio = getattr(uterus, 'inflation_ratio', 1.0)
-            total_stretch = wall_stretch * inflation_ratio
-        except:
-            pass
+        """
+        Определить произошедшие события.
+
+        Уровни инфляции и пролапса - индексы в таблицах порогов; событие
+        выдаётся только при переходе на другой уровень.
+        """
+        key = (body_id, uterus_id)
+        last = self._last_states.get(key, _NO_RECORD)
+
+        stretch = uterus.walls.stretch_ratio * uterus.inflation_ratio
+        state = uterus.state
+        inflation = inflation_tier(stretch)
+        prolapse = prolapse_tier(uterus.descent_position, uterus.is_everted)
+        ovaries = {id(ovary): ovary.state for ovary in uterus.ovaries}
+        tubes = {id(tube): (tube.current_stretch, getattr(tube, 'is_everted', False))
+                 for tube in uterus.tubes}
+        self._last_states[key] = _UterusRecord(state, stretch, inflation, prolapse, ovaries, tubes)
 
-        # Пролапс
-        descent = getattr(uterus, 'descent_position', 0.0) or 0.0
-        is_everted = getattr(uterus, 'is_everted', False) or False
-
-        # Жидкость
-        filled = getattr(uterus, 'uterus_filled', 0.0) or 0.0
-
-        key = f"{body_id}_uterus_{uterus_id}"
-        last = self._last_states.get(key, {})
-
-        # Инфляция
-        inflation_event = self._get_inflation_event(total_stretch)
-        last_stretch = last.get('total_stretch', 1.0)
+        events = []
 
-        if inflation_event and total_stretch > last_stretch * 1.1:  # Значительное увеличение
-            # Проверяем, что это новый уровень
-            last_event = self._get_inflation_event(last_stretch)
-            if inflation_event != last_event:
-                events.append(inflation_event)
+        # Инфляция: новый уровень при значительном увеличении
+        if inflation and inflation != last.inflation and stretch > last.stretch * 1.1:
+            events.append(_INFLATION_TIERS[inflation])
 
         # Состояние матки
-        if current_state != last.get('state'):
-            state_map = {
-                'EMPTY': UterusEventType.UTERUS_EMPTY,
-                'NORMAL': UterusEventType.UTERUS_NORMAL,
-                'TENSE': UterusEventType.UTERUS_TENSE,
-                'OVERPRESSURED': UterusEventType.UTERUS_OVERPRESSURED,
-                'LEAKING': UterusEventType.UTERUS_LEAKING,
-            }
-            if current_state in state_map:
-                events.append(state_map[current_state])
+        if state != last.state and state in _STATE_EVENTS:
+            events.append(_STATE_EVENTS[state])
 
         # Пролапс
-        prolapse_event = self._get_prolapse_event(descent, is_everted)
-        last_prolapse = self._get_prolapse_event(
-            last.get('descent', 0.0), 
-            last.get('is_everted', False)
-        )
-        if prolapse_event and prolapse_event != last_prolapse:
-            events.append(prolapse_event)
+        if prolapse and prolapse != last.prolapse:
+            events.append(_PROLAPSE_TIERS[prolapse])
 
         # Яичники
-        for ovary in getattr(uterus, 'ovaries', []):
-            if not ovary:
-                continue
-            # Проверяем состояние яичника
-            try:
-                ovary_state = ovary.state.name if hasattr(ovary, 'state') and ovary.state else 'NORMAL'
-                last_ovary_state = last.get(f'ovary_{id(ovary)}', 'NORMAL')
-
-                if ovary_state != last_ovary_state:
-                    if ovary_state == 'EVERTED':
-                        events.append(UterusEventType.OVARY_EVERTED)
-                    elif ovary_state == 'PROLAPSED':
-                        events.append(UterusEventType.OVARY_PROLAPSED)
-                    elif ovary_state == 'TORSION':
-                        events.append(UterusEventType.OVARY_TORSION)
-            except:
-                pass
+        for ovary_id, ovary_state in ovaries.items():
+            if ovary_state in _OVARY_EVENTS and ovary_state != last.ovaries.get(ovary_id, OvaryState.NORMAL):
+                events.append(_OVARY_EVENTS[ovary_state])
 
         # Трубы
-        for tube in getattr(uterus, 'tubes', []):
-            if not tube:
-                continue
-            try:
-                tube_stretch = getattr(tube, 'current_stretch', 1.0)
-                last_tube_stretch = last.get(f'tube_{id(tube)}', 1.0)
-
-                if tube_stretch >= 2.0 and last_tube_stretch < 2.0:
-                    events.append(UterusEventType.TUBE_STRETCHED)
-
-                if getattr(tube, 'is_everted', False) and not last.get(f'tube_everted_{id(tube)}', False):
-                    events.append(UterusEventType.TUBE_EVERTED)
-            except:
-                pass
-
-        # Сохраняем текущее состояние
-        self._last_states[key] = {
-            'state': current_state,
-            'inflation_status': inflation_status,
-            'total_stretch': total_stretch,
-            'descent': descent,
-            'is_everted': is_everted,
-            'filled': filled,
-        }
-
-        # Сохраняем состояния яичников
-        for ovary in getattr(uterus, 'ovaries', []):
-            if ovary:
-                try:
-                    self._last_states[key][f'ovary_{id(ovary)}'] = ovary.state.name if hasattr(ovary.state, 'name') else str(ovary.state)
-                except:
-                    pass
-
-        # Сохраняем состояния труб
-        for tube in getattr(uterus, 'tubes', []):
-            if tube:
-                try:
-                    self._last_states[key][f'tube_{id(tube)}'] = getattr(tube, 'current_stretch', 1.0)
-                    self._last_states[key][f'tube_everted_{id(tube)}'] = getattr(tube, 'is_everted', False)
-                except:
-                    pass
+        for tube_id, (tube_stretch, tube_everted) in tubes.items():
+            last_stretch, last_everted = last.tubes.get(tube_id, (1.0, False))
+            if tube_stretch >= 2.0 and last_stretch < 2.0:
+                events.append(UterusEventType.TUBE_STRETCHED)
+            if tube_everted and not last_everted:
+                events.append(UterusEventType.TUBE_EVERTED)
 
         return events
 
@@ -516,7 +483,7 @@ class UterusReactionSystem:
         if body_id is None:
             self._last_states.clear()
         else:
-            keys_to_remove = [k for k in self._last_states.keys() if k.startswith(f"{body_id}_")]
+            keys_to_remove = [k for k in self._last_states if k[0] == body_id]
             for key in keys_to_remove:
                 del self._last_states[key]
 
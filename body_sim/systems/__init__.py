@@ -10,9 +10,16 @@ from body_sim.systems.insertion import InsertableObject, InsertionManager
 from body_sim.systems.grid import BreastGrid
 from body_sim.systems.events import (
     EventBus, EventType, Event, 
-    EventHandler, ReactionSystem
+    EventHandler, EventHistory, QueueStats, ReactionSystem
 )
 from body_sim.systems.pressure import PressureSystem, get_pressure_tier
+from body_sim.systems.dormancy import Dormant, DormancyStats, tick_organ, wake_on
+from body_sim.systems.scheduler import MultiRateScheduler, RateTask
+from body_sim.systems.integrator import Integrator, integrate_outflow
+from body_sim.systems.journal import EventJournal, read_journal, replay
+from body_sim.systems.signals import (
+    Emitter, SignalHub, SignalCoalescer, SignalBatch, CoalescedSignal
+)
 
 __all__ = [
     "calc_pressure", "calc_sag_target",
@@ -20,6 +27,11 @@ __all__ = [
     "InflationSystem",
     "InsertableObject", "InsertionManager",
     "BreastGrid",
-    "EventBus", "EventType", "Event", "EventHandler", "ReactionSystem",
+    "EventBus", "EventType", "Event", "EventHandler", "EventHistory", "QueueStats", "ReactionSystem",
     "PressureSystem", "get_pressure_tier",
+    "Dormant", "DormancyStats", "tick_organ", "wake_on",
+    "MultiRateScheduler", "RateTask",
+    "Integrator", "integrate_outflow",
+    "EventJournal", "read_journal", "replay",
+    "Emitter", "SignalHub", "SignalCoalescer", "SignalBatch", "CoalescedSignal",
 ]
@@ -5,18 +5,28 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Tuple, Any, Union
+from typing import Optional, Dict, List, Tuple, Any, Union, TYPE_CHECKING
 from enum import Enum, auto
 import random
 import math
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 from body_sim.systems.penetration import PenetrableOrgan, InsertableObject, PenetrationData
 from body_sim.core.enums import PenetrationDepthZone
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
 
-console = Console()
+
+_console: Optional['Console'] = None
+
+
+def get_console() -> 'Console':
+    """Консоль для предупреждений (rich загружается при первом выводе)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 
@@ -377,7 +387,7 @@ class AdvancedPenetrationEncounter:
         self._diagnostic_check()
         self._init_entry_organ()
         if not self.landmarks:
-            console.print(f"[yellow]Warning: No landmarks for {self.entry_organ}[/yellow]")
+            get_console().print(f"[yellow]Warning: No landmarks for {self.entry_organ}[/yellow]")
 
     def _diagnostic_check(self):
         """Диагностика структуры target_body."""
@@ -557,11 +567,13 @@ class AdvancedPenetrationEncounter:
                 self.landmarks = []
             self.landmarks.sort(key=lambda x: x.depth_cm)
         except Exception as e:
-            console.print(f"[red]Error setting up landmarks: {e}[/red]")
+            get_console().print(f"[red]Error setting up landmarks: {e}[/red]")
             self.landmarks = []
 
-    def get_status_display(self) -> Panel:
+    def get_status_display(self) -> 'Panel':
         """Визуализация статуса."""
+        from rich.panel import Panel
+
         depth = self.state.current_depth
         zone = self.state.current_zone.name
         bar_width = 40
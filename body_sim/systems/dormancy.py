@@ -0,0 +1,181 @@
+# body_sim/systems/dormancy.py
+"""
+Спящие органы: пропуск tick у органов в состоянии покоя.
+
+Орган, у которого тик не изменил ни одного поля rest_key(), находится в
+неподвижной точке: следующий тик с теми же входами (dt, defs, arousal)
+тоже ничего не изменит. Такой орган засыпает и пропускается, пока:
+- не изменятся входы тика (другой dt, другие defs);
+- не изменится rest_key() (любая запись в отслеживаемые поля, в том
+  числе мимо методов органа);
+- не будет вызван wake() - его вызывают мутаторы (add_fluid,
+  insert_object, stimulate, inflate, ...), помеченные через wake_on.
+
+Результат пропуска идентичен обычному тику, поэтому события и
+реакции не меняются.
+
+Счётчик version растёт при вызове мутатора из wake_on, wake(), touch()
+и при тике, после которого rest_key отличается от виденного на прошлом
+тике (сдвиг в самом тике, в медленных подсистемах или прямая запись в
+поля - последние два замечаются не позже следующего тика). Пока version
+тот же, состояние органа не менялось: наблюдатели (рендер, реакции,
+описания) могут кешировать по (орган, version).
+"""
+
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class Dormant:
+    """
+    Миксин органа, умеющего засыпать.
+
+    Подклассы переопределяют rest_key(): кортеж всех полей, которые
+    читает или пишет tick. None - орган никогда не засыпает.
+    """
+
+    # (входы тика, rest_key, результат тика) на момент засыпания
+    _rest: Optional[Tuple[Any, tuple, Any]] = None
+    _version: int = 0
+    # rest_key после последнего тика (для version)
+    _seen: Optional[tuple] = None
+
+    def rest_key(self) -> Optional[tuple]:
+        return None
+
+    @property
+    def is_dormant(self) -> bool:
+        return self._rest is not None
+
+    @property
+    def version(self) -> int:
+        """Номер изменения органа (растёт при любом возможном изменении состояния)."""
+        return self._version
+
+    def touch(self) -> None:
+        """Отметить изменение состояния мимо тика (не будит орган)."""
+        self._version += 1
+
+    def wake(self) -> None:
+        """Разбудить орган: следующий тик будет выполнен полностью."""
+        self._rest = None
+        self._version += 1
+
+    def cycle_key(self) -> Optional[tuple]:
+        """
+        Полное состояние для поиска предельного цикла (Body.fast_forward).
+
+        По умолчанию rest_key; органы, чей rest_key видит только объём
+        жидкости, добавляют её состав.
+        """
+        return self.rest_key()
+
+    def can_fast_forward(self) -> bool:
+        """Можно ли перемотать орган за O(1) (Body.fast_forward): по умолчанию - спящий."""
+        return self.is_dormant
+
+    def fast_forward(self, duration: float, dt: float = 1.0) -> None:
+        """Перемотка органа в покое; у спящего органа без медленных подсистем ничего не меняется."""
+
+
+def wake_on(*names: str) -> Callable[[type], type]:
+    """Декоратор класса: перечисленные методы будят орган перед вызовом."""
+    def decorate(cls: type) -> type:
+        for name in names:
+            method = getattr(cls, name)
+            if getattr(method, "_wakes", False):
+                continue
+
+            def make(method: Callable) -> Callable:
+                @wraps(method)
+                def wrapper(self, *args, **kwargs):
+                    self._rest = None
+                    self._version += 1
+                    return method(self, *args, **kwargs)
+                wrapper._wakes = True
+                return wrapper
+
+            setattr(cls, name, make(method))
+        return cls
+    return decorate
+
+
+@dataclass
+class DormancyStats:
+    """Счётчики выполненных и пропущенных тиков органов."""
+    ticked: int = 0
+    skipped: int = 0
+    skipped_by_kind: Dict[str, int] = field(default_factory=dict)
+    enabled: bool = True
+
+    @property
+    def skip_ratio(self) -> float:
+        total = self.ticked + self.skipped
+        return self.skipped / total if total else 0.0
+
+    def skip(self, organ: Any) -> None:
+        self.skipped += 1
+        kind = type(organ).__name__
+        self.skipped_by_kind[kind] = self.skipped_by_kind.get(kind, 0) + 1
+
+    def reset(self) -> None:
+        self.ticked = self.skipped = 0
+        self.skipped_by_kind.clear()
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "organ_ticks": self.ticked,
+            "organ_ticks_skipped": self.skipped,
+            "skip_ratio": round(self.skip_ratio, 4),
+            "skipped_by_kind": dict(self.skipped_by_kind),
+        }
+
+
+def is_resting(organ: Dormant, inputs: Any, key: Optional[tuple]) -> bool:
+    """Спит ли орган при данных входах и текущем rest_key."""
+    rest = organ._rest
+    return key is not None and rest is not None and rest[0] == inputs and rest[1] == key
+
+
+def settle(organ: Dormant, inputs: Any, key: Optional[tuple], result: Any) -> None:
+    """После тика: усыпить орган, если rest_key не изменился (key - значение до тика)."""
+    if key is None:
+        organ._rest = None
+        organ._version += 1
+        return
+    after = organ.rest_key()
+    if after == key:
+        organ._rest = (inputs, key, result)
+    else:
+        organ._rest = None
+    if after != organ._seen:
+        organ._seen = after
+        organ._version += 1
+
+
+def tick_organ(organ: Dormant, inputs: Any, tick: Callable[..., Any], *args: Any,
+               stats: Optional[DormancyStats] = None) -> Any:
+    """
+    Выполнить tick(*args) органа или пропустить его, если орган спит.
+
+    inputs - всё, от чего тик зависит помимо состояния органа
+    (обычно dt). Возвращает результат тика (у спящего - сохранённый).
+    """
+    if stats is not None and not stats.enabled:
+        organ._rest = None
+        organ._version += 1
+        stats.ticked += 1
+        return tick(*args)
+
+    key = organ.rest_key()
+    if is_resting(organ, inputs, key):
+        if stats is not None:
+            stats.skip(organ)
+        return organ._rest[2]
+
+    result = tick(*args)
+    if stats is not None:
+        stats.ticked += 1
+    settle(organ, inputs, key, result)
+    return result
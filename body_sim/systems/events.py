@@ -4,14 +4,25 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Callable, Any, Optional, Set
-from datetime import datetime
-import uuid
+from typing import Deque, Dict, Iterator, List, Callable, Any, Optional, Set, Tuple
+from collections import deque
+import bisect
+import heapq
+import itertools
+import time
 
 from body_sim.core.enums import EventType, Sex
 
 
-@dataclass
+_event_ids = itertools.count(1)
+
+
+def _next_event_id() -> str:
+    """Монотонный номер события (8 hex-цифр, как прежний обрезанный uuid4)."""
+    return f"{next(_event_ids):08x}"
+
+
+@dataclass(slots=True)
 class Event:
     event_type: EventType
     source_id: str
@@ -19,7 +30,7 @@ class Event:
     timestamp: float
     intensity: float = 1.0
     data: Dict[str, Any] = field(default_factory=dict)
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    event_id: str = field(default_factory=_next_event_id)
     
     def __post_init__(self):
         if 'timestamp' not in self.data:
@@ -34,6 +45,8 @@ class EventHandler:
     condition: Optional[Callable[[Event], bool]] = None
     once: bool = False
     active: bool = True
+    # (-priority, номер подписки): порядок вызова в корзинах EventBus
+    order: Tuple[int, int] = field(default=(0, 0), repr=False, compare=False)
     
     def should_handle(self, event: Event) -> bool:
         if not self.active:
@@ -45,11 +58,182 @@ class EventHandler:
         return True
 
 
+class EventHistory:
+    """
+    Последние capacity событий: кольцевой буфер и индексы по типу и
+    источнику (номера событий по возрастанию).
+
+    Добавление O(1): вытесняемое событие - самое старое, поэтому его
+    номер стоит первым в очередях своего типа и источника.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._capacity = capacity
+        self._ring: List[Optional[Event]] = [None] * capacity
+        self._next = 0
+        self._by_type: Dict[EventType, Deque[int]] = {}
+        self._by_source: Dict[Optional[str], Deque[int]] = {}
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def resize(self, capacity: int) -> None:
+        """Изменить ёмкость (сохраняются последние события)."""
+        events = list(self)[-capacity:] if capacity > 0 else []
+        self.__init__(capacity)
+        for event in events:
+            self.append(event)
+
+    def clear(self) -> None:
+        self.__init__(self._capacity)
+
+    def __len__(self) -> int:
+        return min(self._next, self._capacity)
+
+    def __iter__(self) -> Iterator[Event]:
+        for seq in range(self._next - len(self), self._next):
+            yield self._ring[seq % self._capacity]
+
+    def __getitem__(self, index: int) -> Event:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("event history index out of range")
+        return self._ring[(self._next - size + index) % self._capacity]
+
+    def append(self, event: Event) -> None:
+        seq = self._next
+        slot = seq % self._capacity
+        old = self._ring[slot]
+        if old is not None:
+            self._evict(self._by_type, old.event_type)
+            self._evict(self._by_source, old.source_id)
+        self._ring[slot] = event
+        self._next = seq + 1
+        self._index(self._by_type, event.event_type, seq)
+        self._index(self._by_source, event.source_id, seq)
+
+    @staticmethod
+    def _index(index: Dict[Any, Deque[int]], key: Any, seq: int) -> None:
+        seqs = index.get(key)
+        if seqs is None:
+            seqs = index[key] = deque()
+        seqs.append(seq)
+
+    @staticmethod
+    def _evict(index: Dict[Any, Deque[int]], key: Any) -> None:
+        seqs = index[key]
+        seqs.popleft()
+        if not seqs:
+            del index[key]
+
+    def query(self, event_type: Optional[EventType] = None,
+              source_id: Optional[str] = None, limit: int = 100) -> List[Event]:
+        """Последние limit событий (по времени) с фильтром; limit <= 0 - все."""
+        if event_type and source_id:
+            by_type = self._by_type.get(event_type, ())
+            by_source = self._by_source.get(source_id, ())
+            if len(by_type) <= len(by_source):
+                seqs, match = by_type, (lambda e: e.source_id == source_id)
+            else:
+                seqs, match = by_source, (lambda e: e.event_type == event_type)
+        elif event_type:
+            seqs, match = self._by_type.get(event_type, ()), None
+        elif source_id:
+            seqs, match = self._by_source.get(source_id, ()), None
+        else:
+            seqs, match = range(self._next - len(self), self._next), None
+
+        ring, capacity = self._ring, self._capacity
+        found: List[Event] = []
+        for seq in reversed(seqs):
+            event = ring[seq % capacity]
+            if match is None or match(event):
+                found.append(event)
+                if len(found) == limit:
+                    break
+        found.reverse()
+        return found
+
+
+@dataclass
+class QueueStats:
+    """Счётчики очереди EventBus в режиме queued."""
+    enqueued: int = 0
+    dispatched: int = 0
+    dropped: int = 0
+    peak_depth: int = 0
+    flushes: int = 0
+
+    def report(self) -> Dict[str, int]:
+        return {
+            "enqueued": self.enqueued,
+            "dispatched": self.dispatched,
+            "dropped": self.dropped,
+            "peak_depth": self.peak_depth,
+            "flushes": self.flushes,
+        }
+
+
+def _handler_order(handler: EventHandler) -> Tuple[int, int]:
+    return handler.order
+
+
 class EventBus:
-    def __init__(self):
+    """
+    Шина событий.
+
+    Обработчики лежат в корзинах по EventType, отсортированных по
+    убыванию приоритета (при равном - в порядке подписки): emit
+    перебирает только обработчики своего типа. Корзины не меняются на
+    месте - подписка и отписка внутри обработчика не сбивают текущую
+    рассылку. event_types обработчика фиксируются при подписке.
+
+    clock - источник timestamp для emit_simple (по умолчанию time.time;
+    можно передать часы симуляции). Событие типа без подписчиков при
+    шине без синков не создаётся вовсе - wants() не учитывает историю,
+    поэтому event_history (record_history, по умолчанию включена)
+    хранит только события, которые кому-то нужны, и переданные в emit
+    напрямую.
+
+    queued=True - отложенная рассылка: emit только ставит событие в
+    очередь (не больше max_queue, лишние отбрасываются и считаются в
+    queue_stats.dropped), обработчики вызываются в flush(). Порядок
+    рассылки детерминирован: по приоритету старшего обработчика типа,
+    при равном - в порядке emit. События, выпущенные обработчиками во
+    время flush, встают в ту же очередь - без рекурсии и реентерабельности.
+
+    Синки (add_sink, например systems.journal.EventJournal) получают
+    каждое событие в момент emit, независимо от типа и подписчиков.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, record_history: bool = True,
+                 queued: bool = False, max_queue: int = 10000):
+        self.clock = clock
+        self.record_history = record_history
+        self.queued = queued
+        self.max_queue = max_queue
+        self.queue_stats = QueueStats()
+        self._queue: List[Tuple[int, int, Event]] = []
+        self._queue_seq = itertools.count()
+        self._flushing = False
+        self._sinks: List[Callable[[Event], None]] = []
         self.handlers: List[EventHandler] = []
-        self.event_history: List[Event] = []
-        self.max_history = 1000
+        self._by_type: Dict[EventType, List[EventHandler]] = {}
+        self._subscriptions = itertools.count()
+        self.event_history = EventHistory(1000)
+    
+    @property
+    def max_history(self) -> int:
+        return self.event_history.capacity
+    
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        self.event_history.resize(value)
     
     def subscribe(self, event_types: List[EventType],
                   callback: Callable[[Event], None],
@@ -61,23 +245,88 @@ class EventBus:
             callback=callback,
             priority=priority,
             condition=condition,
-            once=once
+            once=once,
+            order=(-priority, next(self._subscriptions)),
         )
-        self.handlers.append(handler)
-        self.handlers.sort(key=lambda h: h.priority, reverse=True)
+        bisect.insort(self.handlers, handler, key=_handler_order)
+        for event_type in handler.event_types:
+            bucket = list(self._by_type.get(event_type, ()))
+            bisect.insort(bucket, handler, key=_handler_order)
+            self._by_type[event_type] = bucket
         return handler
     
     def unsubscribe(self, handler: EventHandler) -> None:
-        if handler in self.handlers:
-            self.handlers.remove(handler)
+        for i, h in enumerate(self.handlers):
+            if h is handler:
+                del self.handlers[i]
+                break
+        else:
+            return
+        for event_type in handler.event_types:
+            bucket = [h for h in self._by_type.get(event_type, ()) if h is not handler]
+            if bucket:
+                self._by_type[event_type] = bucket
+            else:
+                self._by_type.pop(event_type, None)
+    
+    def add_sink(self, sink: Callable[[Event], None]) -> None:
+        self._sinks.append(sink)
+    
+    def remove_sink(self, sink: Callable[[Event], None]) -> None:
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+    
+    def wants(self, event_type: EventType) -> bool:
+        """Нужно ли кому-то событие этого типа (подписчики или синки; история не в счёт)."""
+        return bool(self._sinks) or event_type in self._by_type
     
     def emit(self, event: Event) -> None:
-        self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
-        
+        if self.record_history:
+            self.event_history.append(event)
+        for sink in self._sinks:
+            sink(event)
+        if self.queued:
+            self._enqueue(event)
+        else:
+            self._dispatch(event)
+    
+    def _enqueue(self, event: Event) -> None:
+        bucket = self._by_type.get(event.event_type)
+        if not bucket:
+            return
+        stats = self.queue_stats
+        if len(self._queue) >= self.max_queue:
+            stats.dropped += 1
+            return
+        heapq.heappush(self._queue, (bucket[0].order[0], next(self._queue_seq), event))
+        stats.enqueued += 1
+        if len(self._queue) > stats.peak_depth:
+            stats.peak_depth = len(self._queue)
+    
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+    
+    def flush(self, max_events: Optional[int] = None) -> int:
+        """Разослать события очереди (не больше max_events). Возвращает число разосланных."""
+        if self._flushing:
+            return 0
+        self._flushing = True
+        dispatched = 0
+        try:
+            queue = self._queue
+            while queue and (max_events is None or dispatched < max_events):
+                self._dispatch(heapq.heappop(queue)[2])
+                dispatched += 1
+        finally:
+            self._flushing = False
+            self.queue_stats.dispatched += dispatched
+            self.queue_stats.flushes += 1
+        return dispatched
+    
+    def _dispatch(self, event: Event) -> None:
         handled_once = []
-        for handler in self.handlers:
+        for handler in self._by_type.get(event.event_type, ()):
             if handler.should_handle(event):
                 try:
                     handler.callback(event)
@@ -92,25 +341,14 @@ class EventBus:
     def emit_simple(self, event_type: EventType, source_id: str,
                    target_id: Optional[str] = None,
                    intensity: float = 1.0, **data) -> None:
-        event = Event(
-            event_type=event_type,
-            source_id=source_id,
-            target_id=target_id,
-            timestamp=datetime.now().timestamp(),
-            intensity=intensity,
-            data=data
-        )
-        self.emit(event)
+        if not self.wants(event_type):
+            return
+        self.emit(Event(event_type, source_id, target_id, self.clock(), intensity, data))
     
     def get_history(self, event_type: Optional[EventType] = None,
                    source_id: Optional[str] = None,
                    limit: int = 100) -> List[Event]:
-        filtered = self.event_history
-        if event_type:
-            filtered = [e for e in filtered if e.event_type == event_type]
-        if source_id:
-            filtered = [e for e in filtered if e.source_id == source_id]
-        return filtered[-limit:]
+        return self.event_history.query(event_type, source_id, limit)
 
 
 class ReactionSystem:
@@ -207,20 +445,23 @@ class EventfulBody:
     
     def tick(self, dt: float) -> None:
         self.body.tick(dt)
+        self.event_bus.flush()
     
     def stimulate(self, region: str, index: int = 0, intensity: float = 0.1) -> None:
         self.body.stimulate(region, index, intensity)
-        self.event_bus.emit_simple(
-            EventType.STIMULATION,
-            self.body.name,
-            intensity=intensity,
-            region=region,
-            index=index,
-            body=self.body
-        )
+        bus = self.event_bus
+        if bus.wants(EventType.STIMULATION):
+            bus.emit_simple(
+                EventType.STIMULATION,
+                self.body.name,
+                intensity=intensity,
+                region=region,
+                index=index,
+                body=self.body
+            )
         
-        if region == "vagina" and intensity > 0.7:
-            self.event_bus.emit_simple(
+        if region == "vagina" and intensity > 0.7 and bus.wants(EventType.PENETRATION_DEEP):
+            bus.emit_simple(
                 EventType.PENETRATION_DEEP,
                 self.body.name,
                 intensity=intensity,
@@ -230,7 +471,7 @@ class EventfulBody:
     
     def penetrate(self, target_region: str, target_index: int, penis_index: int = 0) -> bool:
         success = self.body.penetrate(target_region, target_index, penis_index)
-        if success:
+        if success and self.event_bus.wants(EventType.PENETRATION_START):
             self.event_bus.emit_simple(
                 EventType.PENETRATION_START,
                 self.body.name,
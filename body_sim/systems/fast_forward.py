@@ -0,0 +1,137 @@
+# body_sim/systems/fast_forward.py
+"""
+Перемотка времени: закрытые формы для процессов первого порядка.
+
+Восстановление и спад в тиках органов записаны малыми приращениями.
+Долгий простой ("пропустить N часов") требует тысяч тиков, а один тик
+с большим dt проскакивает пороги (max/min применяются только в конце
+шага). Функции модуля дают результат n шагов dt за O(1):
+
+- линейный спад до порога - точно (max(floor, x - step * n));
+- геометрическая релаксация x' = x * (1 - k * dt) - через степень;
+- упругопластическое восстановление стенок - линейная фаза, пока
+  упругая часть больше шага, затем геометрическая.
+
+Body.fast_forward применяет их, когда органы в покое, и шагает обычным
+tick_organs, пока активны утечки, лактация и события. Группа, которая не
+успокаивается, а ходит по кругу (слюна -> глотание -> рефлюкс -> рот),
+перематывается через CycleDetector: целые периоды пропускаются.
+"""
+
+from collections import deque
+import math
+from typing import Any, Dict, Hashable, Tuple
+
+
+def split_steps(duration: float, dt: float) -> Tuple[int, float]:
+    """Число целых шагов dt в duration и остаток (0.0, если его нет)."""
+    if dt <= 0:
+        raise ValueError(f"dt must be positive, got {dt}")
+    if duration < 0:
+        raise ValueError(f"duration must be non-negative, got {duration}")
+    steps = math.floor(duration / dt + 1e-9)
+    rest = duration - steps * dt
+    return steps, (rest if rest > dt * 1e-9 else 0.0)
+
+
+def steps_until_below(value: float, step: float, threshold: float) -> int:
+    """Сколько шагов `if value > threshold: value -= step` до value <= threshold."""
+    if value <= threshold or step <= 0:
+        return 0
+    return math.ceil((value - threshold) / step)
+
+
+def elastic_recovery(excess: float, plasticity: float, step: float, steps: int) -> float:
+    """
+    Растяжение сверх 1.0 после steps вызовов восстановления стенки.
+
+    Один вызов: упругая часть excess * (1 - plasticity) уменьшается на
+    step (не ниже 0), пластическая остаётся. Пока упругая часть не меньше
+    step, excess убывает линейно на step; потом остаётся только
+    пластическая часть - excess умножается на plasticity.
+    """
+    if excess <= 0 or steps <= 0 or step <= 0:
+        return excess
+    elastic_share = 1.0 - plasticity
+    linear = 0
+    if elastic_share > 0 and excess * elastic_share >= step:
+        linear = min(steps, math.floor((excess * elastic_share - step) / (elastic_share * step)) + 1)
+    excess -= step * linear
+    return excess * plasticity ** (steps - linear)
+
+
+def keys_close(a: Any, b: Any, rel_tol: float) -> bool:
+    """Равенство ключей состояния с допуском rel_tol на числа с плавающей точкой."""
+    if a == b:
+        return True
+    if type(a) is float and type(b) is float:
+        return abs(a - b) <= rel_tol * max(abs(a), abs(b))
+    if type(a) is tuple and type(b) is tuple:
+        return len(a) == len(b) and all(keys_close(x, y, rel_tol) for x, y in zip(a, b))
+    return False
+
+
+def _coarse(key: Any, digits: int) -> Any:
+    """Ключ с числами, округлёнными до digits знаков после запятой (для хеша)."""
+    if type(key) is float:
+        return round(key, digits)
+    if type(key) is tuple:
+        return tuple(_coarse(item, digits) for item in key)
+    return key
+
+
+class CycleDetector:
+    """
+    Поиск предельного цикла по ключам состояния, по одному на шаг.
+
+    Детерминированная система с постоянными входами, полное состояние
+    которой повторилось через P шагов, дальше ходит по кругу с периодом P.
+    Период засчитывается после 2P совпадений подряд - страховка от
+    ключа, в который попало не всё состояние.
+
+    Цикл в числах с плавающей точкой повторяется не бит в бит: бегущие
+    суммы уходят на ulp за период. Поэтому числа сравниваются с допуском
+    rel_tol (погрешность перемотки - порядка rel_tol за период, а не за
+    всю перемотку). Кандидат в период - последний шаг с тем же
+    огрублённым ключом (digits знаков после запятой): O(1) на шаг при
+    любом max_period.
+    """
+
+    def __init__(self, max_period: int = 64, rel_tol: float = 1e-12, digits: int = 9):
+        self.max_period = max_period
+        self.rel_tol = rel_tol
+        self.digits = digits
+        self._keys: deque = deque(maxlen=3 * max_period)
+        self._coarse_keys: deque = deque(maxlen=3 * max_period)
+        # огрублённый ключ -> последний шаг с ним (только шаги из окна _keys)
+        self._last: Dict[Hashable, int] = {}
+        self._step = 0
+
+    @classmethod
+    def for_dt(cls, dt: float, window: float = 64.0) -> 'CycleDetector':
+        """Детектор для шага dt: периоды до window единиц времени (window / dt шагов)."""
+        return cls(max(1, math.ceil(window / dt - 1e-9)))
+
+    def push(self, key: Hashable) -> int:
+        """Ключ очередного шага; период найденного цикла или 0."""
+        keys, coarse_keys, last = self._keys, self._coarse_keys, self._last
+        step = self._step
+        self._step += 1
+        if len(keys) == keys.maxlen:
+            evicted = coarse_keys[0]
+            if last.get(evicted) == step - len(keys):
+                del last[evicted]
+        coarse = _coarse(key, self.digits)
+        keys.append(key)
+        coarse_keys.append(coarse)
+        seen = last.get(coarse)
+        last[coarse] = step
+        if seen is None:
+            return 0
+        period = step - seen
+        if period > self.max_period or 3 * period > len(keys):
+            return 0
+        rel_tol = self.rel_tol
+        if all(keys_close(keys[-1 - i], keys[-1 - i - period], rel_tol) for i in range(2 * period)):
+            return period
+        return 0
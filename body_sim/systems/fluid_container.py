@@ -1,7 +1,10 @@
 # body_sim/systems/fluid_container.py
 from typing import Dict, Optional
+import math
 from body_sim.core.fluids import FluidMixture, FLUID_DEFS
 from body_sim.core.enums import FluidType
+from body_sim.systems.fast_forward import split_steps
+from body_sim.systems.integrator import Integrator, integrate_outflow
 
 class FluidContainer:
     """
@@ -23,6 +26,7 @@ class FluidContainer:
         self.inflation_ratio = 1.0
         self.leaking_factor = 0.02
         self.is_leaking = False
+        self.leak_integrator = Integrator.EXPLICIT
         
     @property
     def filled(self) -> float:
@@ -69,12 +73,14 @@ class FluidContainer:
             
         if fluid_type:
             # Удаляем конкретный тип напрямую из components
-            if fluid_type in self.contents.components:
-                available = self.contents.components[fluid_type]
+            components = self.contents.components
+            if fluid_type in components:
+                available = components[fluid_type]
                 to_remove = min(amount, available)
-                self.contents.components[fluid_type] -= to_remove
-                if self.contents.components[fluid_type] <= 0.01:
-                    del self.contents.components[fluid_type]
+                components[fluid_type] = available - to_remove
+                # Обнулённый слот в components отсутствует: get, а не []
+                if components.get(fluid_type, 0.0) <= 0.01:
+                    components.pop(fluid_type, None)
                 self._update_state()
                 return to_remove
             return 0.0
@@ -124,21 +130,50 @@ class FluidContainer:
     def _update_state(self):
         """Обновление давления и флага утечки"""
         fill_ratio = self.filled / self.max_volume if self.max_volume > 0 else 0
-        
-        if fill_ratio > 0.8:
-            self.pressure = ((fill_ratio - 0.8) / 0.2) ** 2
-        else:
-            self.pressure = 0.0
-            
+        self.pressure = self._pressure_at(fill_ratio)
         self.is_leaking = fill_ratio > 0.95
+    
+    @staticmethod
+    def _pressure_at(fill_ratio: float) -> float:
+        if fill_ratio > 0.8:
+            return ((fill_ratio - 0.8) / 0.2) ** 2
+        return 0.0
         
     def tick(self, dt: float = 1.0):
         """Утечка при переполнении и восстановление формы"""
         if self.is_leaking and self.pressure > 0 and self.filled > 0:
-            leak_amount = self.pressure * self.leaking_factor * self.filled * dt
+            max_volume = self.max_volume
+            
+            def flow(volume: float) -> float:
+                fill_ratio = volume / max_volume
+                if fill_ratio <= 0.95:
+                    return 0.0
+                return self._pressure_at(fill_ratio) * self.leaking_factor * volume
+            
+            leak_amount = integrate_outflow(self.filled, flow, dt, self.leak_integrator)
             self.remove_fluid(leak_amount)
             self.leakage += leak_amount
             
         if self.inflation_ratio > 1.0 and self.fill_percentage < 70:
             self.deflate(0.05 * dt)
+
+    def fast_forward(self, duration: float, dt: float = 1.0):
+        """
+        tick(dt) за duration: утечка шагается, спад инфляции - в закрытой форме.
+
+        deflate(0.05 * dt) идёт, пока заполнение ниже 70%, то есть пока
+        inflation_ratio выше filled / (0.7 * base_volume) и выше 1.0.
+        """
+        steps, rest = split_steps(duration, dt)
+        while steps and self.is_leaking and self.pressure > 0 and self.filled > 0:
+            self.tick(dt)
+            steps -= 1
+        
+        if steps and self.inflation_ratio > 1.0 and self.base_volume > 0:
+            floor = max(1.0, self.filled / (0.7 * self.base_volume))
+            if self.inflation_ratio > floor:
+                applied = min(steps, math.ceil((self.inflation_ratio - floor) / (0.05 * dt)))
+                self.deflate(0.05 * dt * applied)
+        if rest:
+            self.tick(rest)
             
\ No newline at end of file
@@ -6,6 +6,9 @@
 from typing import List, Optional, Callable, Dict, Any, TYPE_CHECKING
 import random
 
+from body_sim.systems.dormancy import DormancyStats, tick_organ
+from body_sim.systems.signals import SignalHub
+
 if TYPE_CHECKING:
     from body_sim.anatomy.breast import Breast
     from body_sim.core.fluids import BreastFluid
@@ -18,8 +21,12 @@ class BreastGrid:
         rows: List[List['Breast']],
         labels: Optional[List[List[str]]] = None,
         randomize_cups: bool = False,
+        vectorized: bool = False,
     ):
         self.rows: List[List['Breast']] = rows
+        self._soa = None
+        self.signals = SignalHub()
+        self.attach_signals()
 
         if labels is None:
             self.labels = [
@@ -32,6 +39,21 @@ class BreastGrid:
         if randomize_cups:
             self._randomize_row_cups()
 
+        if vectorized:
+            self.set_vectorized(True)
+
+    @property
+    def vectorized(self) -> bool:
+        return self._soa is not None
+
+    def set_vectorized(self, enabled: bool = True) -> None:
+        """Включить/выключить SoA-движок (требует numpy)."""
+        if enabled:
+            from body_sim.systems.grid_soa import SoABreastEngine
+            self._soa = SoABreastEngine(self)
+        else:
+            self._soa = None
+
     def _randomize_row_cups(self) -> None:
         from body_sim.core.enums import CupSize
         
@@ -52,9 +74,14 @@ class BreastGrid:
     def get_label(self, row: int, col: int) -> str:
         return self.labels[row][col]
 
-    def tick_all(self, defs: Dict['FluidType', 'BreastFluid'], dt: float = 1.0) -> List[List[Dict[str, Any]]]:
+    def tick_all(self, defs: Dict['FluidType', 'BreastFluid'], dt: float = 1.0,
+                 stats: Optional[DormancyStats] = None) -> List[List[Dict[str, Any]]]:
+        """Тик всех грудей; спящие (см. systems.dormancy) пропускаются."""
+        if self._soa is not None:
+            return self._soa.tick(defs, dt, stats)
+        inputs = (dt, id(defs))
         return [
-            [b.tick(defs, dt) for b in row]
+            [tick_organ(b, inputs, b.tick, defs, dt, stats=stats) for b in row]
             for row in self.rows
         ]
 
@@ -119,9 +146,16 @@ class BreastGrid:
         
         return {"total_removed": total_removed, "percentage": percentage}
 
-    def on_all(self, event: str, callback: Callable[..., Any]) -> None:
+    def attach_signals(self, parent: Optional[SignalHub] = None) -> None:
+        """Направить сигналы грудей в self.signals (и дальше в parent)."""
+        if parent is not None:
+            self.signals.parent = parent
         for b in self.all():
-            b.on(event, callback)
+            b._hub = self.signals
+
+    def on_all(self, event: str, callback: Callable[..., Any]) -> None:
+        """Подписка на событие всех грудей сетки одним обработчиком."""
+        self.signals.on(event, callback)
 
     def stats(self) -> Dict[str, Any]:
         breasts = self.all()
@@ -0,0 +1,560 @@
+# body_sim/systems/grid_soa.py
+"""
+Векторизованный (structure-of-arrays) движок для BreastGrid.
+
+Собирает состояние всех грудей сетки в колонки NumPy, продвигает всю
+сетку одним проходом по той же математике, что и Breast.tick, и
+записывает результат обратно в объекты Breast. Объекты остаются
+публичным представлением: add_to_all, drain_all, stats() и подписки
+через on()/on_all() работают как раньше, события те же.
+
+Груди, для которых векторный путь не гарантирует идентичный результат
+(лактация упирается в объём и требует авто-инфляции, в смеси есть
+жидкость без записи в defs, утечка с неявной или адаптивной схемой
+leak_integrator), тикаются обычным Breast.tick.
+
+NumPy - необязательная зависимость (pip install numpy): модуль
+импортируется и без неё, а SoABreastEngine (BreastGrid.set_vectorized)
+бросает ImportError.
+"""
+
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from body_sim.core.enums import CupSize, BreastState, LactationState, PressureTier, FluidType
+from body_sim.core.fluids import FLUID_ORDER, FLUID_INDEX
+from body_sim.core.constants import SAG_SIZE_FACTOR, PRESSURE_LEAK_MIN, PRESSURE_TIER_HIGH, PRESSURE_TIER_CRITICAL
+from body_sim.core.constants import GAPE_OPEN_SPEED, GAPE_CLOSE_SPEED
+from body_sim.systems.pressure import PressureSystem
+from body_sim.systems.dormancy import DormancyStats, is_resting, settle
+from body_sim.systems.integrator import Integrator
+
+if TYPE_CHECKING:
+    from body_sim.anatomy.breast import Breast
+    from body_sim.core.fluids import BreastFluid
+    from body_sim.systems.grid import BreastGrid
+
+
+_CUPS = list(CupSize)
+_CUP_INDEX = {cup: i for i, cup in enumerate(_CUPS)}
+_GIGA = CupSize.GIGA.base_volume
+
+_STATES = [BreastState.EMPTY, BreastState.NORMAL, BreastState.TENSE,
+           BreastState.OVERPRESSURED, BreastState.LEAKING]
+_STATE_INDEX = {s: i for i, s in enumerate(_STATES)}
+_EMPTY, _NORMAL, _TENSE, _OVERPRESSURED, _LEAKING = range(5)
+
+_LACT = [LactationState.OFF, LactationState.PREPARE, LactationState.ACTIVE,
+         LactationState.ENGORGED, LactationState.DRYING]
+_LACT_INDEX = {s: i for i, s in enumerate(_LACT)}
+_OFF, _PREPARE, _ACTIVE, _ENGORGED, _DRYING = range(5)
+
+_TIER_NAMES = ["NONE", "LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+_MILK = FLUID_INDEX[FluidType.MILK]
+
+
+class SoABreastEngine:
+    """
+    Колоночный движок тика для BreastGrid.
+
+    После каждого tick() колонки filled, sag, elasticity, stretch_ratio,
+    lactation_state и nipple_gape отражают состояние грудей, прошедших
+    векторный шаг (спящие пропускаются, см. systems.dormancy); их индексы
+    в grid.all() - в active (nipple_gape - плоский массив, владелец в
+    nipple_owner - индекс в active).
+    """
+
+    def __init__(self, grid: 'BreastGrid'):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SoA BreastGrid backend requires numpy")
+        self.grid = grid
+        self._cup_volumes = np.array([c.base_volume for c in _CUPS])
+        self._defs_key = None
+        self._visc = None
+        self._dens = None
+        self._defs_missing = None
+
+        empty = np.zeros(0)
+        self.active = np.zeros(0, dtype=np.intp)
+        self.filled = empty
+        self.sag = empty
+        self.elasticity = empty
+        self.stretch_ratio = empty
+        self.lactation_state = np.zeros(0, dtype=np.int8)
+        self.nipple_gape = empty
+        self.nipple_owner = np.zeros(0, dtype=np.intp)
+        self.fallback_ticks = 0
+
+    def _defs_vectors(self, defs: Dict[FluidType, 'BreastFluid']):
+        if self._defs_key is not defs:
+            k = len(FLUID_ORDER)
+            visc = np.zeros(k)
+            dens = np.ones(k)
+            missing = np.zeros(k, dtype=bool)
+            for i, ft in enumerate(FLUID_ORDER):
+                fluid = defs.get(ft)
+                if fluid is None:
+                    missing[i] = True
+                else:
+                    visc[i] = fluid.viscosity
+                    dens[i] = fluid.density
+            self._defs_key = defs
+            self._visc, self._dens, self._defs_missing = visc, dens, missing
+        return self._visc, self._dens, self._defs_missing
+
+    @staticmethod
+    def _volume(filled, B, M, SR, IV):
+        """Векторный аналог Breast.volume."""
+        stretch_fac = 1.0 + (SR - 1.0) * 0.5
+        return np.where(
+            filled > 0,
+            B + (M - B) * np.minimum(filled / M, 1.0) * stretch_fac + IV,
+            B + IV,
+        )
+
+    def _cup_index(self, volume):
+        """Векторный аналог Breast.dynamic_cup (индекс в списке CupSize)."""
+        idx = np.searchsorted(self._cup_volumes, volume, side="right") - 1
+        return np.where(idx < 0, _CUP_INDEX[CupSize.AAA], idx)
+
+    def tick(self, defs: Dict[FluidType, 'BreastFluid'], dt: float = 1.0,
+             stats: Optional[DormancyStats] = None) -> List[List[Dict[str, Any]]]:
+        if dt <= 0:
+            raise ValueError(f"dt must be positive, got {dt}")
+
+        breasts = self.grid.all()
+        if stats is not None and not stats.enabled:
+            for b in breasts:
+                b._rest = None
+                b._version += 1
+            stats.ticked += len(breasts)
+            self.active = np.arange(len(breasts))
+            results = self._step(breasts, defs, dt)
+        else:
+            results = self._step_awake(breasts, defs, dt, stats)
+
+        out = []
+        i = 0
+        for row in self.grid.rows:
+            out.append(results[i:i + len(row)])
+            i += len(row)
+        return out
+
+    def _step_awake(self, breasts: List['Breast'], defs: Dict[FluidType, 'BreastFluid'],
+                    dt: float, stats: Optional[DormancyStats]) -> List[Dict[str, Any]]:
+        """Векторный шаг только по неспящим грудям; спящие отдают сохранённый результат."""
+        inputs = (dt, id(defs))
+        results: List[Any] = [None] * len(breasts)
+        awake, keys = [], []
+        for i, b in enumerate(breasts):
+            key = b.rest_key()
+            if is_resting(b, inputs, key):
+                results[i] = b._rest[2]
+                if stats is not None:
+                    stats.skip(b)
+            else:
+                awake.append(i)
+                keys.append(key)
+
+        self.active = np.array(awake, dtype=np.intp)
+        ticked = self._step([breasts[i] for i in awake], defs, dt)
+        # Груди с изменившимся filled (key[0]) заведомо не в покое - без повторного rest_key
+        filled = self.filled.tolist()
+        for j, (i, key, result) in enumerate(zip(awake, keys, ticked)):
+            if filled[j] == key[0]:
+                settle(breasts[i], inputs, key, result)
+            else:
+                breasts[i]._rest = None
+                breasts[i]._version += 1
+            results[i] = result
+        if stats is not None:
+            stats.ticked += len(awake)
+        return results
+
+    def _step(self, breasts: List['Breast'], defs: Dict[FluidType, 'BreastFluid'],
+              dt: float) -> List[Dict[str, Any]]:
+        n = len(breasts)
+        if n == 0:
+            return []
+        visc_vec, dens_vec, missing = self._defs_vectors(defs)
+        k = len(FLUID_ORDER)
+
+        # ---------- Сбор колонок ----------
+        mixtures = [b.mixture for b in breasts]
+        F = np.frombuffer(b"".join([m._slots.tobytes() for m in mixtures]), dtype=np.float64).reshape(n, k).copy()
+        T = np.array([m._total for m in mixtures])
+        B = np.array([b._base_volume for b in breasts])
+        M = np.array([b._max_volume for b in breasts])
+        S = np.array([b._sag for b in breasts])
+        E = np.array([b._elasticity for b in breasts])
+        BE = np.array([b.base_elasticity for b in breasts])
+        size_mod = np.array([SAG_SIZE_FACTOR.get(b.cup.name, 1.0) for b in breasts])
+        leak_factor = np.array([b.leak_factor for b in breasts])
+        state = np.array([_STATE_INDEX[b._state] for b in breasts], dtype=np.int8)
+        last_tier = [b._pressure_system._last_tier for b in breasts]
+        last_cup = np.array([_CUP_INDEX[b._last_dynamic_cup] for b in breasts])
+
+        inflations = [b.inflation for b in breasts]
+        SR = np.array([inf.stretch_ratio for inf in inflations])
+        MS = np.array([inf.max_stretch for inf in inflations])
+        PL = np.array([inf.plasticity for inf in inflations])
+        peak = np.array([inf.peak_stretch for inf in inflations])
+        perm = np.array([inf.is_permanently_stretched for inf in inflations])
+
+        IV = np.zeros(n)
+        PM = np.zeros(n)
+        LR = np.zeros(n)
+        LS = np.zeros(n)
+        for i, b in enumerate(breasts):
+            im = b.insertion_manager
+            if im.inserted_objects:
+                IV[i] = im.total_volume
+                PM[i] = im.pressure_modifier
+                LR[i] = im.total_leakage_reduction
+                LS[i] = im.lactation_stimulation
+
+        lacts = [b.lactation for b in breasts]
+        L = np.array([_LACT_INDEX[l.state] for l in lacts], dtype=np.int8)
+        rate100 = np.array([l.base_rate_per_100ml for l in lacts])
+        min_rate = np.array([l.min_rate for l in lacts])
+        max_rate = np.array([l.max_rate for l in lacts])
+        bonus = np.array([l.stimulation_bonus for l in lacts])
+        hormone = np.array([l.hormone_level * l.letdown_reflex for l in lacts])
+        cons = np.array([l.consecutive_stimulation for l in lacts], dtype=np.int64)
+        max_streak = np.array([l.max_streak_bonus for l in lacts])
+        stimulated = np.array([l._stimulated for l in lacts])
+
+        nipples = []
+        owner = []
+        for i, b in enumerate(breasts):
+            for nip in b.areola.nipples:
+                nipples.append(nip)
+                owner.append(i)
+        ow = np.array(owner, dtype=np.intp)
+        g = np.array([nip.gape_diameter for nip in nipples])
+        cw = np.array([nip.current_width for nip in nipples])
+        bw = np.array([nip.base_width for nip in nipples])
+        maxg = np.array([nip.max_gape_diameter for nip in nipples])
+        bmin = np.array([nip.base_min_gape_diameter for nip in nipples])
+        nip_count = np.bincount(ow, minlength=n)
+
+        # ---------- 1. Провисание и эластичность ----------
+        filled = np.maximum(T, 0.0)
+        vol = self._volume(filled, B, M, SR, IV)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            density = np.where(T > 0, (F @ dens_vec) / np.where(T != 0, T, 1.0), 1.0)
+            fill_ratio = np.minimum(filled / vol, 1.0)
+        target = np.minimum(
+            fill_ratio ** 2 * 0.5 * size_mod * np.sqrt(np.maximum(density, 0.0)) * (1.0 / np.maximum(0.3, E)),
+            1.0,
+        )
+        inertia = 0.05 * dt * np.where(S > 0.5, 0.5, 1.0)
+        S = np.where(
+            filled > 0,
+            np.clip(S + (target - S) * inertia, 0.0, 1.0),
+            np.maximum(0.0, S - 0.1 * dt),
+        )
+        target_e = np.maximum(BE * (1.0 - S * 0.4), 0.1)
+        E = E + (target_e - E) * 0.2 * dt
+
+        # ---------- 2. Лактация ----------
+        fill_l = filled / M
+        penalty = np.where(
+            fill_l <= 0.5, 1.0,
+            np.where(fill_l <= 0.85, 1.0 - (fill_l - 0.5) * (0.5 / 0.35),
+                     np.maximum(0.2, 0.5 - (fill_l - 0.85) * 2.0))
+        )
+        new_rate100 = np.where(L == _DRYING, rate100 * 0.99, rate100)
+        base_rate = np.maximum(np.minimum(new_rate100 * (B / 100.0), max_rate), min_rate)
+        current = base_rate * penalty
+        streak = np.minimum(1.0 + cons * 0.1, max_streak)
+        mult = hormone * streak * (1.0 + LS)
+
+        produced = np.zeros(n)
+        new_L = L.copy()
+        new_cons = cons.copy()
+        new_stim = stimulated.copy()
+
+        m = L == _PREPARE
+        produced[m] = (current * 0.3 * mult * dt)[m]
+        new_L[m & (filled > B * 0.15)] = _ACTIVE
+
+        m = L == _ACTIVE
+        produced[m] = (current * mult * dt * np.where(stimulated, bonus, 1.0))[m]
+        new_stim[m] = False
+        dec = m & ~stimulated
+        new_cons[dec] = np.maximum(0, cons[dec] - 1)
+        new_L[m & (fill_l >= 0.85)] = _ENGORGED
+
+        m = L == _ENGORGED
+        produced[m] = (current * 0.5 * mult * dt)[m]
+        new_L[m & (fill_l < 0.7)] = _ACTIVE
+
+        m = L == _DRYING
+        produced[m] = (base_rate * 0.5 * dt)[m]
+        to_off = m & (new_rate100 < 0.1)
+        new_L[to_off] = _OFF
+        produced[to_off] = 0.0
+
+        if FluidType.MILK not in defs:
+            produced[:] = 0.0
+
+        # Груди, которым нужна полная логика Breast.add_fluid или KeyError от defs
+        fallback = (produced > 0) & (
+            (filled >= _GIGA)
+            | (produced > np.maximum(0.0, M - filled))
+            | (filled + produced > _GIGA)
+        )
+        if missing.any():
+            fallback |= (F[:, missing] != 0.0).any(axis=1)
+
+        F[:, _MILK] += produced
+        T = T + produced
+        filled = np.maximum(T, 0.0)
+
+        # ---------- 3. Давление и соски ----------
+        with np.errstate(divide="ignore", invalid="ignore"):
+            visc = np.where(T != 0, (F @ visc_vec) / np.where(T != 0, T, 1.0), 0.0)
+            pressure = np.where(
+                (filled > 0) & (B > 0),
+                (filled / B) ** 2 * (1.0 + (visc - 1.0) * 0.3) / np.maximum(0.1, E) * (1.0 + S * 0.5),
+                0.0,
+            )
+        pressure = pressure + PM
+        critical = pressure >= PRESSURE_TIER_CRITICAL
+        high = (pressure >= PRESSURE_TIER_HIGH) & ~critical
+
+        pn = pressure[ow]
+        crit_n = critical[ow]
+        high_n = high[ow]
+        low_n = ~(crit_n | high_n)
+
+        def min_gape(width):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(bw > 0, width / np.where(bw > 0, bw, 1.0), 1.0)
+            return bmin * np.maximum(ratio * 0.5, 1.0)
+
+        g = np.where(crit_n, g + (maxg * 0.8 - g) * GAPE_OPEN_SPEED * dt * 2, g)
+        cw = np.where(crit_n & (cw < bw * 3.0), cw + bw * 0.01 * dt, cw)
+        g = np.where(high_n & (g < maxg * 0.5), g + GAPE_OPEN_SPEED * dt, g)
+        g = np.where(low_n & (g > min_gape(cw)), g - GAPE_CLOSE_SPEED * dt, g)
+        g = np.maximum(min_gape(cw), np.minimum(g, maxg))
+        opening = pn > 0
+        target_g = maxg * np.minimum(pn / 3.0, 1.0)
+        g = np.where(opening, np.maximum(g + (target_g - g) * 0.3, bmin), g)
+
+        tier_idx = np.searchsorted(np.array(PressureSystem.TIERS), pressure, side="right")
+
+        # ---------- 4. Состояние ----------
+        is_open = g > 0.05
+        any_open = np.bincount(ow, weights=is_open.astype(np.float64), minlength=n) > 0
+        new_state = np.where(
+            filled <= 0, _EMPTY,
+            np.where(pressure < 0.5, _NORMAL,
+                     np.where(pressure < 1.0, _TENSE,
+                              np.where(nip_count == 0, _OVERPRESSURED,
+                                       np.where(any_open, _LEAKING, _TENSE))))
+        ).astype(np.int8)
+
+        # ---------- 5. Утечка ----------
+        with np.errstate(divide="ignore", invalid="ignore"):
+            openness = np.where(cw > 0, g / np.where(cw > 0, cw, 1.0), 0.0)
+        eff = np.where(is_open, g * openness, 0.0)
+        flowing = is_open & (eff > 0) & (pn >= PRESSURE_LEAK_MIN)
+        eff = np.minimum(eff, cw * 0.9)
+        area = np.pi * (eff / 2) ** 2
+        efficiency = np.clip(openness ** 2, 0.0, 1.0)
+        flow = 0.8 * area * (pn - PRESSURE_LEAK_MIN + 0.1) * efficiency / np.maximum(visc[ow], 0.1)
+        flow = np.minimum(flow, filled[ow] * 0.1)
+        flow = np.where(flowing, np.maximum(0.0, flow), 0.0)
+        total_flow = np.bincount(ow, weights=flow, minlength=n)
+        total_flow *= 1.0 - np.clip(LR, 0.0, 1.0)
+        leak_rate = np.where(
+            (LR >= 1.0) | (nip_count == 0) | (filled <= 0), 0.0,
+            np.maximum(0.0, total_flow * (leak_factor / 20.0)),
+        )
+
+        leaking = (new_state == _LEAKING) & (filled > 0)
+        if leaking.any():
+            fallback |= leaking & np.array([b.leak_integrator is not Integrator.EXPLICIT for b in breasts])
+        leaked = np.where(
+            leaking,
+            np.maximum(0.0, np.minimum(np.minimum(filled * leak_rate * dt, filled * 0.5 * dt), filled)),
+            0.0,
+        )
+        removing = leaked > 0.0001
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(removing & (T > 0), leaked / np.where(T > 0, T, 1.0), 0.0)
+        keep = np.where(ratio >= 1.0, 0.0, 1.0 - ratio)
+        F *= keep[:, None]
+        T = np.where(ratio >= 1.0, 0.0, T * keep)
+        filled = np.maximum(T, 0.0)
+
+        # ---------- 7. Размер ----------
+        vol = self._volume(filled, B, M, SR, IV)
+        cup_idx = self._cup_index(vol)
+
+        # ---------- Инфляция (apply_stretch) ----------
+        normal = B * 1.5
+        recover = vol <= normal
+        with np.errstate(divide="ignore", invalid="ignore"):
+            grown = 1.0 + (vol - normal) / normal
+        recovered = np.where(
+            SR <= 1.0, 1.0,
+            np.maximum(1.0, 1.0 + (SR - 1.0) * PL + (SR - 1.0) * (1.0 - PL) * 0.99),
+        )
+        peak = np.where(recover, peak, np.maximum(peak, grown))
+        perm = perm | (~recover & (grown >= MS))
+        target_sr = np.where(recover, recovered, np.where(grown >= MS, MS, grown))
+        speed = np.where(target_sr > SR, 0.1, 0.05)
+        SR = SR + (target_sr - SR) * speed * dt
+        M = B * 1.5 * SR
+        E = np.maximum(0.1, BE - (SR - 1.0) * 0.5)
+        areola_scale = np.sqrt(np.maximum(SR, 0.0))
+        final_cup_idx = self._cup_index(self._volume(filled, B, M, SR, IV))
+
+        # ---------- Колонки для внешнего чтения ----------
+        self.filled = filled
+        self.sag = S
+        self.elasticity = E
+        self.stretch_ratio = SR
+        self.lactation_state = new_L
+        self.nipple_gape = g
+        self.nipple_owner = ow
+
+        # ---------- Запись обратно и события ----------
+        return self._scatter(
+            breasts, defs, dt, fallback, F, T, filled, S, E, SR, M, peak, perm,
+            areola_scale, new_state, state, tier_idx, last_tier, cup_idx, last_cup, final_cup_idx,
+            pressure, leaked, removing, produced, new_L, L, new_rate100, new_cons, new_stim,
+            g, cw,
+        )
+
+    def _scatter(self, breasts, defs, dt, fallback, F, T, filled, S, E, SR, M, peak, perm,
+                 areola_scale, new_state, state, tier_idx, last_tier, cup_idx, last_cup, final_cup_idx,
+                 pressure, leaked, removing, produced, new_L, L, new_rate100, new_cons, new_stim,
+                 g, cw) -> List[Dict[str, Any]]:
+        n = len(breasts)
+        fb = fallback.tolist()
+        raw = F.tobytes()
+        row_bytes = F.shape[1] * 8
+        T_l = T.tolist()
+        filled_l = filled.tolist()
+        S_l, E_l, SR_l, M_l = S.tolist(), E.tolist(), SR.tolist(), M.tolist()
+        peak_l, perm_l = peak.tolist(), perm.tolist()
+        scale_l = areola_scale.tolist()
+        new_state_l, state_l = new_state.tolist(), state.tolist()
+        tier_l = tier_idx.tolist()
+        cup_l, last_cup_l, final_cup_l = cup_idx.tolist(), last_cup.tolist(), final_cup_idx.tolist()
+        p_l, leaked_l, removing_l = pressure.tolist(), leaked.tolist(), removing.tolist()
+        produced_l = produced.tolist()
+        new_L_l, L_l = new_L.tolist(), L.tolist()
+        rate_l, cons_l, stim_l = new_rate100.tolist(), new_cons.tolist(), new_stim.tolist()
+        g_l, cw_l = g.tolist(), cw.tolist()
+
+        j = 0
+        results: List[Dict[str, Any]] = []
+        for i in range(n):
+            b = breasts[i]
+            nip_n = len(b.areola.nipples)
+            if fb[i]:
+                j += nip_n
+                self.fallback_ticks += 1
+                results.append(b.tick(defs, dt))
+                continue
+
+            b.mixture._assign(raw[i * row_bytes:(i + 1) * row_bytes], T_l[i])
+            b._sag = S_l[i]
+            b._elasticity = E_l[i]
+            b._max_volume = M_l[i]
+            inf = b.inflation
+            inf.stretch_ratio = SR_l[i]
+            inf.peak_stretch = peak_l[i]
+            inf.is_permanently_stretched = perm_l[i]
+            b.areola._current_diameter = b.areola.base_diameter * scale_l[i]
+
+            lact = b.lactation
+            lact.state = _LACT[new_L_l[i]]
+            lact.base_rate_per_100ml = rate_l[i]
+            lact.consecutive_stimulation = cons_l[i]
+            lact._stimulated = stim_l[i]
+
+            for nip in b.areola.nipples:
+                nip.gape_diameter = g_l[j]
+                nip.current_width = cw_l[j]
+                j += 1
+
+            old_state = _STATES[state_l[i]]
+            cur_state = _STATES[new_state_l[i]]
+            b._state = cur_state
+
+            tier_name = _TIER_NAMES[tier_l[i]]
+            tier_changed = tier_name != last_tier[i]
+            b._pressure_system._last_tier = tier_name
+
+            old_cup = _CUPS[last_cup_l[i]]
+            cup = _CUPS[cup_l[i]]
+            b._last_dynamic_cup = cup
+
+            if b.observed:
+                self._emit_events(b, L_l[i], new_L_l[i], produced_l[i], p_l[i], tier_changed,
+                                  old_state, cur_state, leaked_l[i] if removing_l[i] else 0.0,
+                                  old_cup, cup)
+
+            results.append({
+                "state": cur_state.name,
+                "pressure": round(p_l[i], 2),
+                "filled": round(filled_l[i], 1),
+                "sag": round(S_l[i], 3),
+                "leaked": round(leaked_l[i], 2),
+                "cup": _CUPS[final_cup_l[i]].name,
+                "elasticity": round(E_l[i], 2),
+            })
+        return results
+
+    @staticmethod
+    def _emit_events(b: 'Breast', lact_old: int, lact_new: int, produced: float, pressure: float,
+                     tier_changed: bool, old_state: BreastState, new_state: BreastState,
+                     leaked: float, old_cup: CupSize, cup: CupSize) -> None:
+        """События в том же порядке, что и Breast.tick."""
+        if lact_old != lact_new:
+            if lact_new == _ACTIVE and lact_old == _PREPARE:
+                b._emit("lactation_active")
+            elif lact_new == _ENGORGED:
+                b._emit("engorgement")
+            elif lact_new == _ACTIVE:
+                b._emit("engorgement_relief")
+            elif lact_new == _OFF:
+                b._emit("lactation_end")
+        if produced > 0:
+            b._emit("fluid_added", amount=produced, inflated=False)
+            b._emit("milk_produced", amount=round(produced, 2))
+
+        if tier_changed:
+            if pressure >= PRESSURE_TIER_CRITICAL:
+                tier = PressureTier.CRITICAL
+            elif pressure >= PRESSURE_TIER_HIGH:
+                tier = PressureTier.HIGH
+            else:
+                tier = PressureTier.LOW
+            b._emit("pressure_tier_change", tier=tier)
+
+        if new_state != old_state:
+            b._emit("state_change", old=old_state, new=new_state)
+            if new_state == BreastState.LEAKING:
+                b._emit("leak_start")
+            elif old_state == BreastState.LEAKING:
+                b._emit("leak_end")
+
+        if leaked > 0:
+            b._emit("leak", amount=leaked)
+
+        if cup != old_cup:
+            b._emit("cup_changed", old=old_cup, new=cup)
@@ -6,7 +6,8 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 import math
-import cmath
+
+from body_sim.systems.fast_forward import split_steps
 
 if TYPE_CHECKING:
     from body_sim.anatomy.breast import Breast
@@ -56,6 +57,24 @@ class InflationSystem:
         
         self._update_breast_dimensions(breast)
 
+    def fast_forward(self, breast: 'Breast', duration: float, dt: float = 1.0) -> None:
+        """
+        apply_stretch(breast, dt) за duration при объёме не выше нормы.
+
+        В режиме восстановления (_recover) отклонение от 1.0 за шаг
+        умножается на постоянный множитель - закрытая форма через степень.
+        """
+        steps, rest = split_steps(duration, dt)
+        excess = self.stretch_ratio - 1.0
+        if excess > 0:
+            factor = 1.0 - 0.05 * dt * 0.01 * (1.0 - self.plasticity)
+        else:
+            factor = 1.0 - 0.1 * dt
+        self.stretch_ratio = 1.0 + excess * factor ** steps
+        self._update_breast_dimensions(breast)
+        if rest:
+            self.apply_stretch(breast, rest)
+
     def _update_breast_dimensions(self, breast: 'Breast') -> None:
         base_max = breast._base_volume * 1.5
         breast._max_volume = base_max * self.stretch_ratio
@@ -65,7 +84,7 @@ class InflationSystem:
         
         if breast.areola:
             base_diameter = breast.areola.base_diameter
-            target_diameter = base_diameter * cmath.sqrt(self.stretch_ratio)
+            target_diameter = base_diameter * max(0.0, self.stretch_ratio) ** 0.5
             breast.areola._current_diameter = target_diameter
 
     def force_inflate(self, breast: 'Breast', amount_ml: float) -> float:
@@ -0,0 +1,236 @@
+# body_sim/systems/journal.py
+"""
+Журнал событий: бинарный append-only файл и воспроизведение.
+
+Формат (версия 2): заголовок MAGIC, затем записи <u32 длина><тело>.
+Тело события: <u16 код типа><f64 timestamp><f64 intensity> и четыре
+строки UTF-8 с префиксом длины <u32>: source_id, target_id ("" = None),
+event_id и data в JSON. Объекты в data (тело, органы) сохраняются
+именем или repr - журнал хранит след сессии, а не её состояние.
+
+Код типа - номер внутри файла, а не EventType.value (порядковый auto()
+сдвигается при перестановке членов enum). Перед первым событием типа
+пишется запись-определение <u16 0xFFFF><u16 код><имя EventType>;
+читатель сопоставляет коды по имени. Каждый EventJournal нумерует типы
+заново, так что дописывание в существующий файл безопасно. Журналы
+версии 1 (с EventType.value) не читаются: номера в них не однозначны.
+
+Запись буферизуется и сбрасывается на диск по размеру буфера или по
+времени (flush_interval). Обрезанная последняя запись (сессию убили
+посреди write) при чтении пропускается.
+
+Воспроизведение: python -m body_sim.systems.journal FILE
+"""
+
+from enum import Enum
+from typing import Any, Dict, Iterator, Optional, Tuple
+import json
+import struct
+import sys
+import time
+
+from body_sim.core.enums import EventType
+from body_sim.systems.events import Event, EventBus
+
+MAGIC = b"BSEJ\x02\x00"
+_MAGIC_PREFIX = MAGIC[:4]
+
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<Hdd")
+_CODE = struct.Struct("<H")
+# Код записи-определения типа
+_DEFINE = 0xFFFF
+_DEFINE_HEADER = struct.Struct("<HH")
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.name
+    name = getattr(value, "name", None)
+    if isinstance(name, str):
+        return name
+    return repr(value)
+
+
+def encode_definition(code: int, event_type: EventType) -> bytes:
+    """Тело записи-определения: код типа в файле -> имя EventType."""
+    return _DEFINE_HEADER.pack(_DEFINE, code) + event_type.name.encode("utf-8")
+
+
+def encode_event(event: Event, code: int) -> bytes:
+    """Тело записи события (без префикса длины); code - код типа из определения."""
+    parts = [_HEADER.pack(code, event.timestamp, event.intensity)]
+    for text in (event.source_id or "", event.target_id or "", event.event_id,
+                 json.dumps(event.data, default=_encode_value, separators=(",", ":"))):
+        raw = text.encode("utf-8")
+        parts.append(_LENGTH.pack(len(raw)))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def decode_event(payload: bytes, types: Dict[int, EventType]) -> Event:
+    code, timestamp, intensity = _HEADER.unpack_from(payload, 0)
+    event_type = types.get(code)
+    if event_type is None:
+        raise ValueError(f"event type code {code} used before its definition")
+    offset = _HEADER.size
+    texts = []
+    for _ in range(4):
+        (size,) = _LENGTH.unpack_from(payload, offset)
+        offset += _LENGTH.size
+        texts.append(payload[offset:offset + size].decode("utf-8"))
+        offset += size
+    source_id, target_id, event_id, data = texts
+    return Event(event_type, source_id, target_id or None, timestamp,
+                 intensity, json.loads(data), event_id)
+
+
+class EventJournal:
+    """Синк EventBus: каждое событие - запись в конец файла."""
+
+    def __init__(self, path: str, buffer_size: int = 64 * 1024, flush_interval: float = 1.0):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.events_written = 0
+        self.bytes_written = 0
+        self.flushes = 0
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self.bytes_written += len(MAGIC)
+        else:
+            try:
+                with open(path, "rb") as f:
+                    _check_magic(f.read(len(MAGIC)), path)
+            except ValueError:
+                self._file.close()
+                raise
+        # Коды типов этого журнала (определения пишутся при первом событии типа)
+        self._codes: Dict[EventType, int] = {}
+        self._buses = []
+
+    def attach(self, bus: EventBus) -> None:
+        """Писать все события шины (в порядке emit)."""
+        bus.add_sink(self.write)
+        self._buses.append(bus)
+
+    def write(self, event: Event) -> None:
+        buffer = self._buffer
+        code = self._codes.get(event.event_type)
+        if code is None:
+            code = self._codes[event.event_type] = len(self._codes)
+            definition = encode_definition(code, event.event_type)
+            buffer += _LENGTH.pack(len(definition))
+            buffer += definition
+        payload = encode_event(event, code)
+        buffer += _LENGTH.pack(len(payload))
+        buffer += payload
+        self.events_written += 1
+        if (len(buffer) >= self.buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self.bytes_written += len(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
+            self.flushes += 1
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        for bus in self._buses:
+            bus.remove_sink(self.write)
+        self._buses.clear()
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> 'EventJournal':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _check_magic(header: bytes, path: str) -> None:
+    if header == MAGIC:
+        return
+    if header[:4] == _MAGIC_PREFIX and len(header) == len(MAGIC):
+        raise ValueError(f"{path}: unsupported event journal version {header[4]} "
+                         f"(expected {MAGIC[4]})")
+    raise ValueError(f"{path} is not an event journal")
+
+
+def read_journal(path: str) -> Iterator[Event]:
+    """События журнала по порядку записи."""
+    with open(path, "rb") as f:
+        _check_magic(f.read(len(MAGIC)), path)
+        types: Dict[int, EventType] = {}
+        read = f.read
+        while True:
+            prefix = read(_LENGTH.size)
+            if len(prefix) < _LENGTH.size:
+                return
+            (size,) = _LENGTH.unpack(prefix)
+            payload = read(size)
+            if len(payload) < size:
+                return
+            if _CODE.unpack_from(payload, 0)[0] == _DEFINE:
+                _, code = _DEFINE_HEADER.unpack_from(payload, 0)
+                name = payload[_DEFINE_HEADER.size:].decode("utf-8")
+                try:
+                    types[code] = EventType[name]
+                except KeyError:
+                    raise ValueError(f"{path}: unknown event type {name!r}") from None
+                continue
+            yield decode_event(payload, types)
+
+
+def replay(path: str, bus: Optional[EventBus] = None) -> Tuple[EventBus, Dict[str, Any]]:
+    """
+    Прогнать журнал через шину (по умолчанию новую, без истории) с
+    максимальной скоростью. Подписчиков добавляют на bus до вызова.
+    """
+    if bus is None:
+        bus = EventBus(record_history=False)
+    counts: Dict[str, int] = {}
+    emit = bus.emit
+    started = time.perf_counter()
+    for event in read_journal(path):
+        emit(event)
+        name = event.event_type.name
+        counts[name] = counts.get(name, 0) + 1
+    if bus.queued:
+        bus.flush()
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    return bus, {
+        "events": total,
+        "elapsed_s": round(elapsed, 4),
+        "events_per_s": round(total / elapsed) if elapsed > 0 else 0,
+        "by_type": counts,
+    }
+
+
+def main(argv: Optional[list] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a body_sim event journal")
+    parser.add_argument("journal")
+    args = parser.parse_args(argv)
+
+    _, report = replay(args.journal)
+    print(f"{report['events']} events in {report['elapsed_s']}s "
+          f"({report['events_per_s']} events/s)")
+    for name, count in sorted(report["by_type"].items(), key=lambda item: -item[1]):
+        print(f"  {name:<24} {count}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,15 +1,15 @@
 # body_sim/systems/penetration.py
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, TYPE_CHECKING
 from enum import Enum, auto
 import math
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 
 from body_sim.systems.fluid_container import FluidContainer
 from body_sim.core.enums import FluidType, InsertionStatus
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 
 @dataclass
 class InsertableObject:
@@ -203,7 +203,9 @@ class PenetrableOrgan:
         if hasattr(self, 'on_deep_penetration'):
             self.on_deep_penetration(data)
     
-    def get_penetration_status(self) -> Table:
+    def get_penetration_status(self) -> 'Table':
+        from rich.table import Table
+
         table = Table(title=f"Penetration: {self.__class__.__name__}")
         table.add_column("Object", style="cyan")
         table.add_column("Depth", style="green")
@@ -74,4 +74,14 @@ def apply_pressure_to_nipple(nipple: 'Nipple', tier: PressureTier, dt: float) ->
     # Клэмпинг
     nipple.gape_diameter = max(nipple.min_gape_diameter, 
                                min(nipple.gape_diameter, nipple.max_gape_diameter))
+
+
+def close_nipple_steps(nipple: 'Nipple', steps: int, dt: float) -> None:
+    """apply_pressure_to_nipple(nipple, LOW, dt) steps раз: линейное закрытие."""
+    if steps <= 0:
+        return
+    apply_pressure_to_nipple(nipple, PressureTier.LOW, dt)
+    if nipple.gape_diameter > nipple.min_gape_diameter:
+        nipple.gape_diameter = max(nipple.min_gape_diameter,
+                                   nipple.gape_diameter - GAPE_CLOSE_SPEED * dt * (steps - 1))
                                
\ No newline at end of file
@@ -0,0 +1,123 @@
+# body_sim/systems/scheduler.py
+"""
+Многочастотный планировщик тиков.
+
+Подсистемы с точностью до тика (давление, утечка, состояния Breast.tick
+и Uterus.tick) обновляются каждый шаг. Медленные подсистемы объявляют
+свой период TICK_PERIOD и обновляются раз в N шагов с суммарным dt:
+
+    UterineWall, StomachWall, RectalWall - восстановление стенок;
+    Ovary - спад hormone_production / blood_supply;
+    Testicle - остывание, выработка, давление (arousal усредняется по dt);
+    ExtendedAppearanceMixin - обновление внешности из анатомии.
+
+Допуск относительно периода 1:
+- линейные спады (усталость стенок, RectalWall, гормоны яичников,
+  выработка спермы вдали от ёмкости) совпадают до округления float;
+- состояние медленной подсистемы отстаёт от точного не более чем на
+  N-1 шагов, пороговые флаги (TORSION, is_permanently_stretched,
+  смена pressure_tier яичка) и реакции на них срабатывают с той же
+  задержкой;
+- стенки матки и желудка в хвосте восстановления (эластичная часть
+  меньше шага восстановления) сходятся к 1.0 медленнее, отклонение
+  stretch_ratio не больше N * 0.001 * elasticity * dt;
+- у яичка около полной ёмкости (0.9 свободного места за вызов) и при
+  остывании ниже 34.5 отклонение не больше одного агрегированного шага.
+Установившиеся состояния (пустые органы, стенки в покое) одинаковы.
+Период 1 для всех задач даёт прежнее поведение.
+
+Стадия задачи (stage) задаёт место вызова внутри шага: владелец
+вызывает advance(dt) один раз, затем run_due(stage) там, где раньше
+стоял встроенный код подсистемы.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+
+@dataclass
+class RateTask:
+    """Медленная подсистема: callback(dt) раз в period шагов."""
+    name: str
+    callback: Callable[[float], None]
+    period: int = 1
+    stage: str = "pre"
+    pending_dt: float = 0.0
+    pending_steps: int = 0
+    runs: int = 0
+
+
+class MultiRateScheduler:
+    """Набор медленных задач, продвигаемых вместе с фиксированным шагом."""
+
+    def __init__(self):
+        self.tasks: Dict[str, RateTask] = {}
+        self.steps = 0
+
+    def register(self, name: str, callback: Callable[[float], None], period: int = 1,
+                 stage: str = "pre") -> RateTask:
+        """Добавить задачу; у уже известной задачи меняется только callback."""
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        task = self.tasks.get(name)
+        if task is None:
+            task = self.tasks[name] = RateTask(name, callback, period, stage)
+        else:
+            task.callback = callback
+        return task
+
+    def set_period(self, name: str, period: int) -> None:
+        """Изменить период задачи (накопленный dt сначала применяется)."""
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        task = self.tasks[name]
+        self._run(task)
+        task.period = period
+
+    def set_all(self, period: int) -> None:
+        for name in self.tasks:
+            self.set_period(name, period)
+
+    def periods(self) -> Dict[str, int]:
+        return {name: task.period for name, task in self.tasks.items()}
+
+    def _run(self, task: RateTask) -> None:
+        if task.pending_steps:
+            dt = task.pending_dt
+            task.pending_dt = 0.0
+            task.pending_steps = 0
+            task.runs += 1
+            task.callback(dt)
+
+    def advance(self, dt: float) -> None:
+        """Накопить dt шага во всех задачах (без вызовов)."""
+        self.steps += 1
+        for task in self.tasks.values():
+            task.pending_dt += dt
+            task.pending_steps += 1
+
+    def run_due(self, stage: str = "pre") -> None:
+        """Вызвать задачи стадии, у которых истёк период."""
+        for task in self.tasks.values():
+            if task.stage == stage and task.pending_steps >= task.period:
+                self._run(task)
+
+    def step(self, dt: float) -> None:
+        """Один шаг: задачи, у которых истёк период, получают накопленный dt."""
+        self.advance(dt)
+        for task in self.tasks.values():
+            if task.pending_steps >= task.period:
+                self._run(task)
+
+    def flush(self) -> None:
+        """Применить накопленный dt всех задач (перед чтением точного состояния)."""
+        for task in self.tasks.values():
+            self._run(task)
+
+    def report(self) -> Dict[str, Any]:
+        """Сколько вызовов каждой задачи сэкономлено относительно периода 1."""
+        return {
+            name: {"period": task.period, "runs": task.runs,
+                   "saved": self.steps - task.runs}
+            for name, task in self.tasks.items()
+        }
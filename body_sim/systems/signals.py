@@ -0,0 +1,186 @@
+# body_sim/systems/signals.py
+"""
+Сигналы органов: единая замена _listeners/_emit.
+
+Источник (Emitter) держит подписчиков в лениво создаваемом словаре:
+пока никто не подписан, _emit сводится к двум проверкам на None.
+Массовая подписка - через SignalHub: тело, сетка грудей и мир держат
+свой хаб, источники ссылаются на ближайший, хабы - на родителя
+(грудь -> сетка -> тело -> мир). Обработчик хаба получает тот же
+вызов, что и обработчик органа: callback(source, **data).
+
+SignalCoalescer (по желанию) сливает сигналы хаба за тик: одинаковые
+события одного органа дают один CoalescedSignal (amount суммируется,
+old - первый, остальные поля - последние), а потребитель получает
+один SignalBatch на тело за тик вместо десятков вызовов.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Listener = Callable[..., Any]
+AnyListener = Callable[[Any, str, Dict[str, Any]], None]
+
+
+class SignalHub:
+    """Общая подписка на сигналы многих источников."""
+
+    def __init__(self, parent: Optional['SignalHub'] = None):
+        self._listeners: Dict[str, List[Listener]] = {}
+        self._any: List[AnyListener] = []
+        self.parent = parent
+
+    def on(self, event: str, callback: Listener) -> None:
+        self._listeners.setdefault(event, []).append(callback)
+
+    def off(self, event: str, callback: Listener) -> bool:
+        listeners = self._listeners.get(event)
+        if not listeners or callback not in listeners:
+            return False
+        listeners.remove(callback)
+        if not listeners:
+            del self._listeners[event]
+        return True
+
+    def on_any(self, callback: AnyListener) -> None:
+        """Подписка на все события: callback(source, event, data)."""
+        self._any.append(callback)
+
+    def off_any(self, callback: AnyListener) -> bool:
+        if callback not in self._any:
+            return False
+        self._any.remove(callback)
+        return True
+
+    @property
+    def active(self) -> bool:
+        """Есть ли подписчики у хаба или его родителей."""
+        hub = self
+        while hub is not None:
+            if hub._listeners or hub._any:
+                return True
+            hub = hub.parent
+        return False
+
+    def emit(self, source: Any, event: str, data: Dict[str, Any]) -> None:
+        hub = self
+        while hub is not None:
+            listeners = hub._listeners.get(event)
+            if listeners:
+                for cb in listeners:
+                    cb(source, **data)
+            if hub._any:
+                for cb in hub._any:
+                    cb(source, event, data)
+            hub = hub.parent
+
+
+@dataclass
+class CoalescedSignal:
+    """Одно или несколько одинаковых событий органа за тик."""
+    source: Any
+    event: str
+    count: int
+    data: Dict[str, Any]
+
+
+@dataclass
+class SignalBatch:
+    """Все слитые сигналы владельца (тела) за один тик."""
+    owner: Any
+    tick: int
+    signals: List[CoalescedSignal]
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    def by_event(self, event: str) -> List[CoalescedSignal]:
+        return [s for s in self.signals if s.event == event]
+
+
+class SignalCoalescer:
+    """Сбор сигналов хаба за тик и выдача одним SignalBatch в flush()."""
+
+    SUMMED = ("amount",)
+
+    def __init__(self, hub: SignalHub, owner: Any = None):
+        self.hub = hub
+        self.owner = owner
+        self.ticks = 0
+        self.received = 0
+        self.delivered = 0
+        self._pending: Dict[Tuple[int, str], CoalescedSignal] = {}
+        self._batch_listeners: List[Callable[[SignalBatch], None]] = []
+        hub.on_any(self._collect)
+
+    def on_batch(self, callback: Callable[[SignalBatch], None]) -> None:
+        self._batch_listeners.append(callback)
+
+    def _collect(self, source: Any, event: str, data: Dict[str, Any]) -> None:
+        self.received += 1
+        key = (id(source), event)
+        signal = self._pending.get(key)
+        if signal is None:
+            self._pending[key] = CoalescedSignal(source, event, 1, dict(data))
+            return
+        signal.count += 1
+        merged = signal.data
+        for name, value in data.items():
+            if name in self.SUMMED and name in merged:
+                merged[name] += value
+            elif name != "old" or name not in merged:
+                merged[name] = value
+
+    def flush(self) -> Optional[SignalBatch]:
+        """Закрыть тик: отдать накопленное подписчикам (пустой тик не выдаётся)."""
+        self.ticks += 1
+        if not self._pending:
+            return None
+        batch = SignalBatch(self.owner, self.ticks, list(self._pending.values()))
+        self._pending = {}
+        self.delivered += len(batch)
+        for cb in self._batch_listeners:
+            cb(batch)
+        return batch
+
+    def close(self) -> None:
+        """Отключиться от хаба (несданные сигналы отбрасываются)."""
+        self.hub.off_any(self._collect)
+        self._pending = {}
+
+
+class Emitter:
+    """Миксин источника сигналов (органы, внешность, тело)."""
+
+    _signals: Optional[Dict[str, List[Listener]]] = None
+    _hub: Optional[SignalHub] = None
+
+    def on(self, event: str, callback: Listener) -> None:
+        """Подписаться на событие."""
+        if self._signals is None:
+            self._signals = {}
+        self._signals.setdefault(event, []).append(callback)
+
+    def off(self, event: str, callback: Listener) -> bool:
+        """Отписаться от события."""
+        listeners = self._signals.get(event) if self._signals else None
+        if not listeners or callback not in listeners:
+            return False
+        listeners.remove(callback)
+        return True
+
+    @property
+    def observed(self) -> bool:
+        """Слушает ли кто-нибудь источник (напрямую или через хабы)."""
+        return bool(self._signals) or (self._hub is not None and self._hub.active)
+
+    def _emit(self, event: str, **data: Any) -> None:
+        """Вызвать обработчики события."""
+        signals = self._signals
+        if signals:
+            listeners = signals.get(event)
+            if listeners:
+                for cb in listeners:
+                    cb(self, **data)
+        if self._hub is not None:
+            self._hub.emit(self, event, data)
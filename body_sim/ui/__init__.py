@@ -3,14 +3,16 @@
 Интерфейс пользователя - консоль и рендеринг.
 """
 
-from body_sim.ui.console import run_console
+from body_sim.ui.console import run_console, run_live_console
 from body_sim.ui.rich_render import (
     render_body_list, render_full_body,
     render_breasts, render_genitals
 )
+from body_sim.ui.render_cache import RenderCache
 
 __all__ = [
-    "run_console",
+    "run_console", "run_live_console",
     "render_body_list", "render_full_body",
     "render_breasts", "render_genitals",
+    "RenderCache",
 ]
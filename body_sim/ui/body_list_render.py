@@ -332,7 +332,7 @@ class BodyListRenderer:
         return " ".join(parts) if parts else "[dim]-[/dim]"
     
     def render_body_list(self, bodies: List, active_idx: int = 0, 
-                        title: str = "Персонажи") -> Panel:
+                        title: str = "Персонажи", first_index: int = 0) -> Panel:
         """
         Основной метод рендера списка тел.
         
@@ -340,6 +340,7 @@ class BodyListRenderer:
             bodies: Список тел
             active_idx: Индекс активного/выбранного тела
             title: Заголовок панели
+            first_index: Номер первого тела (bodies - окно длинного списка)
         """
         if not bodies:
             return Panel("[dim]Нет персонажей[/dim]", title=title, box=box.ROUNDED)
@@ -379,7 +380,7 @@ class BodyListRenderer:
             table.add_column("Статусы", min_width=20)
         
         # Заполняем строки
-        for i, body in enumerate(bodies):
+        for i, body in enumerate(bodies, first_index):
             row = []
             
             # Маркер активного
@@ -555,10 +556,11 @@ class BodyListRenderer:
 
 def render_body_list(bodies: List, active_idx: int = 0, 
                     title: str = "Персонажи",
-                    config: Optional[BodyListConfig] = None) -> Panel:
+                    config: Optional[BodyListConfig] = None,
+                    first_index: int = 0) -> Panel:
     """Функция-обёртка для рендера списка тел."""
     renderer = BodyListRenderer(config=config)
-    return renderer.render_body_list(bodies, active_idx, title)
+    return renderer.render_body_list(bodies, active_idx, title, first_index)
 
 
 def render_compact_body_list(bodies: List, active_idx: int = 0) -> Panel:
@@ -12,6 +12,8 @@ from rich.text import Text
 from rich.tree import Tree
 from rich import box
 
+from body_sim.ui.render_cache import cached_panel
+
 if TYPE_CHECKING:
     from body_sim.anatomy.breast import Breast
     from body_sim.systems.grid import BreastGrid
@@ -541,7 +543,10 @@ class BreastRenderer:
                 if c_idx < len(row):
                     breast = row[c_idx]
                     label = grid.get_label(r_idx, c_idx) or f"[{r_idx},{c_idx}]"
-                    row_panels.append(self.render_breast_detailed(breast, label))
+                    row_panels.append(cached_panel(
+                        "breast_detailed", breast,
+                        lambda b=breast, l=label: self.render_breast_detailed(b, l),
+                        extra=label))
                 else:
                     row_panels.append(Text(""))
             
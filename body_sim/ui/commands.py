@@ -140,6 +140,7 @@ class CommandContext:
     running: bool = True
     last_result: Any = None
     registry: 'CommandRegistry' = None
+    reactions: Any = None  # ReactionPipeline, создаётся при первом tick
 
     @property
     def active_body(self):
@@ -636,79 +637,56 @@ def cmd_tick(args: List[str], ctx: CommandContext):
         body.tick(dt)
 
     # Автоматические реакции (breasts + uterus)
-    _process_auto_reactions(ctx.bodies, dt)
+    _process_auto_reactions(ctx)
 
     console.print(f"[green]Ticked {len(ctx.bodies)} bodies (dt={dt})[/green]")
 
 
-def _process_auto_reactions(bodies: List, dt: float):
-    """Обработать автоматические реакции для всех тел."""
-    for body in bodies:
-        profile_name = "default"
-        body_type = type(body).__name__.lower()
-
-        if "roxy" in body_type or "migurdia" in body_type:
-            profile_name = "roxy"
-        elif "misaka" in body_type:
-            profile_name = "misaka"
-
-        # Breast reactions
-        try:
-            from body_sim.characters.breast_reactions import get_reaction_system
-            breast_system = get_reaction_system()
-
-            if hasattr(body, 'has_breasts') and body.has_breasts:
-                reactions = breast_system.process_reactions(body, profile_name)
-                for reaction in reactions:
-                    _print_reaction(console, reaction, "Breast")
-        except:
-            pass
-
-        # Uterus reactions
-        try:
-            from body_sim.characters.uterus_reactions import get_uterus_reaction_system
-            uterus_system = get_uterus_reaction_system()
-
-            if hasattr(body, 'uterus_system') and body.uterus_system:
-                reactions = uterus_system.process_reactions(body, profile_name)
-                for reaction in reactions:
-                    _print_reaction(console, reaction, "Uterus")
-        except:
-            pass
-
-
-def _print_reaction(console, reaction, source: str):
-    """Вывести реакцию с цветовым кодированием."""
-    color_map = {
-        "neutral": "white",
-        "pleasure": "magenta",
-        "pain": "red",
-        "embarrassment": "yellow",
-        "panic": "bright_red",
-        "tsundere": "bright_cyan",
-        "discomfort": "yellow",
-        "surprise": "cyan",
-        "shock": "bright_cyan",
-        "sadness": "blue",
-        "denial": "dim",
-        "anxiety": "yellow",
-        "confusion": "yellow",
-        "wonder": "green",
-        "fear": "bright_red",
-        "weird": "yellow",
-        "overwhelm": "red",
-        "agony": "bright_red",
-        "dissociation": "dim",
-        "unconscious": "dim",
-        "panic_embarrassment": "bright_yellow",
-        "pleasure_pain": "magenta",
-    }
-    color = color_map.get(reaction.emotion, "white")
-    prefix = f"[{source}]"
-
-    console.print(f"\n[{color}]{prefix} {reaction.text}[/{color}]")
+def _process_auto_reactions(ctx: CommandContext) -> None:
+    """Один проход конвейера реакций по всем телам, вывод - одной записью."""
+    if ctx.reactions is None:
+        from body_sim.reactions.pipeline import ReactionPipeline
+        ctx.reactions = ReactionPipeline()
+
+    collected = ctx.reactions.run(ctx.bodies)
+    if collected:
+        console.print("\n".join(_format_reaction(reaction, source)
+                                for _, source, reaction in collected))
+
+
+_REACTION_COLORS = {
+    "neutral": "white",
+    "pleasure": "magenta",
+    "pain": "red",
+    "embarrassment": "yellow",
+    "panic": "bright_red",
+    "tsundere": "bright_cyan",
+    "discomfort": "yellow",
+    "surprise": "cyan",
+    "shock": "bright_cyan",
+    "sadness": "blue",
+    "denial": "dim",
+    "anxiety": "yellow",
+    "confusion": "yellow",
+    "wonder": "green",
+    "fear": "bright_red",
+    "weird": "yellow",
+    "overwhelm": "red",
+    "agony": "bright_red",
+    "dissociation": "dim",
+    "unconscious": "dim",
+    "panic_embarrassment": "bright_yellow",
+    "pleasure_pain": "magenta",
+}
+
+
+def _format_reaction(reaction, source: str) -> str:
+    """Разметка rich для реакции с цветовым кодированием."""
+    color = _REACTION_COLORS.get(reaction.emotion, "white")
+    text = f"\n[{color}]\\[{source}] {reaction.text}[/{color}]"
     if reaction.sound_effect:
-        console.print(f"[dim italic]{reaction.sound_effect}[/dim italic]")
+        text += f"\n[dim italic]{reaction.sound_effect}[/dim italic]"
+    return text
 
 
 # ============ НОВАЯ КОМАНДА BREASTS ============
@@ -7,11 +7,8 @@ import sys
 from typing import List, Optional
 
 from rich.console import Console
-from rich.live import Live
 from rich.panel import Panel
-from rich.layout import Layout
 from rich.prompt import Prompt
-from rich.text import Text
 
 from body_sim.ui.commands import CommandContext, create_registry
 
@@ -66,51 +63,20 @@ def run_console(bodies: List):
     console.print("[dim]Console closed[/dim]")
 
 
-def run_live_console(bodies: List, refresh_rate: float = 1.0):
-    """Запустить консоль с live-обновлением экрана."""
+def run_live_console(bodies: List, max_fps: float = 10.0, ticks_per_second: float = 10.0):
+    """
+    Запустить консоль с live-обновлением экрана: симуляция идёт в фоне,
+    экран перерисовывается не чаще max_fps (см. body_sim.ui.live).
+    """
+    from body_sim.ui.live import run_live
+
     registry = create_registry()
     ctx = CommandContext(bodies=bodies, registry=registry)  # Передаём registry здесь
 
-    layout = Layout()
-    layout.split_column(
-        Layout(name="header", size=3),
-        Layout(name="main"),
-        Layout(name="input", size=1)
-    )
-
-    def update_layout():
-        from body_sim.ui.rich_render import render_body_list, render_full_body
-        
-        header = Text("Breast & Body Simulation", justify="center", style="bold cyan")
-        layout["header"].update(Panel(header, border_style="cyan"))
-
-        if ctx.active_body:
-            layout["main"].update(render_full_body(ctx.active_body))
-        else:
-            layout["main"].update(Panel("No body selected", border_style="red"))
-
-        body_name = ctx.active_body.name if ctx.active_body else "none"
-        layout["input"].update(Text(f"{body_name} > ", style="cyan"))
-
-    console.print("[yellow]Live mode - press Ctrl+C to enter command mode[/yellow]")
-
-    try:
-        with Live(layout, console=console, refresh_per_second=1/refresh_rate) as live:
-            import time
-            import select
-
-            while ctx.running:
-                update_layout()
-
-                # Проверяем ввод (non-blocking)
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                    line = input().strip()
-                    if line:
-                        registry.execute(line, ctx)
-
-                time.sleep(refresh_rate)
-    except KeyboardInterrupt:
-        pass
+    console.print("[yellow]Live mode - type commands, 'pause'/'resume', Ctrl+C to enter command mode[/yellow]")
+    stats = run_live(ctx, console, max_fps=max_fps, ticks_per_second=ticks_per_second)
+    console.print(f"[dim]Live: {stats['steps']} steps, {stats['frames']} frames "
+                  f"({stats['skipped_frames']} skipped)[/dim]")
 
     # Переходим в обычный режим
-    run_console(bodies)
\ No newline at end of file
+    run_console(bodies)
@@ -8,6 +8,8 @@ from rich.table import Table
 from rich.columns import Columns
 from rich import box
 
+from body_sim.ui.render_cache import cached_panel, organ_stamp
+
 
 def render_penis(penis, index: int = 0) -> Panel:
     """Отобразить пенис с информацией о типе и эякуляции."""
@@ -425,19 +427,26 @@ def render_genitals(body) -> Panel:
     
     if body.has_penis:
         for i, penis in enumerate(body.penises):
-            panels.append(render_penis(penis, i))
+            panels.append(cached_panel(
+                "penis", penis, lambda o=penis, i=i: render_penis(o, i),
+                # запас семени - из мошонки; эрекцию снимает проникновение
+                # прямой записью, мимо версии
+                extra=(i, penis.is_erect, penis.scrotum and organ_stamp(penis.scrotum))))
     
     if body.has_vagina:
         for i, vagina in enumerate(body.vaginas):
-            panels.append(render_vagina(vagina, i))
+            panels.append(cached_panel(
+                "vagina", vagina, lambda o=vagina, i=i: render_vagina(o, i), extra=i))
     
     if body.has_scrotum:
         for i, scrotum in enumerate(body.scrotums):
-            panels.append(render_scrotum(scrotum, i))
+            panels.append(cached_panel(
+                "scrotum", scrotum, lambda o=scrotum, i=i: render_scrotum(o, i), extra=i))
     
     if hasattr(body, 'anuses') and body.anuses:
         for i, anus in enumerate(body.anuses):
-            panels.append(render_anus(anus, i))
+            panels.append(cached_panel(
+                "anus", anus, lambda o=anus, i=i: render_anus(o, i), extra=i))
     
     if not panels:
         return Panel(
@@ -0,0 +1,344 @@
+# body_sim/ui/live.py
+"""
+Живой режим консоли: симуляция в фоне, экран - с ограниченным FPS.
+
+SimulationThread шагает World под общим замком с заданной частотой
+тиков. LiveDashboard раз в кадр берёт замок и собирает кадр: каждая
+область экрана (заголовок, список тел, активное тело, журнал реакций)
+пересобирается, только если изменился её ключ (версии видимых тел,
+номер записи журнала), и оборачивается в CachedRenderable - готовые
+rich-объекты держат строки, а не ссылки на органы, так что вывод идёт
+уже без замка. Если ни одна область не изменилась, кадр не рисуется.
+
+Список тел показывает только окно вокруг активного тела: сотни тел не
+дороже десятка.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+import threading
+import time
+
+from rich.console import Console, RenderableType
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.text import Text
+
+from body_sim.ui.render_cache import CachedRenderable
+from body_sim.world.world import World
+
+
+def body_version(body: Any) -> Any:
+    """Версия тела для ключа кадра (None - тело без версий, только шаг мира)."""
+    return getattr(body, "version", None)
+
+
+class SimulationThread(threading.Thread):
+    """Фоновый цикл мира: world.step() с частотой ticks_per_second (0 - без паузы)."""
+
+    # Отставание (секунд), после которого цикл не догоняет, а начинает отсчёт заново
+    MAX_LAG = 0.5
+
+    def __init__(self, world: World, lock: threading.Lock, ticks_per_second: float = 10.0):
+        super().__init__(name="body-sim-live", daemon=True)
+        self.world = world
+        self.lock = lock
+        self.ticks_per_second = ticks_per_second
+        self.paused = False
+        self.rate = 0.0
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        clock = time.perf_counter
+        wait = self._stop_event.wait
+        interval = 1.0 / self.ticks_per_second if self.ticks_per_second > 0 else 0.0
+        next_at = window_start = clock()
+        window_steps = 0
+
+        while not self._stop_event.is_set():
+            if self.paused:
+                wait(0.05)
+                next_at = window_start = clock()
+                window_steps = 0
+                self.rate = 0.0
+                continue
+
+            with self.lock:
+                self.world.step()
+            window_steps += 1
+
+            now = clock()
+            if now - window_start >= 1.0:
+                self.rate = window_steps / (now - window_start)
+                window_start, window_steps = now, 0
+
+            if not interval:
+                # Отдать замок кадру: Lock не честный
+                time.sleep(0)
+                continue
+            next_at += interval
+            delay = next_at - now
+            if delay > 0:
+                wait(delay)
+            elif delay < -self.MAX_LAG:
+                next_at = now
+
+
+@dataclass
+class Region:
+    """Область экрана и ключ видимого состояния, по которому она собрана."""
+    name: str
+    # Не чаще раза в interval секунд (изменение ждёт следующего разрешённого кадра)
+    interval: float = 0.0
+    key: Any = None
+    built_at: float = 0.0
+    builds: int = 0
+
+
+class LiveDashboard:
+    """Кадры живого режима: пересборка только изменившихся областей."""
+
+    HEADER_SIZE = 3
+    LOG_SIZE = 7
+    LIST_RATIO = 2
+    MAIN_RATIO = 3
+    # Дорогие области: список тел и панель активного тела
+    REGION_INTERVALS = {"list": 1.0, "main": 0.25}
+
+    def __init__(self, ctx: Any, world: World, sim: SimulationThread,
+                 console: Console, lock: threading.Lock):
+        self.ctx = ctx
+        self.world = world
+        self.sim = sim
+        self.console = console
+        self.lock = lock
+        self.frames = 0
+        self.skipped = 0
+        self.fps = 0.0
+        self.log: deque = deque(maxlen=self.LOG_SIZE - 2)
+        self.log_count = 0
+
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(name="header", size=self.HEADER_SIZE),
+            Layout(name="body"),
+            Layout(name="log", size=self.LOG_SIZE),
+            Layout(name="input", size=1),
+        )
+        self.layout["body"].split_row(
+            Layout(name="list", ratio=self.LIST_RATIO),
+            Layout(name="main", ratio=self.MAIN_RATIO),
+        )
+        self.regions: Dict[str, Region] = {
+            name: Region(name, self.REGION_INTERVALS.get(name, 0.0))
+            for name in ("header", "list", "main", "log", "input")
+        }
+        self._builders: Dict[str, Callable[[], RenderableType]] = {
+            "header": self._build_header,
+            "list": self._build_list,
+            "main": self._build_main,
+            "log": self._build_log,
+            "input": self._build_input,
+        }
+
+    # ---------- Реакции ----------
+
+    def on_reaction(self, body: Any, source: str, reaction: Any) -> None:
+        """Обработчик World.on_reaction (вызывается под замком шага)."""
+        from body_sim.ui.commands import _format_reaction
+
+        name = getattr(body, "name", "?")
+        self.log.append(f"[bold]{name}[/bold] " + _format_reaction(reaction, source).strip())
+        self.log_count += 1
+
+    # ---------- Ключи ----------
+
+    def _window(self) -> range:
+        """Индексы тел, которые помещаются в список."""
+        count = len(self.ctx.bodies)
+        rows = max(3, self.console.size.height - self.HEADER_SIZE - self.LOG_SIZE - 1 - 6)
+        active = self.ctx.active_body_idx
+        start = max(0, min(active - rows // 2, count - rows))
+        return range(start, min(count, start + rows))
+
+    def _keys(self) -> Dict[str, Any]:
+        ctx, world = self.ctx, self.world
+        active = ctx.active_body
+        # Тело без версий меняется с каждым шагом мира
+        active_version = body_version(active) if active is not None else None
+        step = ("step", world.step_count)
+        if active is not None and active_version is None:
+            active_version = step
+        window = self._window()
+        bodies = ctx.bodies
+        versions = []
+        for i in window:
+            version = body_version(bodies[i])
+            versions.append((id(bodies[i]), step if version is None else version))
+        return {
+            "header": (world.step_count, self.sim.paused, round(self.sim.rate), round(self.fps),
+                       len(bodies)),
+            "list": (window.start, ctx.active_body_idx, tuple(versions)),
+            "main": (id(active), active_version),
+            "log": self.log_count,
+            "input": (getattr(active, "name", None), self.sim.paused),
+        }
+
+    # ---------- Области ----------
+
+    def _build_header(self) -> RenderableType:
+        world, sim = self.world, self.sim
+        state = "[yellow]paused[/yellow]" if sim.paused else f"{sim.rate:.0f} ticks/s"
+        text = Text.from_markup(
+            f"[bold cyan]Breast & Body Simulation[/bold cyan]  "
+            f"step {world.step_count} | t={world.time:.0f} | {state} | "
+            f"{self.fps:.0f} fps | bodies {len(self.ctx.bodies)}",
+            justify="center",
+        )
+        return Panel(text, border_style="cyan")
+
+    def _build_list(self) -> RenderableType:
+        from body_sim.ui.rich_render import render_body_list
+
+        window = self._window()
+        return render_body_list(self.ctx.bodies[window.start:window.stop],
+                                self.ctx.active_body_idx, first_index=window.start)
+
+    def _build_main(self) -> RenderableType:
+        from body_sim.ui.rich_render import render_full_body
+
+        active = self.ctx.active_body
+        if active is None:
+            return Panel("No body selected", border_style="red")
+        return render_full_body(active)
+
+    def _build_log(self) -> RenderableType:
+        text = "\n".join(self.log) if self.log else "[dim]Нет реакций[/dim]"
+        return Panel(text, title="Реакции", border_style="dim")
+
+    def _build_input(self) -> RenderableType:
+        body_name = self.ctx.active_body.name if self.ctx.active_body else "none"
+        hint = " [dim](paused - 'resume' to continue)[/dim]" if self.sim.paused else ""
+        return Text.from_markup(f"[cyan]{body_name} > [/cyan]{hint}")
+
+    # ---------- Кадр ----------
+
+    def invalidate(self) -> None:
+        """Пересобрать все области в следующем кадре (после команды)."""
+        for region in self.regions.values():
+            region.key = None
+
+    def update(self) -> bool:
+        """
+        Собрать кадр под замком. Возвращает False, если ничего видимого
+        не изменилось и перерисовывать экран не нужно.
+        """
+        changed = False
+        now = time.perf_counter()
+        with self.lock:
+            keys = self._keys()
+            for name, key in keys.items():
+                region = self.regions[name]
+                if region.key is not None and (region.key == key
+                                               or now - region.built_at < region.interval):
+                    continue
+                self.layout[name].update(CachedRenderable(self._builders[name]()))
+                region.key = key
+                region.built_at = now
+                region.builds += 1
+                changed = True
+        if changed:
+            self.frames += 1
+        else:
+            self.skipped += 1
+        return changed
+
+
+def run_live(ctx: Any, console: Console, max_fps: float = 10.0,
+             ticks_per_second: float = 10.0, dt: float = 1.0) -> Dict[str, Any]:
+    """
+    Живой режим: мир крутится в фоне, экран обновляется не чаще max_fps
+    и только при видимых изменениях. Команды вводятся как в консоли,
+    плюс pause/resume; выход - Ctrl+C или quit. Возвращает статистику.
+    """
+    import select
+    import sys
+
+    if ctx.reactions is None:
+        from body_sim.reactions.pipeline import ReactionPipeline
+        ctx.reactions = ReactionPipeline()
+
+    lock = threading.Lock()
+    world = World(ctx.bodies, dt=dt, reactions=False)
+    world.enable_reactions(ctx.reactions)
+    sim = SimulationThread(world, lock, ticks_per_second)
+    dashboard = LiveDashboard(ctx, world, sim, console, lock)
+    world.on_reaction = dashboard.on_reaction
+
+    frame_interval = 1.0 / max_fps
+    clock = time.perf_counter
+    fps_start, fps_frames = clock(), 0
+
+    sim.start()
+    try:
+        with Live(dashboard.layout, console=console, auto_refresh=False) as live:
+            next_frame = clock()
+            while ctx.running:
+                now = clock()
+                if now >= next_frame:
+                    if dashboard.update():
+                        live.refresh()
+                        fps_frames += 1
+                    if now - fps_start >= 1.0:
+                        dashboard.fps = fps_frames / (now - fps_start)
+                        fps_start, fps_frames = now, 0
+                    next_frame = max(next_frame + frame_interval, now)
+
+                # Ввод ждём до следующего кадра
+                timeout = max(0.0, next_frame - clock())
+                if sys.stdin in select.select([sys.stdin], [], [], timeout)[0]:
+                    line = sys.stdin.readline()
+                    if not line:
+                        break
+                    _execute(line.strip(), ctx, world, sim, lock)
+                    dashboard.invalidate()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.stop()
+        sim.join()
+
+    return {
+        "steps": world.step_count,
+        "frames": dashboard.frames,
+        "skipped_frames": dashboard.skipped,
+        "region_builds": {name: r.builds for name, r in dashboard.regions.items()},
+    }
+
+
+def _execute(line: str, ctx: Any, world: World, sim: SimulationThread,
+             lock: threading.Lock) -> None:
+    if not line:
+        return
+    if line in ("pause", "resume"):
+        sim.paused = line == "pause"
+        return
+    with lock:
+        ctx.registry.execute(line, ctx)
+        _sync_bodies(world, ctx.bodies)
+
+
+def _sync_bodies(world: World, bodies: List[Any]) -> None:
+    """Команды могли добавить или удалить тела - привести мир к списку консоли."""
+    present = {id(b) for b in bodies}
+    for body in [b for b in world.bodies if id(b) not in present]:
+        world.remove_body(body)
+    known = {id(b) for b in world.bodies}
+    for body in bodies:
+        if id(body) not in known:
+            world.add_body(body)
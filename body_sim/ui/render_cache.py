@@ -0,0 +1,120 @@
+# body_sim/ui/render_cache.py
+"""
+Кеш отрисовки органов.
+
+Панель органа строится заново, только если изменился его отпечаток
+(organ_stamp: version органа и rest_key - прямую запись в поля видно
+сразу, без ожидания тика). Готовая панель обёрнута в CachedRenderable:
+строки сегментов запоминаются по ширине, так что при повторном show
+неизменившиеся подпанели не пересчитываются даже при выводе. Внешние
+панели (сетка, система матки, гениталии) собираются заново - дёшево.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+import weakref
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+
+
+def organ_stamp(organ: Any) -> Any:
+    """Отпечаток состояния органа (None - органу нельзя доверять кеш)."""
+    version = getattr(organ, "version", None)
+    if version is None:
+        return None
+    return (version, organ.rest_key())
+
+
+class CachedRenderable:
+    """Готовый rich-объект с запомненными строками сегментов по параметрам вывода."""
+
+    def __init__(self, renderable: RenderableType):
+        self.renderable = renderable
+        self._lines: Dict[tuple, List[List[Segment]]] = {}
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement.get(console, options, self.renderable)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        key = (options.min_width, options.max_width, options.height, options.justify,
+               options.overflow, options.no_wrap, options.legacy_windows, options.encoding)
+        lines = self._lines.get(key)
+        if lines is None:
+            lines = self._lines[key] = console.render_lines(self.renderable, options, pad=False)
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+class RenderCache:
+    """Панели органов: (раздел, орган) -> (отпечаток, CachedRenderable)."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[Hashable, int], Tuple[Any, Any, CachedRenderable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, section: Hashable, organ: Any, stamp: Any,
+                     build: Callable[[], RenderableType]) -> RenderableType:
+        """Панель из кеша или build() (stamp None - без кеша)."""
+        if stamp is None:
+            self.misses += 1
+            return build()
+        key = (section, id(organ))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is organ and entry[1] == stamp:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        cached = CachedRenderable(build())
+        if entry is None and len(self._entries) >= self.maxsize:
+            self._prune()
+        self._entries[key] = (weakref.ref(organ), stamp, cached)
+        return cached
+
+    def _prune(self) -> None:
+        """Убрать записи удалённых органов, а если не помогло - самую старую половину."""
+        dead = [key for key, entry in self._entries.items() if entry[0]() is None]
+        for key in dead:
+            del self._entries[key]
+        if len(self._entries) >= self.maxsize:
+            for key in list(self._entries)[:len(self._entries) // 2]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def report(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Общий кеш панелей органов
+render_cache = RenderCache()
+
+
+def cached_panel(section: Hashable, organ: Any, build: Callable[[], RenderableType],
+                 stamp: Optional[Any] = None, extra: Any = None) -> RenderableType:
+    """
+    Панель органа через общий кеш.
+
+    stamp по умолчанию - organ_stamp(organ); extra - всё, что ещё
+    попадает в панель (подпись, связанные органы).
+    """
+    if stamp is None:
+        stamp = organ_stamp(organ)
+        if stamp is None:
+            return build()
+    return render_cache.get_or_build(section, organ, (stamp, extra), build)
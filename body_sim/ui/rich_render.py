@@ -33,6 +33,7 @@ from body_sim.ui.breast_render import (
     render_breast_compact
 )
 from body_sim.ui.body_list_render import render_body_list
+from body_sim.ui.render_cache import cached_panel
 
 console = Console()
 
@@ -327,16 +328,16 @@ def render_breasts(grid, compact: bool = False) -> RenderableType:
     leak_str = f" [red]L:{leaking_count}[/red]" if leaking_count > 0 else ""
     header_text = f"🍼 B:{total_breasts} | 💧{total_filled:.0f}/{total_capacity:.0f}ml ({fill_pct:.0f}%){leak_str}"
     
-    # Используем новый рендер сетки
-    grid_panel = renderer.render_grid(grid, title=header_text)
-    
     # Адаптируем стиль под компактный вид
     if compact and len(grid.rows) == 1 and len(grid.rows[0]) <= 2:
         # Для 1-2 грудей используем компактные панели
         panels = []
         for c_idx, breast in enumerate(grid.rows[0]):
             label = grid.get_label(0, c_idx)
-            panels.append(renderer.render_breast_compact(breast, label))
+            panels.append(cached_panel(
+                "breast_compact", breast,
+                lambda b=breast, l=label: renderer.render_breast_compact(b, l),
+                extra=label))
         
         return Panel(
             Columns(panels, equal=True, expand=True),
@@ -346,7 +347,8 @@ def render_breasts(grid, compact: bool = False) -> RenderableType:
             padding=(0, 1)
         )
     
-    return grid_panel
+    # Используем новый рендер сетки
+    return renderer.render_grid(grid, title=header_text)
 
 
 # ======================
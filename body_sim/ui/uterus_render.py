@@ -15,6 +15,30 @@ from rich.layout import Layout
 from rich.align import Align
 from rich import box
 
+from body_sim.ui.render_cache import cached_panel, organ_stamp
+
+# Поля, которые панели показывают мимо rest_key матки
+_TUBE_FIELDS = ('state', 'current_length', 'current_stretch', 'diameter', 'contained_fluid',
+                'contained_ovum', 'can_prolapse_ovary', 'uterine_opening_visible')
+_OVARY_FIELDS = ('state', 'follicle_count', 'follicle_sizes', 'is_everted', 'prolapse_degree',
+                 'visible_externally', 'length', 'width', 'thickness')
+
+
+def _fields_stamp(obj: Any, names: tuple) -> tuple:
+    return tuple(tuple(v) if isinstance(v, list) else v
+                 for v in (getattr(obj, name, None) for name in names))
+
+
+def _uterus_stamp(uterus: Any) -> Any:
+    """Отпечаток панели матки (None - без кеша)."""
+    stamp = organ_stamp(uterus)
+    if stamp is None:
+        return None
+    mixture = getattr(uterus, 'mixture', None)
+    return (stamp, getattr(mixture, 'version', None), len(getattr(uterus, 'inserted_objects', ())),
+            getattr(uterus, 'muscle_tone', None), getattr(uterus, 'ligament_integrity', None),
+            getattr(uterus, 'pelvic_floor_strength', None))
+
 
 class UterusRenderer:
     """Улучшенный рендерер системы матки с визуализацией пролапса."""
@@ -373,7 +397,10 @@ class UterusRenderer:
             uterus = uteri[0]
             
             # Основная матка
-            uterus_panel = self.render_uterus_detailed(uterus, "Матка")
+            stamp = _uterus_stamp(uterus)
+            uterus_panel = cached_panel(
+                "uterus_detailed", uterus,
+                lambda: self.render_uterus_detailed(uterus, "Матка"), stamp=stamp)
             
             # Трубы и яичники
             tubes = getattr(uterus, 'tubes', [])
@@ -383,10 +410,16 @@ class UterusRenderer:
             
             if tubes:
                 for tube in tubes:
-                    tube_panel = self.render_tube_detailed(tube, compact=True)
+                    tube_panel = cached_panel(
+                        "tube_compact", tube,
+                        lambda t=tube: self.render_tube_detailed(t, compact=True),
+                        stamp=stamp and (stamp, _fields_stamp(tube, _TUBE_FIELDS)))
                     ovary = getattr(tube, 'ovary', None)
                     if ovary:
-                        ovary_panel = self.render_ovary_detailed(ovary, compact=True)
+                        ovary_panel = cached_panel(
+                            "ovary_compact", ovary,
+                            lambda o=ovary: self.render_ovary_detailed(o, compact=True),
+                            stamp=stamp and (stamp, _fields_stamp(ovary, _OVARY_FIELDS)))
                         # Объединяем трубу и яичник
                         combined = Table(box=None, show_header=False)
                         combined.add_row(tube_panel)
@@ -414,7 +447,11 @@ class UterusRenderer:
         # Множественные матки (фантастика)
         uterus_panels = []
         for i, uterus in enumerate(uteri):
-            panel = self.render_uterus_detailed(uterus, f"Матка {i+1}")
+            label = f"Матка {i+1}"
+            panel = cached_panel(
+                "uterus_detailed", uterus,
+                lambda u=uterus, l=label: self.render_uterus_detailed(u, l),
+                stamp=_uterus_stamp(uterus), extra=label)
             uterus_panels.append(panel)
         
         return Panel(
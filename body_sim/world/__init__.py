@@ -0,0 +1,14 @@
+# body_sim/world/__init__.py
+"""
+Мир симуляции - headless-планировщик тиков для множества тел.
+"""
+
+from body_sim.world.world import World, PhaseTimings, profile_for_body
+from body_sim.world.parallel import (
+    ShardedWorld, BodySummary, summarize_body, partition_bodies
+)
+
+__all__ = [
+    "World", "PhaseTimings", "profile_for_body",
+    "ShardedWorld", "BodySummary", "summarize_body", "partition_bodies",
+]
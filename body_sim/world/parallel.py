@@ -0,0 +1,249 @@
+# body_sim/world/parallel.py
+"""
+Параллельный мир: тела шардируются по постоянным процессам-воркерам.
+
+Каждый воркер держит у себя свой World с телами шарда; родитель
+обменивается с ним только командами и компактными сводками
+(BodySummary), а не состоянием тел. Тела, связанные через
+CrossBodyPenetration, всегда попадают в один шард.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import math
+import multiprocessing
+import os
+import time
+import traceback
+
+from body_sim.world.world import World, PhaseTimings
+
+
+class BodySummary(NamedTuple):
+    """Компактная сводка тела после шага (дёшево пересылается между процессами)."""
+    name: str
+    arousal: float
+    pleasure: float
+    breast_filled: float
+    uterus_filled: float
+    cum_stored: float
+
+
+def summarize_body(body: Any) -> BodySummary:
+    stats = body.stats
+    grid = getattr(body, "breast_grid", None)
+    breast_filled = sum(b.filled for b in grid.all()) if grid is not None else 0.0
+    uterus_system = getattr(body, "uterus_system", None)
+    uterus_filled = sum(u.filled for u in uterus_system.uteri) if uterus_system else 0.0
+    cum_stored = body.total_cum_storage if hasattr(body, "total_cum_storage") else 0.0
+    return BodySummary(body.name, stats.arousal, stats.pleasure,
+                       breast_filled, uterus_filled, cum_stored)
+
+
+def _unwrap(body: Any) -> Any:
+    return getattr(body, "body", body)
+
+
+def partition_bodies(bodies: List[Any], shards: int,
+                     links: Iterable[Any] = ()) -> List[List[int]]:
+    """
+    Разбить тела на шарды (списки индексов).
+
+    Связанные тела (body.active_sex и явные links - CrossBodyPenetration
+    или пары тел) объединяются в группы, группы раскладываются по шардам
+    жадно от крупных к мелким.
+    """
+    index = {id(_unwrap(b)): i for i, b in enumerate(bodies)}
+    parent = list(range(len(bodies)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(a: Any, b: Any) -> None:
+        ia = index.get(id(_unwrap(a)))
+        ib = index.get(id(_unwrap(b)))
+        if ia is not None and ib is not None:
+            parent[find(ia)] = find(ib)
+
+    pairs: List[Tuple[Any, Any]] = []
+    for body in bodies:
+        encounter = getattr(_unwrap(body), "active_sex", None)
+        if encounter is not None:
+            pairs.append((encounter.source, encounter.target))
+    for link in links:
+        if isinstance(link, tuple):
+            pairs.append(link)
+        else:
+            pairs.append((link.source, link.target))
+    for a, b in pairs:
+        union(a, b)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(bodies)):
+        groups.setdefault(find(i), []).append(i)
+
+    shards = max(1, min(shards, len(groups)))
+    result: List[List[int]] = [[] for _ in range(shards)]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(result, key=len).extend(group)
+    for shard in result:
+        shard.sort()
+    return result
+
+
+def _worker_main(conn, bodies: List[Any], dt: float, substeps: int, reactions: bool) -> None:
+    """Цикл воркера: держит World шарда и отвечает на команды родителя."""
+    world = World(bodies, dt=dt, substeps=substeps, reactions=reactions)
+    while True:
+        try:
+            command, arg = conn.recv()
+        except EOFError:
+            break
+        try:
+            if command == "step":
+                world.step(arg)
+                summaries = [summarize_body(b) for b in world.bodies]
+                timings = (world.timings.organs, world.timings.reactions,
+                           world.timings.magic, world.timings.steps)
+                conn.send(("ok", (world.time, summaries, timings)))
+            elif command == "fetch":
+                conn.send(("ok", world.bodies))
+            elif command == "stop":
+                conn.send(("ok", None))
+                break
+            else:
+                conn.send(("error", f"unknown command: {command}"))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+    conn.close()
+
+
+class ShardedWorld:
+    """
+    Мир, продвигающий шарды тел параллельно в процессах-воркерах.
+
+    После передачи тел воркерам родитель не держит их живое состояние:
+    summaries содержит BodySummary по всем телам (в исходном порядке),
+    gather() забирает сами тела обратно (требует их сериализуемости).
+    """
+
+    def __init__(self, bodies: List[Any], workers: Optional[int] = None,
+                 dt: float = 1.0, substeps: int = 1, reactions: bool = True,
+                 links: Iterable[Any] = ()):
+        if dt <= 0:
+            raise ValueError(f"dt must be positive, got {dt}")
+
+        self.dt = dt
+        self.substeps = substeps
+        self.time = 0.0
+        self.step_count = 0
+        self.body_count = len(bodies)
+        self.timings = PhaseTimings()
+        self.wall_time = 0.0
+        self.summaries: List[Optional[BodySummary]] = [None] * len(bodies)
+
+        workers = workers or os.cpu_count() or 1
+        self.shards = partition_bodies(bodies, workers, links)
+
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+        self._conns = []
+        self._procs = []
+        for shard in self.shards:
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(
+                target=_worker_main,
+                args=(child_conn, [bodies[i] for i in shard], dt, substeps, reactions),
+                daemon=True,
+            )
+            proc.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+        self._shard_timings = [(0.0, 0.0, 0.0, 0)] * len(self.shards)
+
+    def _broadcast(self, command: str, arg: Any = None) -> List[Any]:
+        for conn in self._conns:
+            conn.send((command, arg))
+        results = []
+        for i, conn in enumerate(self._conns):
+            status, payload = conn.recv()
+            if status != "ok":
+                raise RuntimeError(f"Shard {i} failed:\n{payload}")
+            results.append(payload)
+        return results
+
+    def step(self, n: int = 1) -> None:
+        """Продвинуть все шарды на n шагов (одна команда на шард)."""
+        if n <= 0:
+            return
+        start = time.perf_counter()
+        results = self._broadcast("step", n)
+        self.wall_time += time.perf_counter() - start
+
+        for i, (shard, (_, summaries, timings)) in enumerate(zip(self.shards, results)):
+            for idx, summary in zip(shard, summaries):
+                self.summaries[idx] = summary
+            self._shard_timings[i] = timings
+
+        self.step_count += n
+        self.time = self.step_count * self.dt
+        # Фазы суммируются по всем процессам (CPU-время шардов, не wall-clock)
+        self.timings.organs = sum(t[0] for t in self._shard_timings)
+        self.timings.reactions = sum(t[1] for t in self._shard_timings)
+        self.timings.magic = sum(t[2] for t in self._shard_timings)
+        self.timings.steps = self.step_count
+
+    def run_until(self, t: float) -> int:
+        remaining = (t - self.time) / self.dt
+        steps = max(0, math.floor(remaining + 1e-9))
+        self.step(steps)
+        return steps
+
+    def gather(self) -> List[Any]:
+        """Забрать тела из воркеров в исходном порядке."""
+        bodies: List[Any] = [None] * self.body_count
+        for shard, shard_bodies in zip(self.shards, self._broadcast("fetch")):
+            for idx, body in zip(shard, shard_bodies):
+                bodies[idx] = body
+        return bodies
+
+    def report(self) -> Dict[str, Any]:
+        data = {
+            "time": self.time,
+            "bodies": self.body_count,
+            "shards": len(self.shards),
+            "dt": self.dt,
+            "substeps": self.substeps,
+            "wall_s": round(self.wall_time, 4),
+            "steps_per_s": round(self.step_count / self.wall_time, 2) if self.wall_time else 0.0,
+        }
+        data.update(self.timings.report())
+        return data
+
+    def close(self) -> None:
+        """Остановить воркеры."""
+        if not self._procs:
+            return
+        for conn in self._conns:
+            try:
+                conn.send(("stop", None))
+                conn.recv()
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+            conn.close()
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        self._conns = []
+        self._procs = []
+
+    def __enter__(self) -> 'ShardedWorld':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
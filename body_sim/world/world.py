@@ -0,0 +1,197 @@
+# body_sim/world/world.py
+"""
+Headless-мир: владеет телами и крутит фиксированный шаг симуляции.
+
+Не зависит от консоли, реестра команд и rich - годится для пакетных
+прогонов на тысячи тиков.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import math
+import time
+
+from body_sim.reactions.pipeline import ReactionPipeline, profile_for_body
+from body_sim.systems.signals import SignalHub
+
+
+@dataclass
+class PhaseTimings:
+    """Накопленное время по фазам шага (секунды)."""
+    organs: float = 0.0
+    reactions: float = 0.0
+    magic: float = 0.0
+    steps: int = 0
+
+    @property
+    def total(self) -> float:
+        return self.organs + self.reactions + self.magic
+
+    def reset(self) -> None:
+        self.organs = self.reactions = self.magic = 0.0
+        self.steps = 0
+
+    def report(self) -> Dict[str, Any]:
+        """Сводка: суммарное время и среднее на шаг в миллисекундах."""
+        per_step = 1000.0 / self.steps if self.steps else 0.0
+        return {
+            "steps": self.steps,
+            "total_s": round(self.total, 4),
+            "organs_s": round(self.organs, 4),
+            "reactions_s": round(self.reactions, 4),
+            "magic_s": round(self.magic, 4),
+            "organs_ms_per_step": round(self.organs * per_step, 4),
+            "reactions_ms_per_step": round(self.reactions * per_step, 4),
+            "magic_ms_per_step": round(self.magic * per_step, 4),
+        }
+
+
+class World:
+    """
+    Мир с фиксированным шагом.
+
+    Один шаг = ``substeps`` тиков органов с ``dt / substeps``, затем один
+    проход реакций, рассылка отложенных событий (EventBus с queued=True)
+    и один magic_tick на каждое тело.
+    """
+
+    def __init__(self, bodies: Optional[List[Any]] = None, dt: float = 1.0,
+                 substeps: int = 1, reactions: bool = True,
+                 on_reaction: Optional[Callable[[Any, str, Any], None]] = None):
+        if dt <= 0:
+            raise ValueError(f"dt must be positive, got {dt}")
+        if substeps < 1:
+            raise ValueError(f"substeps must be >= 1, got {substeps}")
+
+        self.bodies: List[Any] = list(bodies) if bodies else []
+        self.dt = dt
+        self.substeps = substeps
+        self.time = 0.0
+        self.step_count = 0
+        self.timings = PhaseTimings()
+        self.on_reaction = on_reaction
+        self.last_reactions: List[Tuple[Any, str, Any]] = []
+
+        self.reactions: Optional[ReactionPipeline] = None
+        # Сигналы органов всех тел мира (см. systems.signals)
+        self.signals = SignalHub()
+        for body in self.bodies:
+            self._attach_signals(body)
+        if reactions:
+            self.enable_reactions()
+
+    # ---------- Тела ----------
+
+    def add_body(self, body: Any) -> int:
+        self.bodies.append(body)
+        self._attach_signals(body)
+        return len(self.bodies) - 1
+
+    def remove_body(self, body: Any) -> bool:
+        if body in self.bodies:
+            self.bodies.remove(body)
+            if self.reactions is not None:
+                self.reactions.forget(body)
+            hub = getattr(body, "signals", None)
+            if hub is not None and hub.parent is self.signals:
+                hub.parent = None
+            return True
+        return False
+
+    def _attach_signals(self, body: Any) -> None:
+        hub = getattr(body, "signals", None)
+        if hub is not None:
+            hub.parent = self.signals
+
+    # ---------- Реакции ----------
+
+    def enable_reactions(self, pipeline: Optional[ReactionPipeline] = None) -> None:
+        """Подключить конвейер реакций груди и матки (можно общий с консолью)."""
+        if pipeline is None:
+            pipeline = self.reactions or ReactionPipeline()
+        self.reactions = pipeline
+
+    def disable_reactions(self) -> None:
+        self.reactions = None
+
+    @property
+    def reactions_enabled(self) -> bool:
+        return self.reactions is not None
+
+    def _run_reactions(self) -> None:
+        collected = self.reactions.run(self.bodies)
+        self.last_reactions = collected
+        if self.on_reaction is not None:
+            for body, source, reaction in collected:
+                self.on_reaction(body, source, reaction)
+
+    # ---------- Шаги ----------
+
+    def _tick_organs(self, dt: float) -> None:
+        for body in self.bodies:
+            tick_organs = getattr(body, "tick_organs", None)
+            if tick_organs is not None:
+                tick_organs(dt)
+            else:
+                body.tick(dt)
+
+    def _flush_events(self) -> None:
+        """Разослать события, отложенные за шаг (EventBus в режиме queued)."""
+        for body in self.bodies:
+            bus = getattr(body, "event_bus", None)
+            if bus is not None and bus.pending:
+                bus.flush()
+
+    def _tick_magic(self) -> None:
+        for body in self.bodies:
+            magic_tick = getattr(body, "magic_tick", None)
+            if magic_tick is not None:
+                magic_tick()
+
+    def step(self, n: int = 1) -> None:
+        """Продвинуть мир на n фиксированных шагов."""
+        timings = self.timings
+        clock = time.perf_counter
+        sub_dt = self.dt / self.substeps
+
+        for _ in range(n):
+            t0 = clock()
+            for _ in range(self.substeps):
+                self._tick_organs(sub_dt)
+            t1 = clock()
+            if self.reactions is not None:
+                self._run_reactions()
+            self._flush_events()
+            t2 = clock()
+            self._tick_magic()
+            t3 = clock()
+
+            timings.organs += t1 - t0
+            timings.reactions += t2 - t1
+            timings.magic += t3 - t2
+            timings.steps += 1
+
+            self.step_count += 1
+            self.time = self.step_count * self.dt
+
+    def run_until(self, t: float) -> int:
+        """Шагать, пока время мира не достигнет t. Возвращает число шагов."""
+        remaining = (t - self.time) / self.dt
+        steps = max(0, math.floor(remaining + 1e-9))
+        self.step(steps)
+        return steps
+
+    def report(self) -> Dict[str, Any]:
+        """Состояние мира и тайминги фаз."""
+        data = {
+            "time": self.time,
+            "bodies": len(self.bodies),
+            "dt": self.dt,
+            "substeps": self.substeps,
+        }
+        data.update(self.timings.report())
+        dormancy = [b.dormancy for b in self.bodies if hasattr(b, "dormancy")]
+        if dormancy:
+            data["organ_ticks"] = sum(d.ticked for d in dormancy)
+            data["organ_ticks_skipped"] = sum(d.skipped for d in dormancy)
+        return data